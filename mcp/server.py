@@ -13,17 +13,39 @@ Authentication: Uses same API_KEY as the rest of the system.
 """
 
 import os
-import subprocess
-import json
+import gc
+import asyncio
 import re
-from datetime import datetime, timedelta
-from typing import Optional, List
+import shlex
+import fnmatch
+import time
+import functools
+import heapq
+import inspect
+import statistics
+from collections import defaultdict, deque
+from itertools import islice
+from contextlib import aclosing, asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Optional, List, NamedTuple
 from pathlib import Path
-
-from fastapi import FastAPI, HTTPException, Depends, Request
+from types import MappingProxyType
+
+import orjson
+import anyio
+import httpx
+import docker
+from docker.errors import DockerException
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
 from fastapi.security import APIKeyHeader
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel, Field
+from jsonschema import Draft202012Validator, validators
+from jsonschema.exceptions import ValidationError, best_match
+from neo4j import AsyncGraphDatabase, AsyncDriver, READ_ACCESS
+from neo4j.exceptions import Neo4jError, DriverError
 
 # =============================================================================
 # Configuration
@@ -56,11 +78,48 @@ BLOCKED_PATTERNS = [
     r"\.ssh",
 ]
 
+# Cypher write clauses rejected by query_neo4j (whole words, so `a.offset` or `delete_at` pass)
+WRITE_CYPHER_PATTERN = re.compile(r"\b(CREATE|MERGE|DELETE|SET|REMOVE|DROP)\b", re.IGNORECASE)
+
 # Docker services we can manage
-ALLOWED_SERVICES = {
+ALLOWED_SERVICES = frozenset({
     "frontend", "apis", "worker-main", "worker-sources",
     "neo4j", "nginx", "qdrant", "mcp-server"
-}
+})
+
+# Commands run_command accepts, by prefix
+ALLOWED_COMMAND_PREFIXES = (
+    "docker ps",
+    "docker logs",
+    "docker inspect",
+    "docker stats --no-stream",
+    "df -h",
+    "free",
+    "uptime",
+    "ps aux",
+    "netstat -tlnp",
+    "ls ",
+    "cat /proc/",
+    "wc -l",
+    "head ",
+    "tail ",
+)
+
+# Allow-lists compiled once - every file/command check is a single match
+_ALLOWED_PATH_PREFIXES = tuple(ALLOWED_PATHS)
+_BLOCKED_PATH_RE = re.compile("|".join(BLOCKED_PATTERNS))
+_ALLOWED_COMMAND_RE = re.compile("|".join(map(re.escape, ALLOWED_COMMAND_PREFIXES)))
+
+# docker compose project that defines every service
+COMPOSE_PATH = "/opt/saga-graph/victor_deployment"
+
+# Usernames and strategy/topic ids as they appear in API paths and file names.
+# The source string goes into pydantic and JSON Schema, where `$` is the very end of
+# the string; Python's `$` also matches before a trailing newline, so Python-side
+# checks use ID_PATTERN.fullmatch
+ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.@-]{0,127}$")
+# Query parameter carrying one of those ids - rejected with 422 before the handler runs
+IdParam = Annotated[str, Query(pattern=ID_PATTERN.pattern)]
 
 # Repos we can pull from
 REPO_PATHS = {
@@ -70,14 +129,63 @@ REPO_PATHS = {
     "victor_deployment": "/opt/saga-graph/victor_deployment",
 }
 
+# saga-be user data (strategies, conversations) as seen through the codebase mount
+USERS_ROOT = Path("/opt/saga-graph/saga-be/users")
+
+# Worker threads for blocking file/subprocess handlers
+THREADPOOL_SIZE = int(os.getenv("MCP_THREADPOOL_SIZE", "128"))
+
+# Internal backend API (reached over the compose network)
+API_BASE_URL = "http://apis:8000"
+
+# Neo4j connection (same database the apis/workers use)
+NEO4J_URI = os.getenv("NEO4J_URI", "bolt://neo4j:7687")
+NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
+NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "")
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
+NEO4J_POOL_SIZE = int(os.getenv("NEO4J_POOL_SIZE", "50"))
+# Pull the graph into Neo4j's page cache at startup so the first health check isn't cold
+NEO4J_WARMUP = os.getenv("NEO4J_WARMUP", "").lower() in ("1", "true", "yes")
+
 # =============================================================================
 # FastAPI App
 # =============================================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Everything allocated at import (tool schemas, validators, routes) lives for
+    # the whole process - keep it out of the cyclic GC's generational scans
+    gc.freeze()
+    # Sync handlers (the file tools) run on anyio's threadpool - its default of
+    # 40 threads is easy to exhaust when an agent fans out over slow disks
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # Index creation and warmup must not hold up startup (or fail it) when Neo4j is slow
+    neo4j_task = asyncio.create_task(prepare_neo4j())
+    yield
+    # Let any in-flight DDL/warmup query unwind before the driver closes under it
+    neo4j_task.cancel()
+    try:
+        await neo4j_task
+    except asyncio.CancelledError:
+        pass
+    await close_neo4j_driver()
+    await close_http_client()
+    close_docker_client()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (FastAPI's own class is deprecated)."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 app = FastAPI(
     title="Saga MCP Server",
     description="Remote development access for Claude Code",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -119,6 +227,22 @@ async def verify_api_key(
     return api_key
 
 
+def raw_json_get(path: str):
+    """
+    Register a GET route whose dict result is rendered straight to orjson bytes,
+    skipping FastAPI's jsonable_encoder walk - for the large graph payloads.
+    The function itself is returned undecorated, so MCP tool calls still get a dict.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def endpoint(*args, **kwargs):
+            return ORJSONResponse(await func(*args, **kwargs))
+
+        app.get(path, dependencies=[Depends(verify_api_key)])(endpoint)
+        return func
+    return decorator
+
+
 # =============================================================================
 # Security Helpers
 # =============================================================================
@@ -127,15 +251,14 @@ def is_path_allowed(path: str) -> bool:
     """Check if path is within allowed directories."""
     try:
         real_path = os.path.realpath(path)
-        return any(real_path.startswith(allowed) for allowed in ALLOWED_PATHS)
+        return real_path.startswith(_ALLOWED_PATH_PREFIXES)
     except Exception:
         return False
 
 
 def is_path_blocked(path: str) -> bool:
     """Check if path matches blocked patterns (sensitive files)."""
-    path_lower = path.lower()
-    return any(re.search(pattern, path_lower) for pattern in BLOCKED_PATTERNS)
+    return _BLOCKED_PATH_RE.search(path.lower()) is not None
 
 
 def validate_path(path: str) -> str:
@@ -147,38 +270,452 @@ def validate_path(path: str) -> str:
     return os.path.realpath(path)
 
 
-def run_command(cmd: str | list, timeout: int = 60, cwd: str = None) -> dict:
-    """Run a shell command and return result."""
+def validate_id(name: str, value: str) -> str:
+    """Reject usernames/ids that could escape an API path segment or a directory."""
+    if not ID_PATTERN.fullmatch(value):
+        raise HTTPException(400, f"Invalid {name}: {value!r}")
+    return value
+
+
+def user_dir(username: str) -> Path:
+    """Resolve a user's data directory, refusing anything outside USERS_ROOT."""
+    validate_id("username", username)
+    path = (USERS_ROOT / username).resolve()
+    try:
+        path.relative_to(USERS_ROOT.resolve())
+    except ValueError:
+        raise HTTPException(400, f"Invalid username: {username!r}")
+    return path
+
+
+_iso_now_cache = (0, "")
+
+
+def iso_now() -> str:
+    """UTC now as a naive ISO timestamp, formatted once per second and shared."""
+    global _iso_now_cache
+    second = int(time.time())
+    if _iso_now_cache[0] != second:
+        _iso_now_cache = (second, datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None).isoformat())
+    return _iso_now_cache[1]
+
+
+async def run_command(cmd: str | list, timeout: int = 60, cwd: str = None, env: dict = None) -> dict:
+    """Run a command without blocking the event loop and return result."""
     try:
         if isinstance(cmd, str):
-            result = subprocess.run(
+            proc = await asyncio.create_subprocess_shell(
                 cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=cwd
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                env=env
             )
         else:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=cwd
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                env=env
             )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            proc.kill()
+            await proc.wait()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return {"stdout": "", "stderr": "Command timed out", "returncode": -1, "success": False}
         return {
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "returncode": result.returncode,
-            "success": result.returncode == 0
+            "stdout": stdout.decode(errors="replace"),
+            "stderr": stderr.decode(errors="replace"),
+            "returncode": proc.returncode,
+            "success": proc.returncode == 0
         }
-    except subprocess.TimeoutExpired:
-        return {"stdout": "", "stderr": "Command timed out", "returncode": -1, "success": False}
     except Exception as e:
         return {"stdout": "", "stderr": str(e), "returncode": -1, "success": False}
 
 
+async def stream_command(cmd: list, timeout: int, cwd: str = None, status: dict = None):
+    """Yield a command's output line by line, stderr merged in, as it runs.
+
+    Once the stream ends the exit code is stored in status["returncode"] (-1 if
+    the command could not start or ran past `timeout`). Closing the generator
+    early kills the process.
+    """
+    status = status if status is not None else {}
+    status["returncode"] = -1
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=cwd,
+            limit=1024 * 1024  # build progress lines can be long
+        )
+    except OSError as e:
+        yield str(e)
+        return
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while True:
+            line = await asyncio.wait_for(proc.stdout.readline(), deadline - loop.time())
+            if not line:
+                break
+            yield line.decode(errors="replace").rstrip("\n")
+        status["returncode"] = await proc.wait()
+    except asyncio.TimeoutError:
+        yield "Command timed out"
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+
+# Read-only git calls skip the pager and the optional index lock, so
+# concurrent status/diff calls don't contend on .git/index.lock
+GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
+
+def git_command(repo_path: str, *args: str) -> list:
+    """argv for running git against repo_path without cd-ing there first."""
+    return ["git", "--no-pager", "-C", repo_path, *args]
+
+
+# =============================================================================
+# Neo4j - one driver per process, sessions borrow pooled connections
+# =============================================================================
+
+_neo4j_driver: Optional[AsyncDriver] = None
+
+
+def get_neo4j_driver() -> AsyncDriver:
+    """Return the shared async driver, creating it on first use."""
+    global _neo4j_driver
+    if _neo4j_driver is None:
+        _neo4j_driver = AsyncGraphDatabase.driver(
+            NEO4J_URI,
+            auth=(NEO4J_USER, NEO4J_PASSWORD),
+            max_connection_pool_size=NEO4J_POOL_SIZE,
+            connection_acquisition_timeout=30,
+        )
+    return _neo4j_driver
+
+
+async def close_neo4j_driver():
+    global _neo4j_driver
+    if _neo4j_driver is not None:
+        await _neo4j_driver.close()
+        _neo4j_driver = None
+
+
+def _to_plain(value):
+    """Convert neo4j temporal values (DateTime, Date, Duration) to ISO strings."""
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_plain(v) for v in value]
+    if hasattr(value, "iso_format"):
+        return value.iso_format()
+    return value
+
+
+# Indexes the graph tools' filters rely on. All idempotent - applied at startup
+NEO4J_SCHEMA = (
+    # Point lookups (topic_details, topic_articles, hide_article) seek instead of scanning
+    "CREATE CONSTRAINT topic_id IF NOT EXISTS FOR (t:Topic) REQUIRE t.id IS UNIQUE",
+    "CREATE CONSTRAINT article_id IF NOT EXISTS FOR (a:Article) REQUIRE a.id IS UNIQUE",
+    # Time-window filters (recent_articles, graph_health activity, stale analysis)
+    "CREATE RANGE INDEX article_created_at IF NOT EXISTS FOR (a:Article) ON (a.created_at)",
+    "CREATE RANGE INDEX topic_last_analyzed IF NOT EXISTS FOR (t:Topic) ON (t.last_analyzed)",
+    # ingestion_stats/source_stats read source straight off the window's index entries
+    "CREATE RANGE INDEX article_created_at_source IF NOT EXISTS FOR (a:Article) ON (a.created_at, a.source)",
+    # search_articles' since filter and published_at ordering
+    "CREATE RANGE INDEX article_published_at IF NOT EXISTS FOR (a:Article) ON (a.published_at)",
+    # Hidden-article filtering (topic_articles, search)
+    "CREATE RANGE INDEX article_status IF NOT EXISTS FOR (a:Article) ON (a.status)",
+    # Keyword search (search_articles)
+    "CREATE FULLTEXT INDEX article_fts IF NOT EXISTS FOR (a:Article) ON EACH [a.title, a.content]",
+)
+
+
+async def ensure_neo4j_schema():
+    """Apply NEO4J_SCHEMA; a statement that fails (e.g. duplicate ids) is reported and skipped."""
+    for statement in NEO4J_SCHEMA:
+        try:
+            await run_cypher(statement)
+        except Neo4jError as e:
+            print(f"Neo4j schema statement failed: {statement}: {e}", flush=True)
+        except DriverError as e:
+            print(f"Neo4j unavailable, schema not applied: {e}", flush=True)
+            return
+
+
+# Fallback warmup without APOC: touch the nodes, properties and relationships the
+# graph tools scan (count(property) reads the records; a bare count(n) would not)
+NEO4J_WARMUP_QUERIES = (
+    "MATCH (a:Article) RETURN count(a.created_at)",
+    "MATCH (t:Topic) RETURN count(t.last_analyzed)",
+    "MATCH (:Article)-[r:ABOUT]->(:Topic) RETURN count(r.importance_risk)",
+)
+
+
+async def warm_up_neo4j():
+    """Load the graph into the page cache - apoc.warmup.run if APOC is installed, else targeted scans."""
+    try:
+        await run_cypher("CALL apoc.warmup.run(true, true, true)")
+        return
+    except Neo4jError:
+        pass  # No APOC (or warmup disabled there) - fall back
+    for query in NEO4J_WARMUP_QUERIES:
+        await run_cypher(query, read_only=True)
+
+
+async def prepare_neo4j():
+    """Startup work against Neo4j: schema first, then the optional warmup."""
+    await ensure_neo4j_schema()
+    if NEO4J_WARMUP:
+        try:
+            await warm_up_neo4j()
+        except (Neo4jError, DriverError) as e:
+            print(f"Neo4j warmup failed: {e}", flush=True)
+
+
+async def _collect_records(tx, query: str, params: dict) -> list:
+    result = await tx.run(query, params)
+    return await result.data()
+
+
+async def stream_cypher(query: str, params: Optional[dict] = None):
+    """Yield a query's records one at a time as Neo4j streams them, instead of collecting a list."""
+    async with get_neo4j_driver().session(database=NEO4J_DATABASE, default_access_mode=READ_ACCESS) as session:
+        result = await session.run(query, params or {})
+        async for record in result:
+            yield _to_plain(record.data())
+
+
+async def run_cypher(query: str, params: Optional[dict] = None, read_only: bool = False) -> list:
+    """
+    Run a Cypher query on a pooled session and return records as dicts.
+    read_only runs it in a read transaction, so the server rejects any write.
+    """
+    async with get_neo4j_driver().session(database=NEO4J_DATABASE) as session:
+        if read_only:
+            records = await session.execute_read(_collect_records, query, params or {})
+        else:
+            result = await session.run(query, params or {})
+            records = await result.data()
+    return _to_plain(records)
+
+
+# =============================================================================
+# Internal HTTP - one keep-alive client for calls to the backend API
+# =============================================================================
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared API client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            timeout=10,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def fetch_api(path: str, timeout: float = 10) -> dict:
+    """GET a backend API path and return the body text (like `curl -s`)."""
+    try:
+        response = await get_http_client().get(path, timeout=timeout)
+    except httpx.HTTPError as e:
+        return {"text": "", "error": str(e) or type(e).__name__, "status_code": None, "success": False}
+    return {"text": response.text, "error": "", "status_code": response.status_code, "success": True}
+
+
+# =============================================================================
+# Docker Engine API - talk to the daemon socket directly instead of forking the CLI
+# =============================================================================
+
+_docker_client: Optional[docker.DockerClient] = None
+
+
+def get_docker_client() -> docker.DockerClient:
+    """Return the shared Docker client, creating it on first use."""
+    global _docker_client
+    if _docker_client is None:
+        _docker_client = docker.from_env()
+    return _docker_client
+
+
+def close_docker_client():
+    global _docker_client
+    if _docker_client is not None:
+        _docker_client.close()
+        _docker_client = None
+
+
+def _exec_graph_functions(argv: list, detach: bool) -> dict:
+    """Create and start the exec in apis, collecting its output unless detached."""
+    api = get_docker_client().api
+    exec_id = api.exec_create("apis", argv, workdir="/app/graph-functions", stdout=True, stderr=True)["Id"]
+    if detach:
+        api.exec_start(exec_id, detach=True)
+        return {"stdout": "", "stderr": "", "returncode": 0, "success": True}
+    stdout, stderr = api.exec_start(exec_id, demux=True)
+    returncode = api.exec_inspect(exec_id)["ExitCode"]
+    return {
+        "stdout": (stdout or b"").decode(errors="replace"),
+        "stderr": (stderr or b"").decode(errors="replace"),
+        "returncode": returncode,
+        "success": returncode == 0
+    }
+
+
+async def run_graph_functions(script: str, *args: str, timeout: int = 30, detach: bool = False) -> dict:
+    """
+    Run a Python snippet inside the apis container's graph-functions checkout, over
+    the daemon socket rather than a `docker exec` CLI process. Values go in as
+    sys.argv, never spliced into the source. Returns run_command's result shape.
+    """
+    try:
+        return await asyncio.wait_for(
+            asyncio.to_thread(_exec_graph_functions, ["python", "-c", script, *args], detach), timeout
+        )
+    except asyncio.TimeoutError:
+        return {"stdout": "", "stderr": "Command timed out", "returncode": -1, "success": False}
+    except DockerException as e:
+        return {"stdout": "", "stderr": str(e), "returncode": -1, "success": False}
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h|d)")
+_DURATION_SECONDS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_since(value: Optional[str]) -> Optional[int]:
+    """
+    Translate a `docker logs --since` value into a unix timestamp.
+    Accepts durations ('1h', '30m', '1h30m') and ISO dates ('2024-01-01').
+    """
+    if not value:
+        return None
+
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(number + unit for number, unit in parts) == value:
+        seconds = sum(float(number) * _DURATION_SECONDS[unit] for number, unit in parts)
+        return int(time.time() - seconds)
+
+    try:
+        since = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(400, f"Invalid since value: {value}")
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return int(since.timestamp())
+
+
+def iter_log_lines(chunks):
+    """Reassemble text lines from the daemon's demultiplexed log frames."""
+    buffer = b""
+    for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace")
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace")
+
+
+# =============================================================================
+# Result caching - status endpoints get polled far faster than state changes
+# =============================================================================
+
+_TTL_CACHES = []
+
+
+def ttl_cache(seconds: float, maxsize: int = 256):
+    """
+    Cache a coroutine's result per argument set for `seconds`; concurrent misses
+    on the same arguments share one call. Failed and not-found results ({"success":
+    False} or an "error" key) are never cached, so a database blip or a topic
+    created just after a miss doesn't stick for the whole TTL. Every caller gets
+    the same cached object - callers must build new dicts/lists, not mutate it.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        entries = {}  # key -> (cached_at, value), oldest first
+        locks = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.items())
+
+            entry = entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < seconds:
+                return entry[1]
+            lock = locks.setdefault(key, asyncio.Lock())
+            try:
+                async with lock:
+                    entry = entries.get(key)
+                    if entry is not None and time.monotonic() - entry[0] < seconds:
+                        return entry[1]
+                    value = await func(*args, **kwargs)
+                    if not (isinstance(value, dict) and ("error" in value or value.get("success") is False)):
+                        entries.pop(key, None)
+                        entries[key] = (time.monotonic(), value)
+                        if len(entries) > maxsize:
+                            oldest = next(iter(entries))
+                            del entries[oldest]
+                            locks.pop(oldest, None)
+                    return value
+            finally:
+                # Only keys with a cached entry keep their lock - uncached results for
+                # caller-supplied ids (article_detail misses) would otherwise pile up
+                if key not in entries and locks.get(key) is lock:
+                    del locks[key]
+
+        def cache_clear():
+            entries.clear()
+            locks.clear()
+
+        wrapper.cache_clear = cache_clear
+        _TTL_CACHES.append(wrapper)
+        return wrapper
+    return decorator
+
+
+def clear_ttl_caches():
+    """Drop every cached result - called after anything that writes to the graph."""
+    for cached in _TTL_CACHES:
+        cached.cache_clear()
+
+
+# Agents repeat the same search patterns in bursts - compile each one once
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_glob(pattern: str) -> re.Pattern:
+    return re.compile(fnmatch.translate(pattern))
+
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -200,6 +737,7 @@ class ReadFileRequest(BaseModel):
     path: str = Field(..., description="Absolute path to file")
     lines: Optional[int] = Field(None, description="Limit to last N lines")
     offset: Optional[int] = Field(None, description="Start from line N")
+    byte_offset: Optional[int] = Field(None, description="Start from byte N (for paging large files)", ge=0)
 
 
 class SearchFilesRequest(BaseModel):
@@ -225,6 +763,7 @@ class DeployServiceRequest(BaseModel):
     service: str = Field(..., description="Service to deploy")
     pull: bool = Field(True, description="Git pull before build")
     no_cache: bool = Field(True, description="Build without cache")
+    stream: bool = Field(False, description="Stream output as NDJSON while the deploy runs")
 
 
 class RestartServiceRequest(BaseModel):
@@ -246,27 +785,27 @@ class CommandRequest(BaseModel):
 
 
 class TopicDetailsRequest(BaseModel):
-    topic_id: str = Field(..., description="Topic ID (e.g., 'us_macro', 'nordic_banks')")
+    topic_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Topic ID (e.g., 'us_macro', 'nordic_banks')")
 
 
 class TopicArticlesRequest(BaseModel):
-    topic_id: str = Field(..., description="Topic ID")
+    topic_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Topic ID")
     limit: int = Field(20, description="Max articles to return", ge=1, le=100)
     perspective: Optional[str] = Field(None, description="Filter by perspective (risk, opportunity, trend, catalyst)")
 
 
 class StrategyRequest(BaseModel):
-    username: str = Field(..., description="Username")
-    strategy_id: Optional[str] = Field(None, description="Strategy ID (optional, for specific strategy)")
+    username: str = Field(..., pattern=ID_PATTERN.pattern, description="Username")
+    strategy_id: Optional[str] = Field(None, pattern=ID_PATTERN.pattern, description="Strategy ID (optional, for specific strategy)")
 
 
 class TriggerAnalysisRequest(BaseModel):
-    topic_id: str = Field(..., description="Topic ID to analyze")
+    topic_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Topic ID to analyze")
     force: bool = Field(False, description="Force re-analysis even if recent")
 
 
 class HideArticleRequest(BaseModel):
-    article_id: str = Field(..., description="Article ID to hide")
+    article_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Article ID to hide")
     reason: str = Field(..., description="Reason for hiding (for audit log)")
 
 
@@ -275,54 +814,54 @@ class HideArticleRequest(BaseModel):
 # =============================================================================
 
 class StrategyDetailRequest(BaseModel):
-    strategy_id: str = Field(..., description="Strategy ID to get details for")
-    username: str = Field(..., description="Username who owns the strategy")
+    strategy_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Strategy ID to get details for")
+    username: str = Field(..., pattern=ID_PATTERN.pattern, description="Username who owns the strategy")
 
 
 class ListStrategyFilesRequest(BaseModel):
-    username: str = Field(..., description="Username to list strategy files for")
+    username: str = Field(..., pattern=ID_PATTERN.pattern, description="Username to list strategy files for")
 
 
 class RawFileRequest(BaseModel):
-    username: str = Field(..., description="Username")
+    username: str = Field(..., pattern=ID_PATTERN.pattern, description="Username")
     filename: str = Field(..., description="Filename (e.g., 'strategy_123.json' or 'users.json')")
 
 
 class TopicAnalysisFullRequest(BaseModel):
-    topic_id: str = Field(..., description="Topic ID")
+    topic_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Topic ID")
 
 
 class TopicRelationshipsRequest(BaseModel):
-    topic_id: str = Field(..., description="Topic ID")
+    topic_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Topic ID")
 
 
 class TopicInfluenceMapRequest(BaseModel):
-    topic_id: str = Field(..., description="Topic ID to map")
+    topic_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Topic ID to map")
     depth: int = Field(2, description="How many hops to traverse", ge=1, le=4)
 
 
 class TopicHistoryRequest(BaseModel):
-    topic_id: str = Field(..., description="Topic ID")
+    topic_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Topic ID")
     days: int = Field(30, description="Days of history to fetch")
 
 
 class ExplorationPathsRequest(BaseModel):
-    strategy_id: str = Field(..., description="Strategy ID")
-    username: str = Field(..., description="Username")
+    strategy_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Strategy ID")
+    username: str = Field(..., pattern=ID_PATTERN.pattern, description="Username")
 
 
 class StrategyHealthCheckRequest(BaseModel):
-    strategy_id: str = Field(..., description="Strategy ID")
-    username: str = Field(..., description="Username")
+    strategy_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Strategy ID")
+    username: str = Field(..., pattern=ID_PATTERN.pattern, description="Username")
 
 
 class ArticleDetailRequest(BaseModel):
-    article_id: str = Field(..., description="Article ID")
+    article_id: str = Field(..., pattern=ID_PATTERN.pattern, description="Article ID")
 
 
 class SearchArticlesRequest(BaseModel):
     query: str = Field(..., description="Search query")
-    topic_id: Optional[str] = Field(None, description="Filter by topic")
+    topic_id: Optional[str] = Field(None, pattern=ID_PATTERN.pattern, description="Filter by topic")
     since: Optional[str] = Field(None, description="ISO date string, e.g., 2024-01-01")
     limit: int = Field(20, description="Max results", ge=1, le=100)
 
@@ -366,7 +905,7 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "topic_id": {"type": "string", "description": "The topic ID (e.g., 'fed_policy', 'eurusd')"}
+                "topic_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "The topic ID (e.g., 'fed_policy', 'eurusd')"}
             },
             "required": ["topic_id"]
         }
@@ -377,7 +916,7 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "topic_id": {"type": "string", "description": "The topic ID"},
+                "topic_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "The topic ID"},
                 "limit": {"type": "integer", "description": "Max articles to return", "default": 20}
             },
             "required": ["topic_id"]
@@ -439,7 +978,7 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "username": {"type": "string", "description": "Username to get strategies for"}
+                "username": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Username to get strategies for"}
             },
             "required": ["username"]
         }
@@ -450,7 +989,8 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "topic_id": {"type": "string", "description": "Topic ID to analyze"},
+                "topic_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Topic ID to analyze"},
+                "force": {"type": "boolean", "description": "Force re-analysis even if recent", "default": False},
                 "confirm": {"type": "boolean", "description": "Must be true to execute"}
             },
             "required": ["topic_id", "confirm"]
@@ -482,7 +1022,7 @@ MCP_TOOLS = [
             "type": "object",
             "properties": {
                 "path": {"type": "string", "description": "File path to read"},
-                "lines": {"type": "integer", "description": "Max lines to return (default 500)"}
+                "lines": {"type": "integer", "description": "Max lines to return", "default": 500}
             },
             "required": ["path"]
         }
@@ -557,7 +1097,8 @@ MCP_TOOLS = [
             "type": "object",
             "properties": {
                 "service": {"type": "string", "description": "Service name"},
-                "lines": {"type": "integer", "description": "Number of lines", "default": 50}
+                "lines": {"type": "integer", "description": "Number of lines", "default": 50,
+                          "minimum": 1, "maximum": 10000}
             },
             "required": ["service"]
         }
@@ -605,8 +1146,8 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "username": {"type": "string", "description": "Username who owns the strategy"},
-                "strategy_id": {"type": "string", "description": "Strategy ID"}
+                "username": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Username who owns the strategy"},
+                "strategy_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Strategy ID"}
             },
             "required": ["username", "strategy_id"]
         }
@@ -617,7 +1158,7 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "username": {"type": "string", "description": "Username to list strategies for"}
+                "username": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Username to list strategies for"}
             },
             "required": ["username"]
         }
@@ -628,8 +1169,8 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "username": {"type": "string", "description": "Username"},
-                "strategy_id": {"type": "string", "description": "Strategy ID (will read strategy_{id}.json)"}
+                "username": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Username"},
+                "strategy_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Strategy ID (will read strategy_{id}.json)"}
             },
             "required": ["username", "strategy_id"]
         }
@@ -640,8 +1181,8 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "username": {"type": "string", "description": "Username"},
-                "strategy_id": {"type": "string", "description": "Strategy ID"},
+                "username": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Username"},
+                "strategy_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Strategy ID"},
                 "limit": {"type": "integer", "description": "Max conversations to return", "default": 10}
             },
             "required": ["username", "strategy_id"]
@@ -654,7 +1195,7 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "topic_id": {"type": "string", "description": "Topic ID"}
+                "topic_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Topic ID"}
             },
             "required": ["topic_id"]
         }
@@ -665,7 +1206,7 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "topic_id": {"type": "string", "description": "Topic ID"}
+                "topic_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Topic ID"}
             },
             "required": ["topic_id"]
         }
@@ -676,7 +1217,7 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "topic_id": {"type": "string", "description": "Topic ID"},
+                "topic_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Topic ID"},
                 "depth": {"type": "integer", "description": "How many hops to traverse (1-4)", "default": 2}
             },
             "required": ["topic_id"]
@@ -700,8 +1241,8 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "username": {"type": "string", "description": "Username"},
-                "strategy_id": {"type": "string", "description": "Strategy ID"}
+                "username": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Username"},
+                "strategy_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Strategy ID"}
             },
             "required": ["username", "strategy_id"]
         }
@@ -712,8 +1253,8 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "username": {"type": "string", "description": "Username"},
-                "strategy_id": {"type": "string", "description": "Strategy ID"}
+                "username": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Username"},
+                "strategy_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Strategy ID"}
             },
             "required": ["username", "strategy_id"]
         }
@@ -724,8 +1265,8 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "username": {"type": "string", "description": "Username"},
-                "strategy_id": {"type": "string", "description": "Strategy ID"},
+                "username": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Username"},
+                "strategy_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Strategy ID"},
                 "agent": {"type": "string", "description": "Agent name (optional - returns all if not specified)", "enum": ["risk_assessor", "opportunity_finder", "exploration", "strategy_writer", "topic_mapper"]}
             },
             "required": ["username", "strategy_id"]
@@ -779,7 +1320,7 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "article_id": {"type": "string", "description": "Article ID"}
+                "article_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Article ID"}
             },
             "required": ["article_id"]
         }
@@ -791,7 +1332,7 @@ MCP_TOOLS = [
             "type": "object",
             "properties": {
                 "query": {"type": "string", "description": "Search query"},
-                "topic_id": {"type": "string", "description": "Filter by topic (optional)"},
+                "topic_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Filter by topic (optional)"},
                 "since": {"type": "string", "description": "ISO date (e.g., 2024-01-01)"},
                 "limit": {"type": "integer", "description": "Max results", "default": 20}
             },
@@ -816,8 +1357,8 @@ MCP_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "username": {"type": "string", "description": "Username"},
-                "strategy_id": {"type": "string", "description": "Strategy ID"}
+                "username": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Username"},
+                "strategy_id": {"type": "string", "pattern": ID_PATTERN.pattern, "description": "Strategy ID"}
             },
             "required": ["username", "strategy_id"]
         }
@@ -845,6 +1386,98 @@ MCP_TOOLS = [
 ]
 
 
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+MCP_TOOLS = _freeze(MCP_TOOLS)
+
+# tools/list never changes - encode the result once, splice in the id per request
+_TOOLS_LIST_RESULT = (
+    b',"result":{"tools":' + orjson.dumps(MCP_TOOLS, default=dict) + b'}}'
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _schema_regex(pattern: str) -> re.Pattern:
+    """Compile a JSON Schema pattern with ECMA-262's `$`: end of string, never before a final newline."""
+    if pattern.endswith("$") and not pattern.endswith(r"\$"):
+        pattern = pattern[:-1] + r"\Z"
+    return re.compile(pattern)
+
+
+def _schema_pattern(validator, pattern, instance, schema):
+    if validator.is_type(instance, "string") and not _schema_regex(pattern).search(instance):
+        yield ValidationError(f"{instance!r} does not match {pattern!r}")
+
+
+# jsonschema checks "pattern" with Python's re.search, whose `$` lets "id\n" through
+ToolArgsValidator = validators.extend(Draft202012Validator, {"pattern": _schema_pattern})
+
+# Compiled once at import - building a validator per call is the expensive part
+TOOL_VALIDATORS = {
+    tool["name"]: ToolArgsValidator(tool["inputSchema"])
+    for tool in MCP_TOOLS
+}
+
+
+class _ArgsSpec(NamedTuple):
+    """Argument names and their schema defaults for one tool."""
+    defaults: tuple
+
+    def coerce(self, arguments: dict) -> dict:
+        return {name: arguments.get(name, default) for name, default in self.defaults}
+
+
+# Defaults live in the inputSchema only - the dispatcher never hardcodes them
+TOOL_ARG_SPECS = {
+    tool["name"]: _ArgsSpec(tuple(
+        (name, prop.get("default"))
+        for name, prop in tool["inputSchema"]["properties"].items()
+    ))
+    for tool in MCP_TOOLS
+}
+
+
+# Pre-encoded JSON-RPC error bodies - only the id (and message) get spliced in
+_AUTH_ERROR_BODY = (
+    b'{"jsonrpc":"2.0","id":%s,"error":{"code":-32001,'
+    b'"message":"Authentication required. Provide X-API-Key header."}}'
+)
+_ERROR_BODY = b'{"jsonrpc":"2.0","id":%s,"error":{"code":%d,"message":%s}}'
+
+
+def jsonrpc_error(request_id: Optional[int], code: int, message: str) -> Response:
+    """Build a JSON-RPC error response from the pre-encoded template."""
+    body = _ERROR_BODY % (orjson.dumps(request_id), code, orjson.dumps(message))
+    return Response(content=body, media_type="application/json")
+
+
+# Tool results: indented for readability in the client
+_RESULT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(value):
+    """orjson fallback - only reached for types its C encoder doesn't know."""
+    if hasattr(value, "iso_format"):  # neo4j.time DateTime/Date/Duration
+        return value.iso_format()
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)  # Decimal, Path and anything else exotic
+
+
+def encode_tool_result(result) -> bytes:
+    """Encode a tool result the way it is shown in the MCP text block."""
+    return orjson.dumps(result, option=_RESULT_JSON_OPTIONS, default=_json_default)
+
+
 class MCPRequest(BaseModel):
     jsonrpc: str = "2.0"
     id: Optional[int] = None
@@ -852,6 +1485,60 @@ class MCPRequest(BaseModel):
     params: Optional[dict] = None
 
 
+async def _mcp_initialize(request: MCPRequest):
+    return {
+        "jsonrpc": "2.0",
+        "id": request.id,
+        "result": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {
+                "tools": {"listChanged": False}
+            },
+            "serverInfo": {
+                "name": "saga-graph-mcp",
+                "version": "2.0.0"
+            }
+        }
+    }
+
+
+async def _mcp_initialized(request: MCPRequest):
+    # Client acknowledges initialization - no response needed
+    return {"jsonrpc": "2.0", "id": request.id, "result": {}}
+
+
+async def _mcp_tools_list(request: MCPRequest):
+    return Response(
+        content=b'{"jsonrpc":"2.0","id":' + orjson.dumps(request.id) + _TOOLS_LIST_RESULT,
+        media_type="application/json"
+    )
+
+
+async def _mcp_tools_call(request: MCPRequest):
+    params = request.params or {}
+    tool_name = params.get("name")
+    arguments = params.get("arguments") or {}
+
+    result = await execute_mcp_tool(tool_name, arguments)
+
+    return {
+        "jsonrpc": "2.0",
+        "id": request.id,
+        "result": {
+            "content": [{"type": "text", "text": encode_tool_result(result).decode()}]
+        }
+    }
+
+
+# JSON-RPC method -> handler
+MCP_METHODS = {
+    "initialize": _mcp_initialize,
+    "notifications/initialized": _mcp_initialized,
+    "tools/list": _mcp_tools_list,
+    "tools/call": _mcp_tools_call,
+}
+
+
 @app.post("/mcp")
 @app.post("/mcp/")
 async def mcp_jsonrpc(request: MCPRequest, raw_request: Request):
@@ -869,379 +1556,172 @@ async def mcp_jsonrpc(request: MCPRequest, raw_request: Request):
     # Allow initialize without auth for discovery
     if request.method != "initialize":
         if not api_key or api_key not in VALID_API_KEYS:
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "error": {
-                    "code": -32001,
-                    "message": "Authentication required. Provide X-API-Key header."
-                }
-            }
+            return Response(
+                content=_AUTH_ERROR_BODY % orjson.dumps(request.id),
+                media_type="application/json"
+            )
 
-    try:
-        if request.method == "initialize":
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {"listChanged": False}
-                    },
-                    "serverInfo": {
-                        "name": "saga-graph-mcp",
-                        "version": "2.0.0"
-                    }
-                }
-            }
+    handler = MCP_METHODS.get(request.method)
+    if handler is None:
+        return jsonrpc_error(request.id, -32601, f"Method not found: {request.method}")
 
-        elif request.method == "notifications/initialized":
-            # Client acknowledges initialization - no response needed
-            return {"jsonrpc": "2.0", "id": request.id, "result": {}}
+    try:
+        return await handler(request)
+    except Exception as e:
+        return jsonrpc_error(request.id, -32603, str(e))
 
-        elif request.method == "tools/list":
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {
-                    "tools": MCP_TOOLS
-                }
-            }
 
-        elif request.method == "tools/call":
-            params = request.params or {}
-            tool_name = params.get("name")
-            arguments = params.get("arguments", {})
+# In-flight calls for uncached no-argument read tools, keyed by tool name
+_INFLIGHT: dict[str, asyncio.Task] = {}
 
-            result = await execute_mcp_tool(tool_name, arguments)
 
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {
-                    "content": [{"type": "text", "text": json.dumps(result, indent=2, default=str)}]
-                }
-            }
+def _finish_inflight(key: str, task: asyncio.Task):
+    if _INFLIGHT.get(key) is task:
+        del _INFLIGHT[key]
+    if not task.cancelled():
+        task.exception()  # Mark retrieved so asyncio doesn't warn when every caller left
 
-        else:
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "error": {
-                    "code": -32601,
-                    "message": f"Method not found: {request.method}"
-                }
-            }
 
-    except Exception as e:
-        return {
-            "jsonrpc": "2.0",
-            "id": request.id,
-            "error": {
-                "code": -32603,
-                "message": str(e)
-            }
-        }
+async def singleflight(key: str, coro_factory):
+    """
+    Coalesce concurrent identical calls: the first caller starts coro_factory()
+    as its own task and everyone arriving while it is in flight awaits that task.
+    Each caller awaits through a shield, so one caller being cancelled (e.g. its
+    client disconnecting) neither stops the shared call nor fails the others.
+    """
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(coro_factory())
+        _INFLIGHT[key] = task
+        task.add_done_callback(functools.partial(_finish_inflight, key))
+    return await asyncio.shield(task)
 
 
 async def execute_mcp_tool(tool_name: str, arguments: dict) -> dict:
     """Execute an MCP tool and return results."""
 
-    if tool_name == "graph_health":
-        response = await graph_health()
-        return response
-
-    elif tool_name == "graph_stats":
-        response = await graph_stats()
-        return response
+    validator = TOOL_VALIDATORS.get(tool_name)
+    if validator is None:
+        raise ValueError(f"Unknown tool: {tool_name}")
 
-    elif tool_name == "all_topics":
-        response = await all_topics()
-        return response
+    error = best_match(validator.iter_errors(arguments))
+    if error is not None:
+        raise ValueError(f"Invalid arguments for {tool_name}: {error.message}")
 
-    elif tool_name == "topic_details":
-        req = TopicDetailsRequest(topic_id=arguments.get("topic_id"))
-        response = await topic_details(req)
-        return response
+    args = TOOL_ARG_SPECS[tool_name].coerce(arguments)
 
-    elif tool_name == "topic_articles":
-        req = TopicArticlesRequest(
-            topic_id=arguments.get("topic_id"),
-            limit=arguments.get("limit", 20)
-        )
-        response = await topic_articles(req)
-        return response
+    return await TOOL_HANDLERS[tool_name](args)
 
-    elif tool_name == "recent_articles":
-        response = await recent_articles(
-            limit=arguments.get("limit", 20),
-            hours=arguments.get("hours", 24)
-        )
-        return response
 
-    elif tool_name == "graph_query":
-        response = await graph_query(
-            query_name=arguments.get("query_name"),
-            limit=arguments.get("limit")
-        )
-        return response
-
-    elif tool_name == "query_neo4j":
-        req = QueryRequest(query=arguments.get("query"))
-        response = await query_neo4j(req)
-        return response
-
-    elif tool_name == "list_users":
-        response = await list_users()
-        return response
-
-    elif tool_name == "user_strategies":
-        req = StrategyRequest(username=arguments.get("username"))
-        response = await user_strategies(req)
-        return response
-
-    elif tool_name == "trigger_analysis":
-        if not arguments.get("confirm"):
-            return {"error": "Must set confirm=true to trigger analysis"}
-        req = TriggerAnalysisRequest(
-            topic_id=arguments.get("topic_id"),
-            force=arguments.get("force", False)
-        )
-        response = await trigger_analysis(req)
-        return response
+async def _restart_service_tool(args: dict) -> dict:
+    if not args["confirm"]:
+        return {"error": "Must set confirm=true to restart service"}
+    return await restart_service(RestartServiceRequest(service=args["service"]))
 
-    elif tool_name == "system_health":
-        response = await system_health()
-        return response
 
-    elif tool_name == "docker_status":
-        response = await docker_status()
-        return response
+async def _trigger_analysis_tool(args: dict) -> dict:
+    if not args["confirm"]:
+        return {"error": "Must set confirm=true to trigger analysis"}
+    return await trigger_topic_analysis(
+        TriggerAnalysisRequest(topic_id=args["topic_id"], force=args["force"])
+    )
 
-    # === FILE TOOLS ===
-    elif tool_name == "read_file":
-        req = ReadFileRequest(
-            path=arguments.get("path"),
-            lines=arguments.get("lines", 500)
-        )
-        response = await read_file(req)
-        return response
 
-    elif tool_name == "search_files":
-        req = SearchFilesRequest(
-            directory=arguments.get("directory"),
-            pattern=arguments.get("pattern")
-        )
-        response = await search_files(req)
-        return response
-
-    elif tool_name == "grep":
-        req = GrepRequest(
-            pattern=arguments.get("pattern"),
-            path=arguments.get("path"),
-            recursive=arguments.get("recursive", True)
-        )
-        response = await grep(req)
-        return response
+# Tool name -> handler taking the coerced args dict. Names resolve at call time,
+# so the endpoint functions below can be referenced before they are defined.
+TOOL_HANDLERS = {
+    "graph_health": lambda args: graph_health(),
+    "graph_stats": lambda args: graph_stats(),
+    "all_topics": lambda args: all_topics(),
+    "topic_details": lambda args: topic_details(TopicDetailsRequest(topic_id=args["topic_id"])),
+    "topic_articles": lambda args: topic_articles(
+        TopicArticlesRequest(topic_id=args["topic_id"], limit=args["limit"])
+    ),
+    "recent_articles": lambda args: recent_articles(limit=args["limit"], hours=args["hours"]),
+    "graph_query": lambda args: graph_query(query_name=args["query_name"], limit=args["limit"]),
+    "query_neo4j": lambda args: query_neo4j(CypherRequest(query=args["query"])),
+    "list_users": lambda args: singleflight("list_users", list_users),
+    "user_strategies": lambda args: user_strategies(StrategyRequest(username=args["username"])),
+    "trigger_analysis": _trigger_analysis_tool,
+    "system_health": lambda args: singleflight("system_health", system_health),
+    "docker_status": lambda args: docker_status(),
 
-    elif tool_name == "list_directory":
-        req = ListDirRequest(
-            path=arguments.get("path"),
-            recursive=arguments.get("recursive", False)
-        )
-        response = await list_directory(req)
-        return response
+    # === FILE TOOLS ===
+    # read_file, search_files and list_directory are plain `def` - run them off the loop
+    "read_file": lambda args: run_in_threadpool(
+        read_file, ReadFileRequest(path=args["path"], lines=args["lines"])
+    ),
+    "search_files": lambda args: run_in_threadpool(
+        search_files, SearchFilesRequest(path=args["directory"], pattern=args["pattern"])
+    ),
+    "grep": lambda args: grep(GrepRequest(pattern=args["pattern"], path=args["path"])),
+    "list_directory": lambda args: run_in_threadpool(
+        list_directory, ListDirectoryRequest(path=args["path"], recursive=args["recursive"])
+    ),
 
     # === LOG TOOLS ===
-    elif tool_name == "read_log":
-        req = LogRequest(
-            service=arguments.get("service"),
-            lines=arguments.get("lines", 100)
-        )
-        response = await read_log(req)
-        return response
-
-    elif tool_name == "search_logs":
-        req = SearchLogRequest(
-            service=arguments.get("service"),
-            pattern=arguments.get("pattern"),
-            lines=arguments.get("lines", 1000)
-        )
-        response = await search_logs(req)
-        return response
-
-    elif tool_name == "tail_logs":
-        response = await tail_logs(
-            service=arguments.get("service"),
-            lines=arguments.get("lines", 50)
-        )
-        return response
+    "read_log": lambda args: read_log(ReadLogRequest(service=args["service"], lines=args["lines"])),
+    "search_logs": lambda args: search_logs(
+        SearchLogsRequest(service=args["service"], pattern=args["pattern"], lines=args["lines"])
+    ),
+    "tail_logs": lambda args: tail_logs(service=args["service"], lines=args["lines"]),
 
     # === DEPLOYMENT TOOLS ===
-    elif tool_name == "restart_service":
-        if not arguments.get("confirm"):
-            return {"error": "Must set confirm=true to restart service"}
-        req = RestartRequest(service=arguments.get("service"))
-        response = await restart_service(req)
-        return response
-
-    elif tool_name == "git_status":
-        req = GitRequest(
-            repo=arguments.get("repo"),
-            command="status"
-        )
-        response = await git(req)
-        return response
-
-    elif tool_name == "daily_stats":
-        response = await daily_stats()
-        return response
-
-    # =============================================================================
-    # GOD-TIER TOOLS - New handlers
-    # =============================================================================
+    "restart_service": _restart_service_tool,
+    "git_status": lambda args: git_operation(GitRequest(repo=args["repo"], command="status")),
+    "daily_stats": lambda args: daily_stats(),
 
     # === STRATEGY DETAIL TOOLS ===
-    elif tool_name == "strategy_detail":
-        response = await strategy_detail(
-            username=arguments.get("username"),
-            strategy_id=arguments.get("strategy_id")
-        )
-        return response
-
-    elif tool_name == "list_strategy_files":
-        response = await list_strategy_files(
-            username=arguments.get("username")
-        )
-        return response
-
-    elif tool_name == "raw_strategy_file":
-        response = await raw_strategy_file(
-            username=arguments.get("username"),
-            strategy_id=arguments.get("strategy_id")
-        )
-        return response
-
-    elif tool_name == "strategy_conversations":
-        response = await strategy_conversations(
-            username=arguments.get("username"),
-            strategy_id=arguments.get("strategy_id"),
-            limit=arguments.get("limit", 10)
-        )
-        return response
+    "strategy_detail": lambda args: strategy_detail(
+        username=args["username"], strategy_id=args["strategy_id"]
+    ),
+    "list_strategy_files": lambda args: list_strategy_files(username=args["username"]),
+    "raw_strategy_file": lambda args: raw_strategy_file(
+        username=args["username"], strategy_id=args["strategy_id"]
+    ),
+    "strategy_conversations": lambda args: strategy_conversations(
+        username=args["username"], strategy_id=args["strategy_id"], limit=args["limit"]
+    ),
 
     # === TOPIC ANALYSIS TOOLS ===
-    elif tool_name == "topic_analysis_full":
-        response = await topic_analysis_full(
-            topic_id=arguments.get("topic_id")
-        )
-        return response
-
-    elif tool_name == "topic_relationships":
-        response = await topic_relationships(
-            topic_id=arguments.get("topic_id")
-        )
-        return response
-
-    elif tool_name == "topic_influence_map":
-        response = await topic_influence_map(
-            topic_id=arguments.get("topic_id"),
-            depth=arguments.get("depth", 2)
-        )
-        return response
-
-    elif tool_name == "topic_coverage_gaps":
-        response = await topic_coverage_gaps(
-            stale_days=arguments.get("stale_days", 7)
-        )
-        return response
+    "topic_analysis_full": lambda args: topic_analysis_full(topic_id=args["topic_id"]),
+    "topic_relationships": lambda args: topic_relationships(topic_id=args["topic_id"]),
+    "topic_influence_map": lambda args: topic_influence_map(
+        topic_id=args["topic_id"], depth=args["depth"]
+    ),
+    "topic_coverage_gaps": lambda args: topic_coverage_gaps(stale_days=args["stale_days"]),
 
     # === PIPELINE & AGENT TOOLS ===
-    elif tool_name == "topic_mapping_result":
-        response = await topic_mapping_result(
-            username=arguments.get("username"),
-            strategy_id=arguments.get("strategy_id")
-        )
-        return response
-
-    elif tool_name == "exploration_paths":
-        response = await exploration_paths(
-            username=arguments.get("username"),
-            strategy_id=arguments.get("strategy_id")
-        )
-        return response
-
-    elif tool_name == "agent_outputs":
-        response = await agent_outputs(
-            username=arguments.get("username"),
-            strategy_id=arguments.get("strategy_id"),
-            agent=arguments.get("agent")
-        )
-        return response
+    "topic_mapping_result": lambda args: topic_mapping_result(
+        username=args["username"], strategy_id=args["strategy_id"]
+    ),
+    "exploration_paths": lambda args: exploration_paths(
+        username=args["username"], strategy_id=args["strategy_id"]
+    ),
+    "agent_outputs": lambda args: agent_outputs(
+        username=args["username"], strategy_id=args["strategy_id"], agent=args["agent"]
+    ),
 
     # === WORKER & PIPELINE MONITORING ===
-    elif tool_name == "worker_status":
-        response = await worker_status()
-        return response
-
-    elif tool_name == "failed_jobs":
-        response = await failed_jobs(
-            hours=arguments.get("hours", 24)
-        )
-        return response
-
-    elif tool_name == "processing_backlog":
-        response = await processing_backlog()
-        return response
-
-    elif tool_name == "ingestion_stats":
-        response = await ingestion_stats(
-            days=arguments.get("days", 7)
-        )
-        return response
+    "worker_status": lambda args: singleflight("worker_status", worker_status),
+    "failed_jobs": lambda args: failed_jobs(hours=args["hours"]),
+    "processing_backlog": lambda args: singleflight("processing_backlog", processing_backlog),
+    "ingestion_stats": lambda args: ingestion_stats(days=args["days"]),
 
     # === ARTICLE TOOLS ===
-    elif tool_name == "article_detail":
-        response = await article_detail(
-            article_id=arguments.get("article_id")
-        )
-        return response
-
-    elif tool_name == "search_articles":
-        response = await search_articles_tool(
-            query=arguments.get("query"),
-            topic_id=arguments.get("topic_id"),
-            since=arguments.get("since"),
-            limit=arguments.get("limit", 20)
-        )
-        return response
-
-    elif tool_name == "source_stats":
-        response = await source_stats(
-            days=arguments.get("days", 7)
-        )
-        return response
+    "article_detail": lambda args: article_detail(article_id=args["article_id"]),
+    "search_articles": lambda args: search_articles_tool(
+        query=args["query"], topic_id=args["topic_id"], since=args["since"], limit=args["limit"]
+    ),
+    "source_stats": lambda args: source_stats(days=args["days"]),
 
     # === CROSS-CUTTING ANALYSIS ===
-    elif tool_name == "strategy_health_check":
-        response = await strategy_health_check(
-            username=arguments.get("username"),
-            strategy_id=arguments.get("strategy_id")
-        )
-        return response
-
-    elif tool_name == "cross_strategy_insights":
-        response = await cross_strategy_insights()
-        return response
-
-    elif tool_name == "system_activity_log":
-        response = await system_activity_log(
-            hours=arguments.get("hours", 24)
-        )
-        return response
-
-    else:
-        raise ValueError(f"Unknown tool: {tool_name}")
+    "strategy_health_check": lambda args: strategy_health_check(
+        username=args["username"], strategy_id=args["strategy_id"]
+    ),
+    "cross_strategy_insights": lambda args: singleflight("cross_strategy_insights", cross_strategy_insights),
+    "system_activity_log": lambda args: system_activity_log(hours=args["hours"]),
+}
 
 
 # =============================================================================
@@ -1251,7 +1731,7 @@ async def execute_mcp_tool(tool_name: str, arguments: dict) -> dict:
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "mcp-server", "timestamp": datetime.utcnow().isoformat()}
+    return {"status": "healthy", "service": "mcp-server", "timestamp": iso_now()}
 
 
 @app.get("/mcp/status", dependencies=[Depends(verify_api_key)])
@@ -1280,40 +1760,78 @@ async def mcp_status():
 # LOG TOOLS
 # =============================================================================
 
+async def read_container_logs(service: str, tail: int, since: Optional[int] = None) -> dict:
+    """Fetch the last `tail` lines (stdout and stderr interleaved) in one daemon API call."""
+    try:
+        data = await asyncio.to_thread(
+            get_docker_client().api.logs, service, stdout=True, stderr=True, tail=tail, since=since
+        )
+    except DockerException as e:
+        return {"logs": "", "error": str(e), "success": False}
+    return {"logs": data.decode("utf-8", errors="replace"), "error": "", "success": True}
+
+
 @app.post("/mcp/tools/read_log", dependencies=[Depends(verify_api_key)])
 async def read_log(req: ReadLogRequest):
     """Read logs from a Docker service."""
     if req.service not in ALLOWED_SERVICES:
-        raise HTTPException(400, f"Unknown service: {req.service}. Allowed: {ALLOWED_SERVICES}")
-
-    cmd = ["docker", "logs", "--tail", str(req.lines)]
-    if req.since:
-        cmd.extend(["--since", req.since])
-    cmd.append(req.service)
+        raise HTTPException(400, f"Unknown service: {req.service}. Allowed: {sorted(ALLOWED_SERVICES)}")
 
-    result = run_command(cmd, timeout=30)
+    result = await read_container_logs(req.service, req.lines, since=parse_since(req.since))
     return {
         "service": req.service,
         "lines_requested": req.lines,
-        "logs": result["stdout"],
-        "stderr": result["stderr"],
+        "logs": result["logs"],
+        "stderr": result["error"],
         "success": result["success"]
     }
 
 
+def _search_service_logs(service: str, pattern: re.Pattern, since: Optional[int], max_lines: int,
+                         tail: int | str = "all") -> list:
+    """Scan one container's log stream, keeping the last max_lines matches."""
+    stream = get_docker_client().api.logs(service, stdout=True, stderr=True, since=since, tail=tail, stream=True)
+    matches = deque(maxlen=max_lines)
+    for line in iter_log_lines(stream):
+        if line and pattern.search(line):
+            matches.append(line)
+    return list(matches)
+
+
+async def search_services_logs(services: list, pattern: re.Pattern, since: Optional[int], max_lines: int,
+                               tail: int | str = "all") -> dict:
+    """Run _search_service_logs for each service side by side; unreadable services map to None."""
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(_search_service_logs, service, pattern, since, max_lines, tail) for service in services),
+        return_exceptions=True
+    )
+    return {
+        service: None if isinstance(matches, BaseException) else matches
+        for service, matches in zip(services, outcomes)
+    }
+
+
+# Line filters for the pipeline tools, compiled once
+WORKER_ACTIVITY_PATTERN = re.compile(r"SUCCESS|ERROR|Started|Completed|Processing")
+FAILURE_PATTERN = re.compile(r"ERROR|Exception|FAILED|Traceback", re.IGNORECASE)
+ACTIVITY_PATTERN = re.compile(r"SUCCESS|COMPLETED|INGESTED|ANALYZED|UPDATED|CREATED", re.IGNORECASE)
+
+
 @app.post("/mcp/tools/search_logs", dependencies=[Depends(verify_api_key)])
 async def search_logs(req: SearchLogsRequest):
     """Search logs for a pattern across services."""
+    try:
+        pattern = compile_pattern(req.pattern)
+    except re.error as e:
+        raise HTTPException(400, f"Invalid pattern: {e}")
+
+    since = parse_since(req.since)
     services = [req.service] if req.service else list(ALLOWED_SERVICES)
-    results = {}
+    services = [service for service in services if service in ALLOWED_SERVICES]
 
-    for service in services:
-        if service not in ALLOWED_SERVICES:
-            continue
-        cmd = f"docker logs --since {req.since} {service} 2>&1 | grep -E '{req.pattern}' | tail -n {req.lines}"
-        result = run_command(cmd, timeout=30)
-        if result["stdout"].strip():
-            results[service] = result["stdout"].strip().split("\n")
+    # Each container's log scan is independent I/O - run them side by side
+    outcomes = await search_services_logs(services, pattern, since, req.lines)
+    results = {service: matches for service, matches in outcomes.items() if matches}
 
     return {
         "pattern": req.pattern,
@@ -1323,27 +1841,63 @@ async def search_logs(req: SearchLogsRequest):
     }
 
 
+# Same ceiling as ReadLogRequest.lines - Docker would otherwise buffer any tail asked for
+TailLinesParam = Annotated[int, Query(ge=1, le=10000)]
+
+
 @app.get("/mcp/tools/tail_logs/{service}", dependencies=[Depends(verify_api_key)])
-async def tail_logs(service: str, lines: int = 50):
+async def tail_logs(service: str, lines: TailLinesParam = 50):
     """Get the most recent logs from a service (for polling)."""
     if service not in ALLOWED_SERVICES:
         raise HTTPException(400, f"Unknown service: {service}")
 
-    result = run_command(["docker", "logs", "--tail", str(lines), service], timeout=10)
+    result = await read_container_logs(service, lines)
     return {
         "service": service,
         "lines": lines,
-        "logs": result["stdout"],
-        "timestamp": datetime.utcnow().isoformat()
+        "logs": result["logs"],
+        "timestamp": iso_now()
     }
 
 
+@app.get("/mcp/tools/tail_logs/{service}/raw", dependencies=[Depends(verify_api_key)])
+async def tail_logs_raw(service: str, lines: TailLinesParam = 50):
+    """Stream the most recent logs from a service as plain text, chunk by chunk."""
+    if service not in ALLOWED_SERVICES:
+        raise HTTPException(400, f"Unknown service: {service}")
+
+    try:
+        chunks = await asyncio.to_thread(
+            get_docker_client().api.logs, service, stdout=True, stderr=True, tail=lines, stream=True
+        )
+    except DockerException as e:
+        raise HTTPException(502, f"Error reading logs: {e}")
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8")
+
+
 # =============================================================================
 # FILE TOOLS
 # =============================================================================
 
+READ_FILE_MAX_BYTES = 100000  # 100KB per read_file call
+_FILE_CHUNK_BYTES = 64 * 1024
+
+
+async def _stream_file(path: str, offset: int, limit: int):
+    """Yield at most `limit` bytes of the file from `offset`, in chunks of up to 64KB."""
+    async with await anyio.open_file(path, "rb") as f:
+        await f.seek(offset)
+        remaining = limit
+        while remaining:
+            chunk = await f.read(min(_FILE_CHUNK_BYTES, remaining))
+            if not chunk:
+                break
+            yield chunk
+            remaining -= len(chunk)
+
+
 @app.post("/mcp/tools/read_file", dependencies=[Depends(verify_api_key)])
-async def read_file(req: ReadFileRequest):
+def read_file(req: ReadFileRequest):
     """Read a file from the server."""
     path = validate_path(req.path)
 
@@ -1352,23 +1906,33 @@ async def read_file(req: ReadFileRequest):
     if not os.path.isfile(path):
         raise HTTPException(400, f"Not a file: {path}")
 
+    max_size = READ_FILE_MAX_BYTES  # reads stop one past this, never at EOF
     try:
-        with open(path, 'r', encoding='utf-8', errors='replace') as f:
-            if req.offset:
-                # Skip to offset
-                for _ in range(req.offset):
-                    f.readline()
-
-            if req.lines:
-                content = ''.join(f.readline() for _ in range(req.lines))
-            else:
-                content = f.read()
-
-        # Truncate if too large
-        max_size = 100000  # 100KB
-        truncated = len(content) > max_size
-        if truncated:
-            content = content[:max_size]
+        if req.byte_offset is not None:
+            with open(path, 'rb') as f:
+                f.seek(req.byte_offset)
+                data = f.read(max_size + 1)
+            truncated = len(data) > max_size
+            content = data[:max_size].decode('utf-8', errors='replace')
+        else:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                start = req.offset or 0
+                if req.lines:
+                    parts = []
+                    size = 0
+                    for line in islice(f, start, start + req.lines):
+                        parts.append(line)
+                        size += len(line)
+                        if size > max_size:
+                            break
+                    content = ''.join(parts)
+                else:
+                    deque(islice(f, start), maxlen=0)  # Skip to offset
+                    content = f.read(max_size + 1)
+
+            truncated = len(content) > max_size
+            if truncated:
+                content = content[:max_size]
 
         return {
             "path": path,
@@ -1380,15 +1944,52 @@ async def read_file(req: ReadFileRequest):
         raise HTTPException(500, f"Error reading file: {e}")
 
 
+@app.get("/mcp/tools/read_file/raw", dependencies=[Depends(verify_api_key)])
+async def read_file_raw(path: str, byte_offset: int = 0):
+    """Stream a file's raw bytes; size and truncation go in X-Size / X-Truncated.
+
+    Sent as application/octet-stream - the bytes are passed through untouched and
+    may be any encoding (or binary), so no charset is claimed.
+    """
+    path = validate_path(path)
+
+    if not os.path.exists(path):
+        raise HTTPException(404, f"File not found: {path}")
+    if not os.path.isfile(path):
+        raise HTTPException(400, f"Not a file: {path}")
+    if byte_offset < 0:
+        raise HTTPException(400, "byte_offset must be >= 0")
+
+    size = os.path.getsize(path)
+    return StreamingResponse(
+        _stream_file(path, byte_offset, READ_FILE_MAX_BYTES),
+        media_type="application/octet-stream",
+        headers={
+            "X-Size": str(size),
+            "X-Truncated": "true" if size - byte_offset > READ_FILE_MAX_BYTES else "false",
+        },
+    )
+
+
+def _find_files(root: str, pattern: str, limit: int) -> list:
+    """Files under root whose name matches the glob (like `find -name`), stopping at limit."""
+    match = compile_glob(pattern).match
+    files = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if match(name):
+                files.append(os.path.join(dirpath, name))
+                if len(files) >= limit:
+                    return files
+    return files
+
+
 @app.post("/mcp/tools/search_files", dependencies=[Depends(verify_api_key)])
-async def search_files(req: SearchFilesRequest):
+def search_files(req: SearchFilesRequest):
     """Search for files by name pattern."""
     path = validate_path(req.path)
 
-    cmd = f"find {path} -name '{req.pattern}' -type f 2>/dev/null | head -n {req.max_results}"
-    result = run_command(cmd, timeout=30)
-
-    files = [f for f in result["stdout"].strip().split("\n") if f]
+    files = _find_files(path, req.pattern, req.max_results)
 
     return {
         "pattern": req.pattern,
@@ -1398,24 +1999,42 @@ async def search_files(req: SearchFilesRequest):
     }
 
 
+def _parse_grep_line(line: str) -> Optional[dict]:
+    """Split a `grep -n` output line (file:line:content) into a match, or None."""
+    parts = line.split(":", 2)
+    if len(parts) < 3:
+        return None
+    return {
+        "file": parts[0],
+        "line": int(parts[1]) if parts[1].isdigit() else 0,
+        "content": parts[2]
+    }
+
+
 @app.post("/mcp/tools/grep", dependencies=[Depends(verify_api_key)])
 async def grep(req: GrepRequest):
     """Search file contents for a pattern."""
     path = validate_path(req.path)
 
-    cmd = f"grep -rn --include='{req.file_pattern or '*'}' -E '{req.pattern}' {path} 2>/dev/null | head -n {req.max_results}"
-    result = run_command(cmd, timeout=60)
+    # -s: unreadable files are skipped rather than reported as output lines
+    cmd = ["grep", "-rns", f"--include={req.file_pattern or '*'}", "-E", "-e", req.pattern, path]
 
+    # Read matches as grep produces them and stop it as soon as we have enough -
+    # a broad pattern over a large tree never gets buffered whole
+    # Symlinked trees can report the same file:line twice - keep the first
     matches = []
-    for line in result["stdout"].strip().split("\n"):
-        if line and ":" in line:
-            parts = line.split(":", 2)
-            if len(parts) >= 3:
-                matches.append({
-                    "file": parts[0],
-                    "line": int(parts[1]) if parts[1].isdigit() else 0,
-                    "content": parts[2]
-                })
+    seen = set()
+    async with aclosing(stream_command(cmd, timeout=60)) as lines:
+        try:
+            async for line in lines:
+                m = _parse_grep_line(line)
+                if m and (m["file"], m["line"]) not in seen:
+                    seen.add((m["file"], m["line"]))
+                    matches.append(m)
+                    if len(matches) >= req.max_results:
+                        break
+        except ValueError:
+            pass  # A single line over the stream buffer limit (minified files) - keep what we have
 
     return {
         "pattern": req.pattern,
@@ -1426,8 +2045,29 @@ async def grep(req: GrepRequest):
     }
 
 
+def _walk_paths(root: str, max_depth: int, limit: int) -> list:
+    """Paths under root down to max_depth (like `find -maxdepth`), stopping at limit."""
+    paths = [root]
+    for dirpath, dirnames, filenames in os.walk(root):
+        relative = os.path.relpath(dirpath, root)
+        child_depth = 1 if relative == "." else relative.count(os.sep) + 2
+        if child_depth > max_depth:
+            dirnames[:] = []
+            continue
+        if child_depth == max_depth:
+            dirnames_to_list = list(dirnames)
+            dirnames[:] = []  # List them, but don't descend
+        else:
+            dirnames_to_list = dirnames
+        for name in dirnames_to_list + filenames:
+            paths.append(os.path.join(dirpath, name))
+            if len(paths) >= limit:
+                return paths
+    return paths
+
+
 @app.post("/mcp/tools/list_directory", dependencies=[Depends(verify_api_key)])
-async def list_directory(req: ListDirectoryRequest):
+def list_directory(req: ListDirectoryRequest):
     """List directory contents."""
     path = validate_path(req.path)
 
@@ -1437,21 +2077,19 @@ async def list_directory(req: ListDirectoryRequest):
         raise HTTPException(400, f"Not a directory: {path}")
 
     if req.recursive:
-        cmd = f"find {path} -maxdepth {req.max_depth} -type f -o -type d 2>/dev/null | head -n 500"
-        result = run_command(cmd, timeout=30)
-        items = [f for f in result["stdout"].strip().split("\n") if f]
+        items = _walk_paths(path, req.max_depth, limit=500)
     else:
-        items = []
-        for item in os.listdir(path):
-            full_path = os.path.join(path, item)
-            item_type = "dir" if os.path.isdir(full_path) else "file"
-            size = os.path.getsize(full_path) if os.path.isfile(full_path) else 0
-            items.append({
-                "name": item,
-                "type": item_type,
-                "size": size,
-                "path": full_path
-            })
+        # scandir entries carry their file type, so only regular files need a stat
+        with os.scandir(path) as entries:
+            items = [
+                {
+                    "name": entry.name,
+                    "type": "dir" if entry.is_dir() else "file",
+                    "size": entry.stat().st_size if entry.is_file() else 0,
+                    "path": entry.path
+                }
+                for entry in entries
+            ]
 
     return {
         "path": path,
@@ -1464,12 +2102,20 @@ async def list_directory(req: ListDirectoryRequest):
 # DEPLOYMENT TOOLS
 # =============================================================================
 
-@app.post("/mcp/tools/deploy_service", dependencies=[Depends(verify_api_key)])
-async def deploy_service(req: DeployServiceRequest):
-    """Deploy a service (git pull + docker build + restart)."""
-    if req.service not in ALLOWED_SERVICES:
-        raise HTTPException(400, f"Unknown service: {req.service}")
+# Lines of output kept per step when the deploy isn't streamed
+DEPLOY_OUTPUT_LINES = 200
+
 
+async def _deploy_step(step: str, cmd: list, timeout: int, cwd: str = None, **extra):
+    """Run one deploy step: a {"step", "line"} event per output line, then {"step", "success"}."""
+    status = {}
+    async for line in stream_command(cmd, timeout, cwd=cwd, status=status):
+        yield {"step": step, "line": line}
+    yield {"step": step, **extra, "success": status["returncode"] == 0}
+
+
+async def deploy_events(req: DeployServiceRequest):
+    """Git pull + docker build + restart, as a stream of step events."""
     # Map services to their repos
     service_to_repo = {
         "frontend": "saga-fe",
@@ -1478,46 +2124,58 @@ async def deploy_service(req: DeployServiceRequest):
         "worker-sources": "graph-functions",
     }
 
-    steps = []
-
     # Git pull if requested
     if req.pull and req.service in service_to_repo:
         repo = service_to_repo[req.service]
         repo_path = REPO_PATHS.get(repo)
         if repo_path:
-            result = run_command(f"cd {repo_path} && git pull", timeout=60)
-            steps.append({
-                "step": "git_pull",
-                "repo": repo,
-                "success": result["success"],
-                "output": result["stdout"] + result["stderr"]
-            })
+            async for event in _deploy_step("git_pull", git_command(repo_path, "pull"), 60, repo=repo):
+                yield event
 
     # Docker compose build
-    compose_path = "/opt/saga-graph/victor_deployment"
-    cache_flag = "--no-cache" if req.no_cache else ""
-
-    result = run_command(
-        f"cd {compose_path} && docker compose build {cache_flag} {req.service}",
-        timeout=600  # 10 min for build
-    )
-    steps.append({
-        "step": "docker_build",
-        "success": result["success"],
-        "output": result["stdout"][-2000:] + result["stderr"][-2000:]  # Truncate
-    })
+    cache_flag = ["--no-cache"] if req.no_cache else []
+    built = False
+    async for event in _deploy_step(
+        "docker_build",
+        ["docker", "compose", "build", *cache_flag, req.service],
+        600,  # 10 min for build
+        cwd=COMPOSE_PATH
+    ):
+        built = event.get("success", built)
+        yield event
 
     # Docker compose up
-    if result["success"]:
-        result = run_command(
-            f"cd {compose_path} && docker compose up -d {req.service}",
-            timeout=120
-        )
-        steps.append({
-            "step": "docker_up",
-            "success": result["success"],
-            "output": result["stdout"] + result["stderr"]
-        })
+    if built:
+        async for event in _deploy_step(
+            "docker_up", ["docker", "compose", "up", "-d", req.service], 120, cwd=COMPOSE_PATH
+        ):
+            yield event
+
+
+@app.post("/mcp/tools/deploy_service", dependencies=[Depends(verify_api_key)])
+async def deploy_service(req: DeployServiceRequest):
+    """Deploy a service (git pull + docker build + restart)."""
+    if req.service not in ALLOWED_SERVICES:
+        raise HTTPException(400, f"Unknown service: {req.service}")
+
+    if req.stream:
+        async def ndjson():
+            overall_success = True
+            async for event in deploy_events(req):
+                overall_success &= event.get("success", True)
+                yield orjson.dumps(event) + b"\n"
+            yield orjson.dumps({"service": req.service, "overall_success": overall_success}) + b"\n"
+
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    steps = []
+    output = deque(maxlen=DEPLOY_OUTPUT_LINES)
+    async for event in deploy_events(req):
+        if "line" in event:
+            output.append(event["line"])
+        else:
+            steps.append({**event, "output": "\n".join(output)})
+            output.clear()
 
     return {
         "service": req.service,
@@ -1532,9 +2190,10 @@ async def restart_service(req: RestartServiceRequest):
     if req.service not in ALLOWED_SERVICES:
         raise HTTPException(400, f"Unknown service: {req.service}")
 
-    result = run_command(
-        f"cd /opt/saga-graph/victor_deployment && docker compose restart {req.service}",
-        timeout=120
+    result = await run_command(
+        ["docker", "compose", "restart", req.service],
+        timeout=120,
+        cwd=COMPOSE_PATH
     )
 
     return {
@@ -1545,34 +2204,39 @@ async def restart_service(req: RestartServiceRequest):
 
 
 @app.get("/mcp/tools/docker_status", dependencies=[Depends(verify_api_key)])
+@ttl_cache(seconds=3)
 async def docker_status():
     """Get status of all Docker containers."""
-    result = run_command(
-        "docker ps -a --format '{{json .}}'",
+    result = await run_command(
+        ["docker", "ps", "-a", "--format", "{{json .}}"],
         timeout=10
     )
 
     containers = []
-    for line in result["stdout"].strip().split("\n"):
+    for line in result["stdout"].splitlines():
         if line:
             try:
-                containers.append(json.loads(line))
-            except json.JSONDecodeError:
+                containers.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
                 continue
 
-    # Get more details for our services
+    # Get more details for our services - one inspect call covers all of them.
+    # Missing containers make docker exit non-zero but the others still print.
+    inspect = await run_command(
+        ["docker", "inspect", "--format", "{{.Name}}\t{{json .State}}", *ALLOWED_SERVICES],
+        timeout=10
+    )
     detailed = {}
-    for service in ALLOWED_SERVICES:
-        inspect = run_command(
-            f"docker inspect {service} --format '{{{{.State.Status}}}} {{{{.State.StartedAt}}}}'",
-            timeout=5
-        )
-        if inspect["success"]:
-            parts = inspect["stdout"].strip().split(" ")
-            detailed[service] = {
-                "status": parts[0] if parts else "unknown",
-                "started_at": parts[1] if len(parts) > 1 else "unknown"
-            }
+    for line in inspect["stdout"].splitlines():
+        name, _, state_json = line.partition("\t")
+        try:
+            state = orjson.loads(state_json)
+        except orjson.JSONDecodeError:
+            continue
+        detailed[name.lstrip("/")] = {
+            "status": state.get("Status", "unknown"),
+            "started_at": state.get("StartedAt", "unknown")
+        }
 
     return {
         "containers": containers,
@@ -1600,13 +2264,13 @@ async def git_operation(req: GitRequest):
 
     # Build full command
     if cmd_parts[0] == "log":
-        cmd = f"cd {repo_path} && git log --oneline -20"
+        cmd = git_command(repo_path, "log", "--oneline", "-20")
     elif cmd_parts[0] == "diff":
-        cmd = f"cd {repo_path} && git diff HEAD~1"
+        cmd = git_command(repo_path, "diff", "HEAD~1")
     else:
-        cmd = f"cd {repo_path} && git {req.command}"
+        cmd = git_command(repo_path, *cmd_parts)
 
-    result = run_command(cmd, timeout=60)
+    result = await run_command(cmd, timeout=60, env=GIT_ENV)
 
     return {
         "repo": req.repo,
@@ -1624,31 +2288,14 @@ async def git_operation(req: GitRequest):
 async def query_neo4j(req: CypherRequest):
     """Execute a Cypher query against Neo4j."""
     # Safety check - only allow read queries
-    query_upper = req.query.upper().strip()
-    write_keywords = ["CREATE", "MERGE", "DELETE", "SET", "REMOVE", "DROP"]
-
-    if any(kw in query_upper for kw in write_keywords):
+    if WRITE_CYPHER_PATTERN.search(req.query):
         raise HTTPException(400, "Write queries not allowed via MCP. Use read-only queries.")
 
-    # Execute via docker
-    escaped_query = req.query.replace('"', '\\"').replace("'", "\\'")
-    cmd = f'''docker exec -w /app/graph-functions apis python -c "
-from src.graph.neo4j_client import run_cypher
-import json
-results = run_cypher('{escaped_query}', {json.dumps(req.params)})
-print(json.dumps(results, default=str))
-"'''
-
-    result = run_command(cmd, timeout=30)
-
-    if result["success"]:
-        try:
-            data = json.loads(result["stdout"])
-            return {"query": req.query, "results": data, "success": True}
-        except json.JSONDecodeError:
-            return {"query": req.query, "raw_output": result["stdout"], "success": True}
-    else:
-        return {"query": req.query, "error": result["stderr"], "success": False}
+    try:
+        data = await run_cypher(req.query, req.params, read_only=True)
+    except (Neo4jError, DriverError) as e:
+        return {"query": req.query, "error": str(e), "success": False}
+    return {"query": req.query, "results": data, "success": True}
 
 
 # =============================================================================
@@ -1659,19 +2306,24 @@ print(json.dumps(results, default=str))
 async def system_health():
     """Get system health (CPU, memory, disk)."""
     # CPU load
-    cpu = run_command("cat /proc/loadavg", timeout=5)
-    cpu_load = cpu["stdout"].split()[:3] if cpu["success"] else ["unknown"]
+    try:
+        with open("/proc/loadavg") as f:
+            cpu_load = f.read().split()[:3]
+    except OSError:
+        cpu_load = ["unknown"]
 
     # Memory
-    mem = run_command("free -h | grep Mem", timeout=5)
-    mem_parts = mem["stdout"].split() if mem["success"] else []
+    mem = await run_command(["free", "-h"], timeout=5)
+    mem_line = next((line for line in mem["stdout"].splitlines() if line.startswith("Mem")), "")
+    mem_parts = mem_line.split()
 
     # Disk
-    disk = run_command("df -h / | tail -1", timeout=5)
-    disk_parts = disk["stdout"].split() if disk["success"] else []
+    disk = await run_command(["df", "-h", "/"], timeout=5)
+    disk_lines = disk["stdout"].splitlines()
+    disk_parts = disk_lines[-1].split() if disk["success"] and disk_lines else []
 
     # Docker
-    docker = await docker_status()
+    docker_info = await docker_status()
 
     return {
         "cpu_load": cpu_load,
@@ -1686,26 +2338,24 @@ async def system_health():
             "available": disk_parts[3] if len(disk_parts) > 3 else "unknown",
             "use_percent": disk_parts[4] if len(disk_parts) > 4 else "unknown",
         },
-        "docker_services": docker["services"],
-        "timestamp": datetime.utcnow().isoformat()
+        "docker_services": docker_info["services"],
+        "timestamp": iso_now()
     }
 
 
 @app.get("/mcp/tools/daily_stats", dependencies=[Depends(verify_api_key)])
+@ttl_cache(seconds=10)
 async def daily_stats():
     """Get daily stats from the backend API."""
-    result = run_command(
-        "curl -s http://apis:8000/api/stats",
-        timeout=10
-    )
+    result = await fetch_api("/api/stats")
 
     if result["success"]:
         try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
-            return {"raw": result["stdout"]}
+            return orjson.loads(result["text"])
+        except orjson.JSONDecodeError:
+            return {"raw": result["text"]}
     else:
-        return {"error": result["stderr"]}
+        return {"error": result["error"]}
 
 
 # =============================================================================
@@ -1715,31 +2365,18 @@ async def daily_stats():
 @app.post("/mcp/tools/run_command", dependencies=[Depends(verify_api_key)])
 async def run_limited_command(req: CommandRequest):
     """Run a limited set of safe commands."""
-    # Whitelist of allowed command prefixes
-    allowed_prefixes = [
-        "docker ps",
-        "docker logs",
-        "docker inspect",
-        "docker stats --no-stream",
-        "df -h",
-        "free",
-        "uptime",
-        "ps aux",
-        "netstat -tlnp",
-        "ls ",
-        "cat /proc/",
-        "wc -l",
-        "head ",
-        "tail ",
-    ]
-
-    if not any(req.command.startswith(prefix) for prefix in allowed_prefixes):
+    if not _ALLOWED_COMMAND_RE.match(req.command):
         raise HTTPException(
             400,
-            f"Command not allowed. Must start with one of: {allowed_prefixes}"
+            f"Command not allowed. Must start with one of: {list(ALLOWED_COMMAND_PREFIXES)}"
         )
 
-    result = run_command(req.command, timeout=30)
+    # No shell: pipes, redirects and `;` are passed through as literal arguments
+    try:
+        argv = shlex.split(req.command)
+    except ValueError as e:
+        raise HTTPException(400, f"Could not parse command: {e}")
+    result = await run_command(argv, timeout=30)
 
     return {
         "command": req.command,
@@ -1754,82 +2391,81 @@ async def run_limited_command(req: CommandRequest):
 # =============================================================================
 
 @app.get("/mcp/tools/graph_stats", dependencies=[Depends(verify_api_key)])
+@ttl_cache(seconds=60)
 async def graph_stats():
     """Get overall graph statistics - topic count, article count, relationships."""
-    cmd = '''docker exec -w /app/graph-functions apis python -c "
-from src.graph.neo4j_client import run_cypher
-import json
-
-topic_count = run_cypher('MATCH (t:Topic) RETURN count(t) as count')[0]['count']
-article_count = run_cypher('MATCH (a:Article) RETURN count(a) as count')[0]['count']
-about_count = run_cypher('MATCH ()-[r:ABOUT]->() RETURN count(r) as count')[0]['count']
-topic_rels = run_cypher('MATCH (:Topic)-[r:INFLUENCES|CORRELATES_WITH]->(:Topic) RETURN count(r) as count')[0]['count']
-orphan_count = run_cypher('MATCH (a:Article) WHERE NOT (a)-[:ABOUT]->(:Topic) RETURN count(a) as count')[0]['count']
-recent = run_cypher('MATCH (a:Article) WHERE a.created_at IS NOT NULL RETURN a.id, a.title, a.created_at ORDER BY a.created_at DESC LIMIT 5')
-top_topics = run_cypher('MATCH (a:Article)-[r:ABOUT]->(t:Topic) RETURN t.id as topic_id, t.name as topic_name, count(a) as article_count ORDER BY article_count DESC LIMIT 10')
-
-print(json.dumps({
-    'topic_count': topic_count,
-    'article_count': article_count,
-    'about_relationships': about_count,
-    'topic_relationships': topic_rels,
-    'orphan_articles': orphan_count,
-    'avg_articles_per_topic': round(about_count / max(topic_count, 1), 1),
-    'recent_articles': recent,
-    'top_topics_by_articles': top_topics
-}, default=str))
-"'''
-    result = run_command(cmd, timeout=30)
+    try:
+        # All five counts come back as one record - one round trip, one plan.
+        # Label and single-type relationship counts are answered from Neo4j's
+        # count store; INFLUENCES/CORRELATES_WITH only ever join topics, so the
+        # endpoint labels are dropped to keep them there
+        counts = (await run_cypher("""
+            CALL { MATCH (t:Topic) RETURN count(t) as topic_count }
+            CALL { MATCH (a:Article) RETURN count(a) as article_count }
+            CALL { MATCH ()-[r:ABOUT]->() RETURN count(r) as about_count }
+            CALL { MATCH ()-[r:INFLUENCES]->() RETURN count(r) as influences }
+            CALL { MATCH ()-[r:CORRELATES_WITH]->() RETURN count(r) as correlates }
+            CALL { MATCH (a:Article) WHERE NOT (a)-[:ABOUT]->(:Topic) RETURN count(a) as orphan_count }
+            RETURN topic_count, article_count, about_count, influences + correlates as topic_rels, orphan_count
+        """))[0]
+        topic_count = counts["topic_count"]
+        article_count = counts["article_count"]
+        about_count = counts["about_count"]
+        topic_rels = counts["topic_rels"]
+        orphan_count = counts["orphan_count"]
+        recent = await run_cypher("MATCH (a:Article) WHERE a.created_at IS NOT NULL RETURN a.id, a.title, a.created_at ORDER BY a.created_at DESC LIMIT 5")
+        top_topics = await run_cypher("MATCH (a:Article)-[r:ABOUT]->(t:Topic) RETURN t.id as topic_id, t.name as topic_name, count(a) as article_count ORDER BY article_count DESC LIMIT 10")
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
 
-    if result["success"]:
-        try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+    return {
+        "topic_count": topic_count,
+        "article_count": article_count,
+        "about_relationships": about_count,
+        "topic_relationships": topic_rels,
+        "orphan_articles": orphan_count,
+        "avg_articles_per_topic": round(about_count / max(topic_count, 1), 1),
+        "recent_articles": recent,
+        "top_topics_by_articles": top_topics
+    }
 
 
 @app.get("/mcp/tools/all_topics", dependencies=[Depends(verify_api_key)])
+@ttl_cache(seconds=120)
 async def all_topics():
     """Get all topics with key fields."""
-    cmd = '''docker exec -w /app/graph-functions apis python -c "
-from src.graph.ops.topic import get_all_topics
-import json
-
-topics = get_all_topics(fields=['id', 'name', 'type', 'category', 'last_updated'])
-print(json.dumps(topics, default=str))
-"'''
-    result = run_command(cmd, timeout=30)
-
-    if result["success"]:
-        try:
-            topics = json.loads(result["stdout"])
-            return {"topics": topics, "count": len(topics)}
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+    try:
+        topics = await run_cypher("""
+            MATCH (t:Topic)
+            RETURN t.id as id, t.name as name, t.type as type,
+                   t.category as category, t.last_updated as last_updated
+        """)
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+    return {"topics": topics, "count": len(topics)}
 
 
 @app.post("/mcp/tools/topic_details", dependencies=[Depends(verify_api_key)])
 async def topic_details(req: TopicDetailsRequest):
     """Get full details for a specific topic including analysis."""
-    cmd = f'''docker exec -w /app/graph-functions apis python -c "
+    script = """
+import json, sys
 from src.graph.ops.topic import get_topic_by_id, get_topic_context
-import json
 
+topic_id = sys.argv[1]
 try:
-    topic = get_topic_by_id('{req.topic_id}')
-    context = get_topic_context('{req.topic_id}')
-    print(json.dumps({{'topic': topic, 'context': context}}, default=str))
+    topic = get_topic_by_id(topic_id)
+    context = get_topic_context(topic_id)
+    print(json.dumps({'topic': topic, 'context': context}, default=str))
 except Exception as e:
-    print(json.dumps({{'error': str(e)}}))
-"'''
-    result = run_command(cmd, timeout=30)
+    print(json.dumps({'error': str(e)}))
+"""
+    result = await run_graph_functions(script, req.topic_id, timeout=30)
 
     if result["success"]:
         try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
+            return orjson.loads(result["stdout"])
+        except orjson.JSONDecodeError:
             return {"raw_output": result["stdout"], "success": True}
     return {"error": result["stderr"], "success": False}
 
@@ -1837,192 +2473,183 @@ except Exception as e:
 @app.post("/mcp/tools/topic_articles", dependencies=[Depends(verify_api_key)])
 async def topic_articles(req: TopicArticlesRequest):
     """Get articles linked to a topic with their importance tiers."""
-    cmd = f'''docker exec -w /app/graph-functions apis python -c "
-from src.graph.neo4j_client import run_cypher
-import json
-
-query = \\"""
-MATCH (a:Article)-[r:ABOUT]->(t:Topic {{id: '{req.topic_id}'}})
-WHERE a.status IS NULL OR a.status <> 'hidden'
-RETURN a.id as id, a.title as title, a.source as source,
-       r.timeframe as timeframe,
-       r.importance_risk as importance_risk,
-       r.importance_opportunity as importance_opportunity,
-       r.importance_trend as importance_trend,
-       r.importance_catalyst as importance_catalyst,
-       r.motivation as motivation,
-       a.published_at as published
-ORDER BY
-    COALESCE(r.importance_risk, 0) + COALESCE(r.importance_opportunity, 0) +
-    COALESCE(r.importance_trend, 0) + COALESCE(r.importance_catalyst, 0) DESC,
-    a.published_at DESC
-LIMIT {req.limit}
-\\"""
-results = run_cypher(query)
-print(json.dumps(results, default=str))
-"'''
-    result = run_command(cmd, timeout=30)
-
-    if result["success"]:
-        try:
-            articles = json.loads(result["stdout"])
-            return {"topic_id": req.topic_id, "articles": articles, "count": len(articles)}
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+    query = """
+        MATCH (a:Article)-[r:ABOUT]->(t:Topic {id: $topic_id})
+        WHERE a.status IS NULL OR a.status <> 'hidden'
+        WITH a, r,
+             COALESCE(r.importance_risk, 0) + COALESCE(r.importance_opportunity, 0) +
+             COALESCE(r.importance_trend, 0) + COALESCE(r.importance_catalyst, 0) as score
+        RETURN a.id as id, a.title as title, a.source as source,
+               r.timeframe as timeframe,
+               r.importance_risk as importance_risk,
+               r.importance_opportunity as importance_opportunity,
+               r.importance_trend as importance_trend,
+               r.importance_catalyst as importance_catalyst,
+               r.motivation as motivation,
+               a.published_at as published
+        ORDER BY score DESC, a.published_at DESC
+        LIMIT $limit
+    """
+    try:
+        articles = await run_cypher(query, {"topic_id": req.topic_id, "limit": req.limit})
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+    return {"topic_id": req.topic_id, "articles": articles, "count": len(articles)}
 
 
 @app.get("/mcp/tools/recent_articles", dependencies=[Depends(verify_api_key)])
+@ttl_cache(seconds=30)
 async def recent_articles(limit: int = 20, hours: int = 24):
     """Get recently ingested articles."""
-    cmd = f'''docker exec -w /app/graph-functions apis python -c "
-from src.graph.neo4j_client import run_cypher
-from datetime import datetime, timedelta
-import json
-
-cutoff = (datetime.utcnow() - timedelta(hours={hours})).isoformat()
-
-query = \\"""
-MATCH (a:Article)
-WHERE a.created_at > $cutoff
-OPTIONAL MATCH (a)-[r:ABOUT]->(t:Topic)
-RETURN a.id as id, a.title as title, a.source as source,
-       a.created_at as created_at,
-       collect(t.id) as topics
-ORDER BY a.created_at DESC
-LIMIT {limit}
-\\"""
-results = run_cypher(query, {{'cutoff': cutoff}})
-print(json.dumps(results, default=str))
-"'''
-    result = run_command(cmd, timeout=30)
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
 
-    if result["success"]:
-        try:
-            articles = json.loads(result["stdout"])
-            return {"articles": articles, "count": len(articles), "hours": hours}
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+    query = """
+        MATCH (a:Article)
+        WHERE a.created_at > $cutoff
+        OPTIONAL MATCH (a)-[r:ABOUT]->(t:Topic)
+        RETURN a.id as id, a.title as title, a.source as source,
+               a.created_at as created_at,
+               collect(t.id) as topics
+        ORDER BY a.created_at DESC
+        LIMIT $limit
+    """
+    try:
+        articles = await run_cypher(query, {"cutoff": cutoff, "limit": limit})
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+    return {"articles": articles, "count": len(articles), "hours": hours}
 
 
 @app.get("/mcp/tools/graph_health", dependencies=[Depends(verify_api_key)])
+@ttl_cache(seconds=60)
 async def graph_health():
     """Comprehensive graph health diagnostics for GOD-TIER visibility."""
-    cmd = """docker exec -w /app/graph-functions apis python -c "
-from src.graph.neo4j_client import run_cypher
-from datetime import datetime, timedelta
-import json
-
-# === BASIC COUNTS ===
-topic_count = run_cypher('MATCH (t:Topic) RETURN count(t) as count')[0]['count']
-article_count = run_cypher('MATCH (a:Article) RETURN count(a) as count')[0]['count']
-about_count = run_cypher('MATCH ()-[r:ABOUT]->() RETURN count(r) as count')[0]['count']
-
-# === TOPIC-TOPIC RELATIONSHIPS ===
-influences = run_cypher('MATCH (:Topic)-[r:INFLUENCES]->(:Topic) RETURN count(r) as count')[0]['count']
-correlates = run_cypher('MATCH (:Topic)-[r:CORRELATES_WITH]->(:Topic) RETURN count(r) as count')[0]['count']
-
-# === ORPHAN DETECTION ===
-orphan_articles = run_cypher('MATCH (a:Article) WHERE NOT (a)-[:ABOUT]->(:Topic) RETURN count(a) as count')[0]['count']
-orphan_topics = run_cypher('MATCH (t:Topic) WHERE NOT (:Article)-[:ABOUT]->(t) RETURN count(t) as count')[0]['count']
-
-# === TOPIC DISTRIBUTION ===
-topic_distribution = run_cypher('''
-    MATCH (a:Article)-[:ABOUT]->(t:Topic)
-    WITH t.id as topic_id, t.name as topic_name, count(a) as article_count
-    RETURN topic_id, topic_name, article_count
-    ORDER BY article_count DESC
-''')
-
-# Get distribution stats
-article_counts = [t['article_count'] for t in topic_distribution]
-min_articles = min(article_counts) if article_counts else 0
-max_articles = max(article_counts) if article_counts else 0
-median_articles = sorted(article_counts)[len(article_counts)//2] if article_counts else 0
-
-# Topics with < 10 articles (starving)
-starving_topics = [t for t in topic_distribution if t['article_count'] < 10]
-
-# Topics with > 500 articles (saturated)
-saturated_topics = [t for t in topic_distribution if t['article_count'] > 500]
-
-# === ANALYSIS FRESHNESS ===
-stale_analysis = run_cypher('''
-    MATCH (t:Topic)
-    WHERE t.last_analyzed IS NOT NULL
-    AND t.last_analyzed < datetime() - duration(\\\"P7D\\\")
-    RETURN t.id as topic_id, t.name as topic_name, t.last_analyzed as last_analyzed
-    ORDER BY t.last_analyzed ASC
-    LIMIT 10
-''')
-
-never_analyzed = run_cypher('''
-    MATCH (t:Topic)
-    WHERE t.last_analyzed IS NULL
-    RETURN t.id as topic_id, t.name as topic_name
-    LIMIT 20
-''')
-
-# === RECENT ACTIVITY ===
-articles_24h = run_cypher('''
-    MATCH (a:Article)
-    WHERE a.created_at > datetime() - duration(\\\"PT24H\\\")
-    RETURN count(a) as count
-''')[0]['count']
-
-articles_7d = run_cypher('''
-    MATCH (a:Article)
-    WHERE a.created_at > datetime() - duration(\\\"P7D\\\")
-    RETURN count(a) as count
-''')[0]['count']
-
-# === TOP 10 AND BOTTOM 10 TOPICS ===
-top_10 = topic_distribution[:10]
-bottom_10 = topic_distribution[-10:] if len(topic_distribution) > 10 else topic_distribution
-
-print(json.dumps({
-    'counts': {
-        'topics': topic_count,
-        'articles': article_count,
-        'about_relationships': about_count,
-        'influences_relationships': influences,
-        'correlates_relationships': correlates,
-        'total_topic_relationships': influences + correlates
-    },
-    'health': {
-        'orphan_articles': orphan_articles,
-        'orphan_topics': orphan_topics,
-        'starving_topics_count': len(starving_topics),
-        'saturated_topics_count': len(saturated_topics),
-        'stale_analysis_count': len(stale_analysis),
-        'never_analyzed_count': len(never_analyzed)
-    },
-    'distribution': {
-        'min_articles_per_topic': min_articles,
-        'max_articles_per_topic': max_articles,
-        'median_articles_per_topic': median_articles,
-        'avg_articles_per_topic': round(about_count / max(topic_count, 1), 1)
-    },
-    'activity': {
-        'articles_last_24h': articles_24h,
-        'articles_last_7d': articles_7d
-    },
-    'top_10_topics': top_10,
-    'bottom_10_topics': bottom_10,
-    'starving_topics': starving_topics[:10],
-    'stale_analysis': stale_analysis,
-    'never_analyzed': never_analyzed
-}, default=str))
-\""""
-    result = run_command(cmd, timeout=60)
+    # Cutoffs are computed once and bound as parameters - a constant the planner
+    # can seek the created_at/last_analyzed range indexes with
+    now = datetime.now(timezone.utc)
+    cutoffs = {"cutoff_24h": now - timedelta(hours=24), "cutoff_7d": now - timedelta(days=7)}
+    # The queries are independent - run them side by side on pooled sessions
+    try:
+        (
+            counts_rows, top_10, bottom_10, starving_topics, stale_analysis, never_analyzed
+        ) = await asyncio.gather(
+            # Basic counts, topic-topic relationships, orphans and recent activity
+            # are all scalars - fetch them as one record
+            run_cypher("""
+            CALL { MATCH (t:Topic) RETURN count(t) as topic_count }
+            CALL { MATCH (a:Article) RETURN count(a) as article_count }
+            CALL { MATCH ()-[r:ABOUT]->() RETURN count(r) as about_count }
+            CALL { MATCH ()-[r:INFLUENCES]->() RETURN count(r) as influences }
+            CALL { MATCH ()-[r:CORRELATES_WITH]->() RETURN count(r) as correlates }
+            CALL { MATCH (a:Article) WHERE NOT (a)-[:ABOUT]->(:Topic) RETURN count(a) as orphan_articles }
+            CALL { MATCH (t:Topic) WHERE NOT (:Article)-[:ABOUT]->(t) RETURN count(t) as orphan_topics }
+            CALL {
+                MATCH (a:Article)
+                WHERE a.created_at > $cutoff_7d
+                RETURN count(a) as articles_7d,
+                       count(CASE WHEN a.created_at > $cutoff_24h THEN 1 END) as articles_24h
+            }
+            CALL {
+                MATCH (a:Article)-[:ABOUT]->(t:Topic)
+                WITH t, count(a) as c
+                RETURN coalesce(min(c), 0) as min_articles,
+                       coalesce(max(c), 0) as max_articles,
+                       coalesce(percentileCont(c, 0.5), 0) as median_articles,
+                       sum(CASE WHEN c < 10 THEN 1 ELSE 0 END) as starving_count,
+                       sum(CASE WHEN c > 500 THEN 1 ELSE 0 END) as saturated_count
+            }
+            RETURN topic_count, article_count, about_count, influences, correlates,
+                   orphan_articles, orphan_topics, articles_24h, articles_7d,
+                   min_articles, max_articles, median_articles, starving_count, saturated_count
+        """, cutoffs),
+            # === TOP 10 AND BOTTOM 10 TOPICS ===
+            run_cypher("""
+            MATCH (a:Article)-[:ABOUT]->(t:Topic)
+            WITH t.id as topic_id, t.name as topic_name, count(a) as article_count
+            RETURN topic_id, topic_name, article_count
+            ORDER BY article_count DESC
+            LIMIT 10
+        """),
+            run_cypher("""
+            MATCH (a:Article)-[:ABOUT]->(t:Topic)
+            WITH t.id as topic_id, t.name as topic_name, count(a) as article_count
+            RETURN topic_id, topic_name, article_count
+            ORDER BY article_count ASC
+            LIMIT 10
+        """),
+            # Topics with < 10 articles (starving) - the ten closest to recovering
+            run_cypher("""
+            MATCH (a:Article)-[:ABOUT]->(t:Topic)
+            WITH t.id as topic_id, t.name as topic_name, count(a) as article_count
+            WHERE article_count < 10
+            RETURN topic_id, topic_name, article_count
+            ORDER BY article_count DESC
+            LIMIT 10
+        """),
+            # === ANALYSIS FRESHNESS ===
+            run_cypher("""
+            MATCH (t:Topic)
+            WHERE t.last_analyzed IS NOT NULL
+            AND t.last_analyzed < $cutoff_7d
+            RETURN t.id as topic_id, t.name as topic_name, t.last_analyzed as last_analyzed
+            ORDER BY t.last_analyzed ASC
+            LIMIT 10
+        """, {"cutoff_7d": cutoffs["cutoff_7d"]}),
+            run_cypher("""
+            MATCH (t:Topic)
+            WHERE t.last_analyzed IS NULL
+            RETURN t.id as topic_id, t.name as topic_name
+            LIMIT 20
+        """),
+        )
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+
+    counts = counts_rows[0]
+    topic_count = counts["topic_count"]
+    article_count = counts["article_count"]
+    about_count = counts["about_count"]
+    influences = counts["influences"]
+    correlates = counts["correlates"]
+    orphan_articles = counts["orphan_articles"]
+    orphan_topics = counts["orphan_topics"]
+    articles_24h = counts["articles_24h"]
+    articles_7d = counts["articles_7d"]
+    bottom_10.reverse()  # listed largest first, like top_10
 
-    if result["success"]:
-        try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+    return {
+        "counts": {
+            "topics": topic_count,
+            "articles": article_count,
+            "about_relationships": about_count,
+            "influences_relationships": influences,
+            "correlates_relationships": correlates,
+            "total_topic_relationships": influences + correlates
+        },
+        "health": {
+            "orphan_articles": orphan_articles,
+            "orphan_topics": orphan_topics,
+            "starving_topics_count": counts["starving_count"],
+            "saturated_topics_count": counts["saturated_count"],
+            "stale_analysis_count": len(stale_analysis),
+            "never_analyzed_count": len(never_analyzed)
+        },
+        "distribution": {
+            "min_articles_per_topic": counts["min_articles"],
+            "max_articles_per_topic": counts["max_articles"],
+            "median_articles_per_topic": counts["median_articles"],
+            "avg_articles_per_topic": round(about_count / max(topic_count, 1), 1)
+        },
+        "activity": {
+            "articles_last_24h": articles_24h,
+            "articles_last_7d": articles_7d
+        },
+        "top_10_topics": top_10,
+        "bottom_10_topics": bottom_10,
+        "starving_topics": starving_topics,
+        "stale_analysis": stale_analysis,
+        "never_analyzed": never_analyzed
+    }
 
 
 # Pre-built analytical queries for graph_query endpoint
@@ -2058,14 +2685,15 @@ GRAPH_QUERIES = {
     """,
     "high_importance_articles": """
         MATCH (a:Article)-[r:ABOUT]->(t:Topic)
-        WHERE (COALESCE(r.importance_risk, 0) + COALESCE(r.importance_opportunity, 0) +
-               COALESCE(r.importance_trend, 0) + COALESCE(r.importance_catalyst, 0)) >= 3
+        WITH a, r, t,
+             COALESCE(r.importance_risk, 0) + COALESCE(r.importance_opportunity, 0) +
+             COALESCE(r.importance_trend, 0) + COALESCE(r.importance_catalyst, 0) as score
+        WHERE score >= 3
         RETURN a.id as id, a.title as title, t.id as topic_id, t.name as topic_name,
                r.importance_risk as risk, r.importance_opportunity as opportunity,
                r.importance_trend as trend, r.importance_catalyst as catalyst,
                r.motivation as motivation
-        ORDER BY (COALESCE(r.importance_risk, 0) + COALESCE(r.importance_opportunity, 0) +
-                  COALESCE(r.importance_trend, 0) + COALESCE(r.importance_catalyst, 0)) DESC
+        ORDER BY score DESC
         LIMIT 50
     """,
     "articles_per_topic_stats": """
@@ -2079,18 +2707,24 @@ GRAPH_QUERIES = {
     """,
     "recent_ingestion": """
         MATCH (a:Article)
-        WHERE a.created_at > datetime() - duration('PT24H')
+        WHERE a.created_at > $cutoff
         OPTIONAL MATCH (a)-[:ABOUT]->(t:Topic)
         RETURN a.id as id, a.title as title, a.created_at as created_at,
                collect(t.id) as topics
         ORDER BY a.created_at DESC
         LIMIT 30
     """,
+    # Pair up each article's own topic list rather than self-joining ABOUT;
+    # single-topic articles drop out before any pairs are built
     "topic_overlap": """
-        MATCH (a:Article)-[:ABOUT]->(t1:Topic)
-        MATCH (a)-[:ABOUT]->(t2:Topic)
+        MATCH (a:Article)
+        WITH a, [(a)-[:ABOUT]->(t:Topic) | t] as topics
+        WHERE size(topics) > 1
+        UNWIND topics as t1
+        UNWIND topics as t2
+        WITH t1, t2
         WHERE t1.id < t2.id
-        WITH t1, t2, count(a) as shared_articles
+        WITH t1, t2, count(*) as shared_articles
         WHERE shared_articles > 5
         RETURN t1.id as topic1, t1.name as name1,
                t2.id as topic2, t2.name as name2,
@@ -2106,7 +2740,69 @@ GRAPH_QUERIES = {
 }
 
 
+# Articles-per-topic is a full ABOUT aggregation that both distribution queries need, and it
+# moves slowly - keep it in memory for a few minutes (writes clear it right away)
+@ttl_cache(seconds=300)
+async def topic_distribution_view() -> list:
+    """Article count per topic, largest first. Shared - don't mutate the result."""
+    return await run_cypher(GRAPH_QUERIES["topic_distribution"], read_only=True)
+
+
+def _percentile_cont(ordered: list, p: float) -> float:
+    """Cypher's percentileCont: linear interpolation over ascending values."""
+    position = p * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def articles_per_topic_stats(distribution: list) -> dict:
+    """The articles_per_topic_stats row, computed from the distribution view."""
+    counts = sorted(t["article_count"] for t in distribution)
+    if not counts:
+        return {
+            "min_articles": None, "max_articles": None, "avg_articles": None,
+            "stdev_articles": 0.0, "median_articles": None,
+            "p25_articles": None, "p75_articles": None
+        }
+    return {
+        "min_articles": counts[0],
+        "max_articles": counts[-1],
+        "avg_articles": statistics.fmean(counts),
+        "stdev_articles": statistics.stdev(counts) if len(counts) > 1 else 0.0,
+        "median_articles": _percentile_cont(counts, 0.5),
+        "p25_articles": _percentile_cont(counts, 0.25),
+        "p75_articles": _percentile_cont(counts, 0.75)
+    }
+
+
+# Parameters some GRAPH_QUERIES need, computed per call
+GRAPH_QUERY_PARAMS = {
+    "recent_ingestion": lambda: {"cutoff": datetime.now(timezone.utc) - timedelta(hours=24)},
+}
+
+
+# Each query's text with and without a caller limit, built once. Queries with
+# their own LIMIT ignore the caller's; the others take it as $limit, so every
+# limit value shares one cached plan
+_GRAPH_QUERY_TEXT = {
+    name: (text, text if "LIMIT" in text.upper() else text + " LIMIT $limit")
+    for name, text in ((name, query.strip()) for name, query in GRAPH_QUERIES.items())
+}
+
+
+def _graph_query_with_params(query_name: str, limit: Optional[int]) -> tuple:
+    """The Cypher text and bind parameters for a GRAPH_QUERIES entry."""
+    unlimited, limited = _GRAPH_QUERY_TEXT[query_name]
+    params = GRAPH_QUERY_PARAMS[query_name]() if query_name in GRAPH_QUERY_PARAMS else {}
+    if not limit or limited is unlimited:
+        return unlimited, params
+    params["limit"] = limit
+    return limited, params
+
+
 @app.get("/mcp/tools/graph_query/{query_name}", dependencies=[Depends(verify_api_key)])
+@ttl_cache(seconds=60)
 async def graph_query(query_name: str, limit: int = None):
     """
     Run pre-built analytical queries by name.
@@ -2128,29 +2824,54 @@ async def graph_query(query_name: str, limit: int = None):
             "available_queries": list(GRAPH_QUERIES.keys())
         }
 
-    query = GRAPH_QUERIES[query_name]
+    query, params = _graph_query_with_params(query_name, limit)
 
-    # Apply limit if provided and query doesn't have one
-    if limit and "LIMIT" not in query.upper():
-        query = query.strip() + f" LIMIT {limit}"
+    try:
+        if query_name == "topic_distribution":
+            data = (await topic_distribution_view())[:limit or None]
+        elif query_name == "articles_per_topic_stats":
+            data = [articles_per_topic_stats(await topic_distribution_view())]
+        else:
+            data = await run_cypher(query, params, read_only=True)
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+    return {"query": query_name, "results": data, "count": len(data)}
 
-    cmd = f'''docker exec -w /app/graph-functions apis python -c "
-from src.graph.neo4j_client import run_cypher
-import json
 
-query = \\"""{query}\\"""
-results = run_cypher(query)
-print(json.dumps(results, default=str))
-"'''
-    result = run_command(cmd, timeout=60)
+async def _aiter_list(items: list):
+    for item in items:
+        yield item
 
-    if result["success"]:
-        try:
-            data = json.loads(result["stdout"])
-            return {"query": query_name, "results": data, "count": len(data)}
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+
+@app.get("/mcp/tools/graph_query/{query_name}/stream", dependencies=[Depends(verify_api_key)])
+async def graph_query_stream(query_name: str, limit: int = None):
+    """Run a pre-built query and stream its rows as NDJSON, one record per line, as Neo4j yields them."""
+    if query_name not in GRAPH_QUERIES:
+        raise HTTPException(404, f"Unknown query: {query_name}")
+
+    if query_name in ("topic_distribution", "articles_per_topic_stats"):
+        # Served from the in-memory view - nothing to stream from the database
+        result = await graph_query(query_name, limit)
+        if "error" in result:
+            raise HTTPException(502, result["error"])
+        rows = _aiter_list(result["results"])
+    else:
+        rows = stream_cypher(*_graph_query_with_params(query_name, limit))
+
+    # Pull the first row before answering so connection/query errors still get a status code
+    try:
+        first = await anext(rows, None)
+    except (Neo4jError, DriverError) as e:
+        raise HTTPException(502, str(e))
+
+    async def ndjson():
+        if first is None:
+            return
+        yield orjson.dumps(first) + b"\n"
+        async for row in rows:
+            yield orjson.dumps(row) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 
 @app.get("/mcp/tools/graph_queries", dependencies=[Depends(verify_api_key)])
@@ -2169,35 +2890,37 @@ async def list_graph_queries():
 @app.get("/mcp/tools/list_users", dependencies=[Depends(verify_api_key)])
 async def list_users():
     """List all users in the system."""
-    result = run_command("curl -s http://apis:8000/api/users", timeout=10)
+    result = await fetch_api("/api/users")
 
     if result["success"]:
         try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"]}
-    return {"error": result["stderr"], "success": False}
+            return orjson.loads(result["text"])
+        except orjson.JSONDecodeError:
+            return {"raw_output": result["text"]}
+    return {"error": result["error"], "success": False}
 
 
 @app.post("/mcp/tools/user_strategies", dependencies=[Depends(verify_api_key)])
 async def user_strategies(req: StrategyRequest):
     """Get strategies for a user, optionally a specific strategy."""
+    validate_id("username", req.username)
     if req.strategy_id:
+        validate_id("strategy_id", req.strategy_id)
         # Get specific strategy with full details
-        url = f"http://apis:8000/api/users/{req.username}/strategies/{req.strategy_id}"
+        path = f"/api/users/{req.username}/strategies/{req.strategy_id}"
     else:
         # List all strategies for user
-        url = f"http://apis:8000/api/users/{req.username}/strategies"
+        path = f"/api/users/{req.username}/strategies"
 
-    result = run_command(f"curl -s '{url}'", timeout=10)
+    result = await fetch_api(path)
 
     if result["success"]:
         try:
-            data = json.loads(result["stdout"])
+            data = orjson.loads(result["text"])
             return {"username": req.username, "data": data}
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"]}
-    return {"error": result["stderr"], "success": False}
+        except orjson.JSONDecodeError:
+            return {"raw_output": result["text"]}
+    return {"error": result["error"], "success": False}
 
 
 @app.post("/mcp/tools/strategy_analysis", dependencies=[Depends(verify_api_key)])
@@ -2205,17 +2928,19 @@ async def strategy_analysis(req: StrategyRequest):
     """Get the latest analysis for a strategy."""
     if not req.strategy_id:
         raise HTTPException(400, "strategy_id is required for analysis")
+    validate_id("username", req.username)
+    validate_id("strategy_id", req.strategy_id)
 
-    url = f"http://apis:8000/api/users/{req.username}/strategies/{req.strategy_id}/analysis"
-    result = run_command(f"curl -s '{url}'", timeout=10)
+    path = f"/api/users/{req.username}/strategies/{req.strategy_id}/analysis"
+    result = await fetch_api(path)
 
     if result["success"]:
         try:
-            data = json.loads(result["stdout"])
+            data = orjson.loads(result["text"])
             return {"username": req.username, "strategy_id": req.strategy_id, "analysis": data}
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"]}
-    return {"error": result["stderr"], "success": False}
+        except orjson.JSONDecodeError:
+            return {"raw_output": result["text"]}
+    return {"error": result["error"], "success": False}
 
 
 @app.post("/mcp/tools/strategy_topics", dependencies=[Depends(verify_api_key)])
@@ -2223,17 +2948,19 @@ async def strategy_topics(req: StrategyRequest):
     """Get topics associated with a strategy."""
     if not req.strategy_id:
         raise HTTPException(400, "strategy_id is required")
+    validate_id("username", req.username)
+    validate_id("strategy_id", req.strategy_id)
 
-    url = f"http://apis:8000/api/users/{req.username}/strategies/{req.strategy_id}/topics"
-    result = run_command(f"curl -s '{url}'", timeout=10)
+    path = f"/api/users/{req.username}/strategies/{req.strategy_id}/topics"
+    result = await fetch_api(path)
 
     if result["success"]:
         try:
-            data = json.loads(result["stdout"])
+            data = orjson.loads(result["text"])
             return {"username": req.username, "strategy_id": req.strategy_id, "topics": data}
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"]}
-    return {"error": result["stderr"], "success": False}
+        except orjson.JSONDecodeError:
+            return {"raw_output": result["text"]}
+    return {"error": result["error"], "success": False}
 
 
 # =============================================================================
@@ -2243,24 +2970,26 @@ async def strategy_topics(req: StrategyRequest):
 @app.post("/mcp/tools/hide_article", dependencies=[Depends(verify_api_key)])
 async def hide_article(req: HideArticleRequest):
     """Hide an article (soft delete). Requires reason for audit."""
-    cmd = f'''docker exec -w /app/graph-functions apis python -c "
+    script = """
+import json, sys
 from src.graph.ops.article import set_article_hidden
 from src.observability.stats_client import track
-import json
 
+article_id, reason = sys.argv[1], sys.argv[2]
 try:
-    set_article_hidden('{req.article_id}')
-    track('article_hidden_via_mcp', '{req.article_id}: {req.reason}')
-    print(json.dumps({{'success': True, 'article_id': '{req.article_id}', 'reason': '{req.reason}'}}))
+    set_article_hidden(article_id)
+    track('article_hidden_via_mcp', f'{article_id}: {reason}')
+    print(json.dumps({'success': True, 'article_id': article_id, 'reason': reason}))
 except Exception as e:
-    print(json.dumps({{'success': False, 'error': str(e)}}))
-"'''
-    result = run_command(cmd, timeout=30)
+    print(json.dumps({'success': False, 'error': str(e)}))
+"""
+    result = await run_graph_functions(script, req.article_id, req.reason, timeout=30)
+    clear_ttl_caches()
 
     if result["success"]:
         try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
+            return orjson.loads(result["stdout"])
+        except orjson.JSONDecodeError:
             return {"raw_output": result["stdout"]}
     return {"error": result["stderr"], "success": False}
 
@@ -2268,26 +2997,33 @@ except Exception as e:
 @app.post("/mcp/tools/trigger_analysis", dependencies=[Depends(verify_api_key)])
 async def trigger_topic_analysis(req: TriggerAnalysisRequest):
     """Trigger analysis refresh for a topic. Runs in background."""
-    # First verify topic exists
-    check_cmd = f'''docker exec -w /app/graph-functions apis python -c "
-from src.graph.ops.topic import check_if_topic_exists
-print('exists' if check_if_topic_exists('{req.topic_id}') else 'not_found')
-"'''
-    check = run_command(check_cmd, timeout=10)
-
-    if "not_found" in check["stdout"]:
+    # First verify topic exists - an id lookup on the shared driver
+    try:
+        found = await run_cypher(
+            "MATCH (t:Topic {id: $topic_id}) RETURN count(t) as count", {"topic_id": req.topic_id}, read_only=True
+        )
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+
+    if not found[0]["count"]:
         raise HTTPException(404, f"Topic not found: {req.topic_id}")
 
-    # Trigger analysis (this runs the analysis pipeline)
-    # Note: This is a simplified trigger - in production you might queue this
-    cmd = f'''docker exec -d -w /app/graph-functions apis python -c "
+    # Trigger analysis (this runs the analysis pipeline). The pipeline lives in
+    # graph-functions, so it starts as a detached exec in the apis container
+    script = """
+import sys
 from src.analysis.policies.reanalysis import trigger_reanalysis
 from src.observability.stats_client import track
 
-track('analysis_triggered_via_mcp', '{req.topic_id}')
-trigger_reanalysis('{req.topic_id}', force={req.force})
-"'''
-    result = run_command(cmd, timeout=10)
+topic_id, force = sys.argv[1], sys.argv[2] == 'true'
+track('analysis_triggered_via_mcp', topic_id)
+trigger_reanalysis(topic_id, force=force)
+"""
+    result = await run_graph_functions(script, req.topic_id, "true" if req.force else "false", timeout=10, detach=True)
+    clear_ttl_caches()
+
+    if not result["success"]:
+        return {"topic_id": req.topic_id, "triggered": False, "error": result["stderr"], "success": False}
 
     return {
         "topic_id": req.topic_id,
@@ -2302,15 +3038,15 @@ trigger_reanalysis('{req.topic_id}', force={req.force})
 # =============================================================================
 
 @app.get("/mcp/tools/strategy_detail", dependencies=[Depends(verify_api_key)])
-async def strategy_detail(username: str, strategy_id: str):
+async def strategy_detail(username: IdParam, strategy_id: IdParam):
     """Get FULL strategy details including thesis, position, target, is_default, timestamps."""
     # Use internal API to get strategy (data is inside Docker volume)
-    url = f"http://apis:8000/api/users/{username}/strategies/{strategy_id}"
-    result = run_command(f"curl -s '{url}'", timeout=10)
+    path = f"/api/users/{username}/strategies/{strategy_id}"
+    result = await fetch_api(path)
 
-    if result["success"] and result["stdout"].strip():
+    if result["success"] and result["text"].strip():
         try:
-            data = json.loads(result["stdout"])
+            data = orjson.loads(result["text"])
             if "error" in data:
                 return {"error": data["error"], "success": False}
             return {
@@ -2319,42 +3055,42 @@ async def strategy_detail(username: str, strategy_id: str):
                 "strategy": data,
                 "success": True
             }
-        except json.JSONDecodeError as e:
-            return {"error": f"Invalid JSON response: {e}", "raw": result["stdout"][:500]}
+        except orjson.JSONDecodeError as e:
+            return {"error": f"Invalid JSON response: {e}", "raw": result["text"][:500]}
     return {"error": "Failed to fetch strategy from API", "success": False}
 
 
 @app.get("/mcp/tools/list_strategy_files", dependencies=[Depends(verify_api_key)])
-async def list_strategy_files(username: str):
+async def list_strategy_files(username: IdParam):
     """List all strategies for a user with metadata."""
     # Use internal API (data is inside Docker volume)
-    url = f"http://apis:8000/api/users/{username}/strategies"
-    result = run_command(f"curl -s '{url}'", timeout=10)
+    path = f"/api/users/{username}/strategies"
+    result = await fetch_api(path)
 
-    if result["success"] and result["stdout"].strip():
+    if result["success"] and result["text"].strip():
         try:
-            data = json.loads(result["stdout"])
+            data = orjson.loads(result["text"])
             strategies = data.get("strategies", [])
             return {
                 "username": username,
                 "strategies": strategies,
                 "count": len(strategies)
             }
-        except json.JSONDecodeError:
-            return {"error": "Invalid JSON response", "raw": result["stdout"][:500]}
+        except orjson.JSONDecodeError:
+            return {"error": "Invalid JSON response", "raw": result["text"][:500]}
     return {"username": username, "strategies": [], "count": 0, "note": "No strategies found or API error"}
 
 
 @app.get("/mcp/tools/raw_strategy_file", dependencies=[Depends(verify_api_key)])
-async def raw_strategy_file(username: str, strategy_id: str):
+async def raw_strategy_file(username: IdParam, strategy_id: IdParam):
     """Read full strategy JSON - complete data from API."""
     # Use internal API (data is inside Docker volume)
-    url = f"http://apis:8000/api/users/{username}/strategies/{strategy_id}"
-    result = run_command(f"curl -s '{url}'", timeout=10)
+    path = f"/api/users/{username}/strategies/{strategy_id}"
+    result = await fetch_api(path)
 
-    if result["success"] and result["stdout"].strip():
+    if result["success"] and result["text"].strip():
         try:
-            data = json.loads(result["stdout"])
+            data = orjson.loads(result["text"])
             if "error" in data:
                 return {"error": data["error"], "success": False}
             return {
@@ -2363,40 +3099,54 @@ async def raw_strategy_file(username: str, strategy_id: str):
                 "raw_content": data,
                 "success": True
             }
-        except json.JSONDecodeError:
-            return {"error": "Invalid JSON", "raw_content": result["stdout"][:2000]}
+        except orjson.JSONDecodeError:
+            return {"error": "Invalid JSON", "raw_content": result["text"][:2000]}
     return {"error": "Failed to fetch strategy from API", "success": False}
 
 
-@app.get("/mcp/tools/strategy_conversations", dependencies=[Depends(verify_api_key)])
-async def strategy_conversations(username: str, strategy_id: str, limit: int = 10):
-    """Get conversation history for a strategy."""
-    conv_dir = f"/opt/saga-graph/saga-be/users/{username}/conversations"
-
-    # List conversation files for this strategy
-    result = run_command(f"ls -t {conv_dir}/*{strategy_id}*.json 2>/dev/null | head -n {limit}", timeout=10)
+def _load_conversations(conv_dir: Path, strategy_id: str, limit: int) -> list:
+    """Read the newest conversation files that belong to strategy_id."""
+    # One directory scan gives names and mtimes for both passes below
+    try:
+        with os.scandir(conv_dir) as entries:
+            newest_first = sorted(
+                ((entry.stat().st_mtime, entry.name) for entry in entries
+                 if entry.name.endswith(".json") and entry.is_file()),
+                reverse=True
+            )
+    except OSError:
+        return []
 
-    if not result["success"] or not result["stdout"].strip():
+    names = [name for _, name in newest_first if strategy_id in name][:limit]
+    if not names:
         # Try listing all conversations and filtering
-        result = run_command(f"ls -t {conv_dir}/*.json 2>/dev/null | head -n 50", timeout=10)
+        names = [name for _, name in newest_first[:50]]
+    files = [conv_dir / name for name in names]
 
     conversations = []
-    for filepath in result["stdout"].strip().split("\n"):
-        if filepath:
-            cat_result = run_command(f"cat '{filepath}'", timeout=5)
-            if cat_result["success"]:
-                try:
-                    data = json.loads(cat_result["stdout"])
-                    # Check if this conversation is for the target strategy
-                    if strategy_id in filepath or data.get("strategy_id") == strategy_id:
-                        conversations.append({
-                            "filename": os.path.basename(filepath),
-                            "created_at": data.get("created_at"),
-                            "message_count": len(data.get("messages", [])),
-                            "messages": data.get("messages", [])[-5:]  # Last 5 messages as preview
-                        })
-                except json.JSONDecodeError:
-                    pass
+    for filepath in files:
+        try:
+            data = orjson.loads(filepath.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            continue
+        # Check if this conversation is for the target strategy
+        if strategy_id in filepath.name or data.get("strategy_id") == strategy_id:
+            conversations.append({
+                "filename": filepath.name,
+                "created_at": data.get("created_at"),
+                "message_count": len(data.get("messages", [])),
+                "messages": data.get("messages", [])[-5:]  # Last 5 messages as preview
+            })
+    return conversations
+
+
+@app.get("/mcp/tools/strategy_conversations", dependencies=[Depends(verify_api_key)])
+async def strategy_conversations(username: IdParam, strategy_id: IdParam, limit: int = 10):
+    """Get conversation history for a strategy."""
+    conv_dir = user_dir(username) / "conversations"
+
+    # One thread hop for the whole listing + reads, no shell or cat per file
+    conversations = await asyncio.to_thread(_load_conversations, conv_dir, strategy_id, limit)
 
     return {
         "username": username,
@@ -2411,133 +3161,207 @@ async def strategy_conversations(username: str, strategy_id: str, limit: int = 1
 # =============================================================================
 
 @app.get("/mcp/tools/topic_analysis_full", dependencies=[Depends(verify_api_key)])
-async def topic_analysis_full(topic_id: str):
+@ttl_cache(seconds=60, maxsize=4096)
+async def topic_analysis_full(topic_id: IdParam):
     """Get ALL 4 analysis timeframes for a topic."""
-    cmd = f"""docker exec -w /app/graph-functions apis python -c '
-import json
-from src.graph.neo4j_client import run_cypher
-q = "MATCH (t:Topic {{id: \\"{topic_id}\\"}}) RETURN t.id as id, t.name as name, t.type as type, t.category as category, t.fundamental_analysis as fundamental, t.medium_analysis as medium, t.current_analysis as current, t.drivers as drivers, t.last_analyzed as last_analyzed, t.last_updated as last_updated"
-results = run_cypher(q)
-if results:
-    print(json.dumps(results[0], default=str))
-else:
-    print(json.dumps({{"error": "Topic not found"}}))
-'"""
-    result = run_command(cmd, timeout=30)
+    try:
+        results = await run_cypher("""
+            MATCH (t:Topic {id: $topic_id})
+            RETURN t.id as id, t.name as name, t.type as type, t.category as category,
+                   t.fundamental_analysis as fundamental, t.medium_analysis as medium,
+                   t.current_analysis as current, t.drivers as drivers,
+                   t.last_analyzed as last_analyzed, t.last_updated as last_updated
+        """, {"topic_id": topic_id})
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+
+    if not results:
+        return {"error": "Topic not found"}
+    data = results[0]
+    return {
+        "topic_id": topic_id,
+        "analysis": {
+            "fundamental": data["fundamental"],
+            "medium": data["medium"],
+            "current": data["current"],
+            "drivers": data["drivers"]
+        },
+        "metadata": {
+            "name": data["name"],
+            "type": data["type"],
+            "category": data["category"],
+            "last_analyzed": data["last_analyzed"],
+            "last_updated": data["last_updated"]
+        }
+    }
 
-    if result["success"]:
-        try:
-            data = json.loads(result["stdout"])
-            return {
-                "topic_id": topic_id,
-                "analysis": {
-                    "fundamental": data.get("fundamental"),
-                    "medium": data.get("medium"),
-                    "current": data.get("current"),
-                    "drivers": data.get("drivers")
-                },
-                "metadata": {
-                    "name": data.get("name"),
-                    "type": data.get("type"),
-                    "category": data.get("category"),
-                    "last_analyzed": data.get("last_analyzed"),
-                    "last_updated": data.get("last_updated")
-                }
-            }
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+
+# (relationship type, is outgoing) -> response bucket; only INFLUENCES splits by direction
+RELATIONSHIP_BUCKETS = {
+    ("INFLUENCES", True): "influences",
+    ("INFLUENCES", False): "influenced_by",
+    ("CORRELATES_WITH", True): "correlates_with",
+    ("CORRELATES_WITH", False): "correlates_with",
+    ("HEDGES", True): "hedges",
+    ("HEDGES", False): "hedges",
+    ("PEERS", True): "peers",
+    ("PEERS", False): "peers",
+}
 
 
 @app.get("/mcp/tools/topic_relationships", dependencies=[Depends(verify_api_key)])
-async def topic_relationships(topic_id: str):
+async def topic_relationships(topic_id: IdParam):
     """Get all relationships for a topic with strength and mechanisms."""
-    cmd = f"""docker exec -w /app/graph-functions apis python -c '
-import json
-from src.graph.neo4j_client import run_cypher
-outgoing = run_cypher("MATCH (t:Topic {{id: \\"{topic_id}\\"}})-[r]->(t2:Topic) RETURN type(r) as rel_type, t2.id as target_id, t2.name as target_name, r.strength as strength, r.mechanism as mechanism")
-incoming = run_cypher("MATCH (t2:Topic)-[r]->(t:Topic {{id: \\"{topic_id}\\"}}) RETURN type(r) as rel_type, t2.id as source_id, t2.name as source_name, r.strength as strength, r.mechanism as mechanism")
-print(json.dumps({{"outgoing": outgoing, "incoming": incoming}}, default=str))
-'"""
-    result = run_command(cmd, timeout=30)
+    try:
+        rows = await run_cypher("""
+            MATCH (t:Topic {id: $topic_id})-[r]-(t2:Topic)
+            RETURN type(r) as rel_type, startNode(r) = t as is_out, t2.id as other_id,
+                   t2.name as other_name, r.strength as strength, r.mechanism as mechanism
+        """, {"topic_id": topic_id})
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+
+    # Organize by relationship type in one pass
+    relationships = {bucket: [] for bucket in RELATIONSHIP_BUCKETS.values()}
+    total_outgoing = 0
+    for row in rows:
+        rel_type, is_out = row["rel_type"], row["is_out"]
+        end = "target" if is_out else "source"
+        rel = {
+            "rel_type": rel_type,
+            f"{end}_id": row["other_id"],
+            f"{end}_name": row["other_name"],
+            "strength": row["strength"],
+            "mechanism": row["mechanism"]
+        }
+        total_outgoing += is_out
+        bucket = RELATIONSHIP_BUCKETS.get((rel_type, is_out))
+        if bucket:
+            relationships[bucket].append(rel)
 
-    if result["success"]:
-        try:
-            data = json.loads(result["stdout"])
-            # Organize by relationship type
-            influences_out = [r for r in data.get("outgoing", []) if r.get("rel_type") == "INFLUENCES"]
-            influences_in = [r for r in data.get("incoming", []) if r.get("rel_type") == "INFLUENCES"]
-            correlates = [r for r in data.get("outgoing", []) + data.get("incoming", []) if r.get("rel_type") == "CORRELATES_WITH"]
-            hedges = [r for r in data.get("outgoing", []) + data.get("incoming", []) if r.get("rel_type") == "HEDGES"]
-            peers = [r for r in data.get("outgoing", []) + data.get("incoming", []) if r.get("rel_type") == "PEERS"]
+    return {
+        "topic_id": topic_id,
+        "relationships": relationships,
+        "counts": {
+            "total_outgoing": total_outgoing,
+            "total_incoming": len(rows) - total_outgoing
+        }
+    }
 
-            return {
-                "topic_id": topic_id,
-                "relationships": {
-                    "influences": influences_out,
-                    "influenced_by": influences_in,
-                    "correlates_with": correlates,
-                    "hedges": hedges,
-                    "peers": peers
-                },
-                "counts": {
-                    "total_outgoing": len(data.get("outgoing", [])),
-                    "total_incoming": len(data.get("incoming", []))
-                }
-            }
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
 
+INFLUENCE_MAP_MAX_DEPTH = 4
+# One hop of the influence BFS in each direction; the frontier is bound as a parameter
+_INFLUENCE_HOP_QUERIES = {
+    "outward": """
+        MATCH (f:Topic)-[r:INFLUENCES]->(t:Topic)
+        WHERE f.id IN $frontier
+        RETURN f.id as from_id, f.name as from_name, t.id as to_id, t.name as to_name,
+               r.strength as strength, r.mechanism as mechanism
+    """,
+    "inward": """
+        MATCH (f:Topic)-[r:INFLUENCES]->(t:Topic)
+        WHERE t.id IN $frontier
+        RETURN f.id as from_id, f.name as from_name, t.id as to_id, t.name as to_name,
+               r.strength as strength, r.mechanism as mechanism
+    """,
+}
 
-@app.get("/mcp/tools/topic_influence_map", dependencies=[Depends(verify_api_key)])
-async def topic_influence_map(topic_id: str, depth: int = 2):
-    """Get full influence graph for a topic - N hops deep."""
-    cmd = f"""docker exec -w /app/graph-functions apis python -c '
-import json
-from src.graph.neo4j_client import run_cypher
-outward = run_cypher("MATCH path = (start:Topic {{id: \\"{topic_id}\\"}})-[:INFLUENCES*1..{depth}]->(end:Topic) WITH nodes(path) as topics, relationships(path) as rels UNWIND range(0, size(rels)-1) as idx RETURN topics[idx].id as from_id, topics[idx].name as from_name, topics[idx+1].id as to_id, topics[idx+1].name as to_name, rels[idx].strength as strength, rels[idx].mechanism as mechanism, idx + 1 as hop")
-inward = run_cypher("MATCH path = (start:Topic)-[:INFLUENCES*1..{depth}]->(end:Topic {{id: \\"{topic_id}\\"}}) WITH nodes(path) as topics, relationships(path) as rels UNWIND range(0, size(rels)-1) as idx RETURN topics[idx].id as from_id, topics[idx].name as from_name, topics[idx+1].id as to_id, topics[idx+1].name as to_name, rels[idx].strength as strength, rels[idx].mechanism as mechanism, idx + 1 as hop")
-print(json.dumps({{"influences_outward": outward, "influenced_by": inward}}, default=str))
-'"""
-    result = run_command(cmd, timeout=60)
 
-    if result["success"]:
-        try:
-            data = json.loads(result["stdout"])
-            return {
-                "topic_id": topic_id,
-                "depth": depth,
-                "influence_map": data,
-                "summary": {
-                    "outward_connections": len(data.get("influences_outward", [])),
-                    "inward_connections": len(data.get("influenced_by", []))
-                }
-            }
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+async def _influence_bfs(topic_id: str, direction: str, depth: int) -> list:
+    """Expand INFLUENCES edges level by level, visiting each topic once."""
+    query = _INFLUENCE_HOP_QUERIES[direction]
+    next_key = "to_id" if direction == "outward" else "from_id"
+    visited = {topic_id}
+    frontier = [topic_id]
+    edges = []
+    for hop in range(1, depth + 1):
+        rows = await run_cypher(query, {"frontier": frontier}, read_only=True)
+        frontier = []
+        for row in rows:
+            row["hop"] = hop
+            edges.append(row)
+            if row[next_key] not in visited:
+                visited.add(row[next_key])
+                frontier.append(row[next_key])
+        if not frontier:
+            break
+    return edges
+
+
+@raw_json_get("/mcp/tools/topic_influence_map")
+async def topic_influence_map(topic_id: IdParam, depth: int = 2):
+    """Get full influence graph for a topic - N hops deep (1-4)."""
+    depth = max(1, min(depth, INFLUENCE_MAP_MAX_DEPTH))
+    try:
+        outward, inward = await asyncio.gather(
+            _influence_bfs(topic_id, "outward", depth),
+            _influence_bfs(topic_id, "inward", depth)
+        )
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+
+    return {
+        "topic_id": topic_id,
+        "depth": depth,
+        "influence_map": {"influences_outward": outward, "influenced_by": inward},
+        "summary": {
+            "outward_connections": len(outward),
+            "inward_connections": len(inward)
+        }
+    }
 
 
-@app.get("/mcp/tools/topic_coverage_gaps", dependencies=[Depends(verify_api_key)])
+@raw_json_get("/mcp/tools/topic_coverage_gaps")
 async def topic_coverage_gaps(stale_days: int = 7):
     """Find topics with stale/missing analysis."""
-    cmd = f"""docker exec -w /app/graph-functions apis python -c '
-import json
-from src.graph.neo4j_client import run_cypher
-never_analyzed = run_cypher("MATCH (t:Topic) WHERE t.fundamental_analysis IS NULL AND t.current_analysis IS NULL OPTIONAL MATCH (a:Article)-[:ABOUT]->(t) RETURN t.id as topic_id, t.name as topic_name, count(a) as article_count ORDER BY article_count DESC")
-stale = run_cypher("MATCH (t:Topic) WHERE t.last_analyzed IS NOT NULL AND t.last_analyzed < datetime() - duration(\\"P{stale_days}D\\") OPTIONAL MATCH (a:Article)-[:ABOUT]->(t) WITH t, count(a) as article_count RETURN t.id as topic_id, t.name as topic_name, t.last_analyzed as last_analyzed, article_count ORDER BY t.last_analyzed ASC")
-starving = run_cypher("MATCH (t:Topic) OPTIONAL MATCH (a:Article)-[:ABOUT]->(t) WITH t, count(a) as article_count WHERE article_count < 5 RETURN t.id as topic_id, t.name as topic_name, article_count ORDER BY article_count ASC")
-print(json.dumps({{"never_analyzed": never_analyzed, "stale_analysis": stale, "starving_topics": starving, "summary": {{"never_analyzed_count": len(never_analyzed), "stale_count": len(stale), "starving_count": len(starving)}}}}, default=str))
-'"""
-    result = run_command(cmd, timeout=60)
-
-    if result["success"]:
-        try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+    # One round-trip: each UNION branch collects its bucket in display order
+    try:
+        rows = await run_cypher("""
+            CALL {
+                MATCH (t:Topic)
+                WHERE t.fundamental_analysis IS NULL AND t.current_analysis IS NULL
+                OPTIONAL MATCH (a:Article)-[:ABOUT]->(t)
+                WITH t, count(a) as article_count
+                ORDER BY article_count DESC
+                RETURN "never_analyzed" as bucket,
+                       collect({topic_id: t.id, topic_name: t.name, article_count: article_count}) as topics
+                UNION ALL
+                MATCH (t:Topic)
+                WHERE t.last_analyzed IS NOT NULL AND t.last_analyzed < $cutoff
+                OPTIONAL MATCH (a:Article)-[:ABOUT]->(t)
+                WITH t, count(a) as article_count
+                ORDER BY t.last_analyzed ASC
+                RETURN "stale_analysis" as bucket,
+                       collect({topic_id: t.id, topic_name: t.name, last_analyzed: t.last_analyzed,
+                                article_count: article_count}) as topics
+                UNION ALL
+                MATCH (t:Topic)
+                OPTIONAL MATCH (a:Article)-[:ABOUT]->(t)
+                WITH t, count(a) as article_count
+                WHERE article_count < 5
+                ORDER BY article_count ASC
+                RETURN "starving_topics" as bucket,
+                       collect({topic_id: t.id, topic_name: t.name, article_count: article_count}) as topics
+            }
+            RETURN bucket, topics
+        """, {"cutoff": datetime.now(timezone.utc) - timedelta(days=stale_days)})
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+
+    buckets = {row["bucket"]: row["topics"] for row in rows}
+    never_analyzed = buckets.get("never_analyzed", [])
+    stale = buckets.get("stale_analysis", [])
+    starving = buckets.get("starving_topics", [])
+    return {
+        "never_analyzed": never_analyzed,
+        "stale_analysis": stale,
+        "starving_topics": starving,
+        "summary": {
+            "never_analyzed_count": len(never_analyzed),
+            "stale_count": len(stale),
+            "starving_count": len(starving)
+        }
+    }
 
 
 # =============================================================================
@@ -2545,24 +3369,23 @@ print(json.dumps({{"never_analyzed": never_analyzed, "stale_analysis": stale, "s
 # =============================================================================
 
 @app.get("/mcp/tools/topic_mapping_result", dependencies=[Depends(verify_api_key)])
-async def topic_mapping_result(username: str, strategy_id: str):
+async def topic_mapping_result(username: IdParam, strategy_id: IdParam):
     """See how a strategy was mapped to topics."""
-    # Get strategy topics from API
-    url = f"http://apis:8000/api/users/{username}/strategies/{strategy_id}/topics"
-    result = run_command(f"curl -s '{url}'", timeout=10)
+    # Get strategy topics from API, and the strategy itself to show the thesis
+    result, strategy_result = await asyncio.gather(
+        fetch_api(f"/api/users/{username}/strategies/{strategy_id}/topics"),
+        fetch_api(f"/api/users/{username}/strategies/{strategy_id}")
+    )
 
     if result["success"]:
         try:
-            topics_data = json.loads(result["stdout"])
+            topics_data = orjson.loads(result["text"])
 
-            # Also get the strategy to show the thesis
-            strategy_url = f"http://apis:8000/api/users/{username}/strategies/{strategy_id}"
-            strategy_result = run_command(f"curl -s '{strategy_url}'", timeout=10)
             strategy_data = {}
             if strategy_result["success"]:
                 try:
-                    strategy_data = json.loads(strategy_result["stdout"])
-                except:
+                    strategy_data = orjson.loads(strategy_result["text"])
+                except orjson.JSONDecodeError:
                     pass
 
             return {
@@ -2572,21 +3395,20 @@ async def topic_mapping_result(username: str, strategy_id: str):
                 "topic_mapping": topics_data,
                 "topic_count": len(topics_data) if isinstance(topics_data, list) else 0
             }
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"]}
-    return {"error": result["stderr"], "success": False}
+        except orjson.JSONDecodeError:
+            return {"raw_output": result["text"]}
+    return {"error": result["error"], "success": False}
 
 
 @app.get("/mcp/tools/exploration_paths", dependencies=[Depends(verify_api_key)])
-async def exploration_paths(username: str, strategy_id: str):
+async def exploration_paths(username: IdParam, strategy_id: IdParam):
     """Get chain reactions discovered by Exploration Agent for a strategy."""
     # Get strategy analysis which contains exploration results
-    url = f"http://apis:8000/api/users/{username}/strategies/{strategy_id}/analysis"
-    result = run_command(f"curl -s '{url}'", timeout=10)
+    result = await fetch_api(f"/api/users/{username}/strategies/{strategy_id}/analysis")
 
     if result["success"]:
         try:
-            data = json.loads(result["stdout"])
+            data = orjson.loads(result["text"])
             # Extract chain reactions from analysis if present
             chain_reactions = data.get("chain_reactions", [])
             exploration = data.get("exploration", {})
@@ -2598,33 +3420,36 @@ async def exploration_paths(username: str, strategy_id: str):
                 "exploration_output": exploration,
                 "note": "Chain reactions are multi-hop influence paths discovered by the Exploration Agent"
             }
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"]}
-    return {"error": result["stderr"], "success": False}
+        except orjson.JSONDecodeError:
+            return {"raw_output": result["text"]}
+    return {"error": result["error"], "success": False}
+
+
+# Analysis keys each agent's output is stored under: (current name, legacy name)
+AGENT_KEYS = {
+    "risk_assessor": ("risks", "risk_assessment"),
+    "opportunity_finder": ("opportunities", "opportunity_assessment"),
+    "exploration": ("exploration", "chain_reactions"),
+    "strategy_writer": ("summary", "strategy_summary"),
+    "topic_mapper": ("topics", "topic_mapping"),
+}
 
 
 @app.get("/mcp/tools/agent_outputs", dependencies=[Depends(verify_api_key)])
-async def agent_outputs(username: str, strategy_id: str, agent: str = None):
+async def agent_outputs(username: IdParam, strategy_id: IdParam, agent: str = None):
     """Get raw outputs from specific agents for a strategy."""
-    url = f"http://apis:8000/api/users/{username}/strategies/{strategy_id}/analysis"
-    result = run_command(f"curl -s '{url}'", timeout=10)
+    result = await fetch_api(f"/api/users/{username}/strategies/{strategy_id}/analysis")
 
     if result["success"]:
         try:
-            data = json.loads(result["stdout"])
+            data = orjson.loads(result["text"])
 
             # Extract agent-specific outputs
-            outputs = {}
-            if not agent or agent == "risk_assessor":
-                outputs["risk_assessor"] = data.get("risks", data.get("risk_assessment", {}))
-            if not agent or agent == "opportunity_finder":
-                outputs["opportunity_finder"] = data.get("opportunities", data.get("opportunity_assessment", {}))
-            if not agent or agent == "exploration":
-                outputs["exploration"] = data.get("exploration", data.get("chain_reactions", {}))
-            if not agent or agent == "strategy_writer":
-                outputs["strategy_writer"] = data.get("summary", data.get("strategy_summary", {}))
-            if not agent or agent == "topic_mapper":
-                outputs["topic_mapper"] = data.get("topics", data.get("topic_mapping", {}))
+            wanted = [agent] if agent else AGENT_KEYS
+            outputs = {
+                name: data.get(AGENT_KEYS[name][0], data.get(AGENT_KEYS[name][1], {}))
+                for name in wanted if name in AGENT_KEYS
+            }
 
             return {
                 "strategy_id": strategy_id,
@@ -2633,47 +3458,56 @@ async def agent_outputs(username: str, strategy_id: str, agent: str = None):
                 "outputs": outputs,
                 "generated_at": data.get("generated_at", data.get("updated_at"))
             }
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"]}
-    return {"error": result["stderr"], "success": False}
+        except orjson.JSONDecodeError:
+            return {"raw_output": result["text"]}
+    return {"error": result["error"], "success": False}
 
 
 # =============================================================================
 # GOD-TIER TOOLS - Worker & Pipeline Monitoring
 # =============================================================================
 
+async def _inspect_container(service: str) -> Optional[dict]:
+    """The daemon's inspect document for a container, or None if it can't be read."""
+    try:
+        return await asyncio.to_thread(get_docker_client().api.inspect_container, service)
+    except DockerException:
+        return None
+
+
 @app.get("/mcp/tools/worker_status", dependencies=[Depends(verify_api_key)])
 async def worker_status():
     """Status of all workers with last run times."""
     workers = {}
+    services = ["worker-main", "worker-sources"]
+    # Container state and recent logs for last activity, read for both workers at once
+    activity, *inspected = await asyncio.gather(
+        search_services_logs(services, WORKER_ACTIVITY_PATTERN, None, 5, tail=50),
+        *(_inspect_container(service) for service in services)
+    )
 
     # Check each worker service
-    for service in ["worker-main", "worker-sources"]:
-        # Get container status
-        status_result = run_command(
-            f"docker inspect {service} --format '{{{{.State.Status}}}} {{{{.State.StartedAt}}}}'",
-            timeout=5
-        )
-
-        # Get recent logs for last activity
-        logs_result = run_command(
-            f"docker logs --tail 50 {service} 2>&1 | grep -E '(SUCCESS|ERROR|Started|Completed|Processing)' | tail -5",
-            timeout=10
-        )
-
+    for service, info in zip(services, inspected):
+        state = info["State"] if info else {}
         workers[service] = {
-            "status": status_result["stdout"].split()[0] if status_result["success"] else "unknown",
-            "started_at": status_result["stdout"].split()[1] if status_result["success"] and len(status_result["stdout"].split()) > 1 else "unknown",
-            "recent_activity": logs_result["stdout"].strip().split("\n") if logs_result["success"] else []
+            "status": state.get("Status", "unknown"),
+            "started_at": state.get("StartedAt", "unknown"),
+            "recent_activity": activity[service] or []
         }
 
-    # Get WORKER_MODE from environment
-    mode_result = run_command("docker exec worker-main printenv WORKER_MODE 2>/dev/null", timeout=5)
+    # Get WORKER_MODE from worker-main's configured environment
+    worker_mode = "unknown"
+    main_info = inspected[0]
+    for var in (main_info["Config"].get("Env") or []) if main_info else []:
+        name, _, value = var.partition("=")
+        if name == "WORKER_MODE":
+            worker_mode = value
+            break
 
     return {
         "workers": workers,
-        "worker_mode": mode_result["stdout"].strip() if mode_result["success"] else "unknown",
-        "timestamp": datetime.utcnow().isoformat()
+        "worker_mode": worker_mode,
+        "timestamp": iso_now()
     }
 
 
@@ -2683,20 +3517,15 @@ async def failed_jobs(hours: int = 24):
     failures = []
 
     # Search for errors in each service
-    for service in ["worker-main", "worker-sources", "apis"]:
-        result = run_command(
-            f"docker logs --since {hours}h {service} 2>&1 | grep -iE '(ERROR|Exception|FAILED|Traceback)' | tail -20",
-            timeout=30
-        )
-
-        if result["success"] and result["stdout"].strip():
-            for line in result["stdout"].strip().split("\n"):
-                if line:
-                    failures.append({
-                        "service": service,
-                        "message": line[:500],
-                        "type": "error"
-                    })
+    since = int(time.time()) - hours * 3600
+    matches = await search_services_logs(["worker-main", "worker-sources", "apis"], FAILURE_PATTERN, since, 20)
+    for service, lines in matches.items():
+        for line in lines or []:
+            failures.append({
+                "service": service,
+                "message": line[:500],
+                "type": "error"
+            })
 
     return {
         "hours_searched": hours,
@@ -2708,165 +3537,232 @@ async def failed_jobs(hours: int = 24):
     }
 
 
+# Fixed text with bound cutoffs - one plan, and the created_at/last_analyzed
+# range indexes can seek instead of filtering every node
+PROCESSING_BACKLOG_QUERY = """
+    CALL {
+        MATCH (a:Article)
+        WHERE a.created_at > $cutoff_7d AND NOT (a)-[:ABOUT]->(:Topic)
+        RETURN count(a) as pending_topics
+    }
+    CALL {
+        MATCH (t:Topic)
+        WHERE t.last_analyzed IS NULL OR t.last_analyzed < $cutoff_7d
+        RETURN count(t) as pending_analysis
+    }
+    CALL {
+        MATCH (a:Article)
+        WHERE a.created_at > $cutoff_6h AND (a.processed IS NULL OR a.processed = false)
+        RETURN count(a) as recent_unprocessed
+    }
+    RETURN pending_topics, pending_analysis, recent_unprocessed
+"""
+
+
 @app.get("/mcp/tools/processing_backlog", dependencies=[Depends(verify_api_key)])
 async def processing_backlog():
     """What's waiting to be processed."""
-    cmd = """docker exec -w /app/graph-functions apis python -c '
-import json
-from src.graph.neo4j_client import run_cypher
-pending_topics = run_cypher("MATCH (a:Article) WHERE NOT (a)-[:ABOUT]->(:Topic) AND a.created_at > datetime() - duration(\\"P7D\\") RETURN count(a) as count")[0]["count"]
-pending_analysis = run_cypher("MATCH (t:Topic) WHERE t.last_analyzed IS NULL OR t.last_analyzed < datetime() - duration(\\"P7D\\") RETURN count(t) as count")[0]["count"]
-recent_unprocessed = run_cypher("MATCH (a:Article) WHERE a.created_at > datetime() - duration(\\"PT6H\\") AND (a.processed IS NULL OR a.processed = false) RETURN count(a) as count")[0]["count"]
-print(json.dumps({"pending_topic_assignment": pending_topics, "pending_analysis_refresh": pending_analysis, "recent_unprocessed": recent_unprocessed, "health": "nominal" if (pending_topics < 100 and pending_analysis < 20) else "backlogged"}, default=str))
-'"""
-    result = run_command(cmd, timeout=30)
-
-    if result["success"]:
-        try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+    now = datetime.now(timezone.utc)
+    try:
+        counts = (await run_cypher(PROCESSING_BACKLOG_QUERY, {
+            "cutoff_7d": now - timedelta(days=7),
+            "cutoff_6h": now - timedelta(hours=6)
+        }))[0]
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+
+    pending_topics = counts["pending_topics"]
+    pending_analysis = counts["pending_analysis"]
+    recent_unprocessed = counts["recent_unprocessed"]
+    return {
+        "pending_topic_assignment": pending_topics,
+        "pending_analysis_refresh": pending_analysis,
+        "recent_unprocessed": recent_unprocessed,
+        "health": "nominal" if (pending_topics < 100 and pending_analysis < 20) else "backlogged"
+    }
 
 
 @app.get("/mcp/tools/ingestion_stats", dependencies=[Depends(verify_api_key)])
 async def ingestion_stats(days: int = 7):
     """Article ingestion stats by source and day."""
-    cmd = f"""docker exec -w /app/graph-functions apis python -c '
-import json
-from src.graph.neo4j_client import run_cypher
-by_source = run_cypher("MATCH (a:Article) WHERE a.created_at > datetime() - duration(\\"P{days}D\\") RETURN a.source as source, count(a) as count ORDER BY count DESC")
-by_day = run_cypher("MATCH (a:Article) WHERE a.created_at > datetime() - duration(\\"P{days}D\\") RETURN date(a.created_at) as day, count(a) as count ORDER BY day DESC")
-total = run_cypher("MATCH (a:Article) WHERE a.created_at > datetime() - duration(\\"P{days}D\\") RETURN count(a) as total")[0]["total"]
-print(json.dumps({{"by_source": by_source, "by_day": by_day, "total_articles": total, "days": {days}, "avg_per_day": round(total / {days}, 1)}}, default=str))
-'"""
-    result = run_command(cmd, timeout=30)
+    # One scan of the window grouped by (source, day); both breakdowns and the total fold out of it
+    try:
+        rows = await run_cypher("""
+            MATCH (a:Article)
+            WHERE a.created_at > $cutoff
+            RETURN a.source as source, date(a.created_at) as day, count(*) as count
+        """, {"cutoff": datetime.now(timezone.utc) - timedelta(days=days)})
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+
+    source_counts = defaultdict(int)
+    day_counts = defaultdict(int)
+    for row in rows:
+        source_counts[row["source"]] += row["count"]
+        day_counts[row["day"]] += row["count"]
+    by_source = [
+        {"source": source, "count": count}
+        for source, count in sorted(source_counts.items(), key=lambda item: item[1], reverse=True)
+    ]
+    by_day = [{"day": day, "count": count} for day, count in sorted(day_counts.items(), reverse=True)]
+    total = sum(source_counts.values())
 
-    if result["success"]:
-        try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+    return {
+        "by_source": by_source,
+        "by_day": by_day,
+        "total_articles": total,
+        "days": days,
+        "avg_per_day": round(total / days, 1)
+    }
 
 
 # =============================================================================
 # GOD-TIER TOOLS - Article Endpoints
 # =============================================================================
 
-@app.get("/mcp/tools/article_detail", dependencies=[Depends(verify_api_key)])
-async def article_detail(article_id: str):
+@raw_json_get("/mcp/tools/article_detail")
+@ttl_cache(seconds=60, maxsize=4096)
+async def article_detail(article_id: IdParam):
     """Get full article content + classification + topic assignments."""
-    cmd = f"""docker exec -w /app/graph-functions apis python -c '
-import json
-from src.graph.neo4j_client import run_cypher
-results = run_cypher("MATCH (a:Article {{id: \\"{article_id}\\"}}) OPTIONAL MATCH (a)-[r:ABOUT]->(t:Topic) RETURN a.id as id, a.title as title, a.source as source, a.url as url, a.content as content, a.summary as summary, a.published_at as published_at, a.created_at as created_at, a.classification as classification, a.category as category, collect({{topic_id: t.id, topic_name: t.name, importance_risk: r.importance_risk, importance_opportunity: r.importance_opportunity}}) as topics")
-if results:
-    print(json.dumps(results[0], default=str))
-else:
-    print(json.dumps({{"error": "Article not found"}}))
-'"""
-    result = run_command(cmd, timeout=30)
+    try:
+        results = await run_cypher("""
+            MATCH (a:Article {id: $article_id})
+            OPTIONAL MATCH (a)-[r:ABOUT]->(t:Topic)
+            RETURN a.id as id, a.title as title, a.source as source, a.url as url,
+                   a.content as content, a.summary as summary,
+                   a.published_at as published_at, a.created_at as created_at,
+                   a.classification as classification, a.category as category,
+                   collect({topic_id: t.id, topic_name: t.name,
+                            importance_risk: r.importance_risk,
+                            importance_opportunity: r.importance_opportunity}) as topics
+        """, {"article_id": article_id})
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+
+    if not results:
+        return {"error": "Article not found"}
+    return results[0]
+
+
+# Lucene query syntax characters; escaped so a search term is matched literally
+LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+# Boolean operators - only the upper-case forms are syntax, and the analyzer
+# lower-cases terms anyway, so lower-casing them keeps them plain words
+LUCENE_OPERATORS = re.compile(r"\b(?:AND|OR|NOT)\b")
+
+
+def lucene_literal(text: str) -> str:
+    """Escape a user search term so queryNodes matches it as plain words."""
+    text = LUCENE_OPERATORS.sub(lambda m: m.group().lower(), text)
+    return LUCENE_SPECIAL.sub(r"\\\1", text)
+
+
+SEARCH_ARTICLES_QUERY = """
+    CALL db.index.fulltext.queryNodes('article_fts', $query) YIELD node AS a, score
+    WHERE ($since IS NULL OR a.published_at >= $since)
+      AND ($topic_id IS NULL OR EXISTS { (a)-[:ABOUT]->(:Topic {id: $topic_id}) })
+    RETURN a.id as id, a.title as title, a.source as source,
+           a.published_at as published_at, a.summary as summary, score
+    ORDER BY score DESC, a.published_at DESC
+    LIMIT $limit
+"""
 
-    if result["success"]:
-        try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+# Used until article_fts exists (startup schema not applied yet, or Neo4j was down)
+SEARCH_ARTICLES_SCAN_QUERY = """
+    MATCH (a:Article)
+    WHERE (toLower(a.title) CONTAINS $text OR toLower(a.content) CONTAINS $text)
+      AND ($since IS NULL OR a.published_at >= $since)
+      AND ($topic_id IS NULL OR EXISTS { (a)-[:ABOUT]->(:Topic {id: $topic_id}) })
+    RETURN a.id as id, a.title as title, a.source as source,
+           a.published_at as published_at, a.summary as summary, null as score
+    ORDER BY a.published_at DESC
+    LIMIT $limit
+"""
 
 
 @app.get("/mcp/tools/search_articles", dependencies=[Depends(verify_api_key)])
-async def search_articles_tool(query: str, topic_id: str = None, since: str = None, limit: int = 20):
-    """Search articles by keyword, date range, topic."""
-    import base64
-    # Build cypher query
-    where_clauses = [f"a.title =~ '(?i).*{query}.*' OR a.content =~ '(?i).*{query}.*'"]
-
-    if topic_id:
-        topic_match = f"MATCH (a)-[:ABOUT]->(t:Topic {{id: '{topic_id}'}})"
-    else:
-        topic_match = "OPTIONAL MATCH (a)-[:ABOUT]->(t:Topic)"
-
-    if since:
-        where_clauses.append(f"a.published_at >= '{since}'")
-
-    where_clause = " AND ".join(where_clauses)
-    search_q = f"MATCH (a:Article) {topic_match} WHERE {where_clause} RETURN DISTINCT a.id as id, a.title as title, a.source as source, a.published_at as published_at, a.summary as summary ORDER BY a.published_at DESC LIMIT {limit}"
-
-    # Encode query to avoid shell escaping issues
-    encoded_q = base64.b64encode(search_q.encode()).decode()
-
-    cmd = f"""docker exec -w /app/graph-functions apis python -c '
-import json, base64
-from src.graph.neo4j_client import run_cypher
-q = base64.b64decode("{encoded_q}").decode()
-results = run_cypher(q)
-print(json.dumps(results, default=str))
-'"""
-    result = run_command(cmd, timeout=30)
-
-    if result["success"]:
+async def search_articles_tool(query: str, topic_id: Optional[IdParam] = None, since: str = None, limit: int = 20):
+    """Search articles by keyword, date range, topic - best matches first."""
+    params = {
+        "query": lucene_literal(query),
+        "text": query.lower(),
+        "topic_id": topic_id,
+        "since": since,
+        "limit": limit
+    }
+    try:
         try:
-            articles = json.loads(result["stdout"])
-            return {
-                "query": query,
-                "topic_filter": topic_id,
-                "since": since,
-                "articles": articles,
-                "count": len(articles)
-            }
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+            articles = await run_cypher(SEARCH_ARTICLES_QUERY, params)
+        except Neo4jError as e:
+            if "article_fts" not in str(e.message):
+                raise
+            # "There is no such fulltext schema index" - search the slow way meanwhile
+            articles = await run_cypher(SEARCH_ARTICLES_SCAN_QUERY, params)
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+
+    return {
+        "query": query,
+        "topic_filter": topic_id,
+        "since": since,
+        "articles": articles,
+        "count": len(articles)
+    }
 
 
 @app.get("/mcp/tools/source_stats", dependencies=[Depends(verify_api_key)])
 async def source_stats(days: int = 7):
     """Article counts by source with quality indicators."""
-    cmd = f"""docker exec -w /app/graph-functions apis python -c '
-import json
-from src.graph.neo4j_client import run_cypher
-stats = run_cypher("MATCH (a:Article) WHERE a.created_at > datetime() - duration(\\"P{days}D\\") RETURN a.source as source, count(a) as article_count ORDER BY article_count DESC")
-print(json.dumps({{"sources": stats, "days": {days}}}, default=str))
-'"""
-    result = run_command(cmd, timeout=30)
-
-    if result["success"]:
-        try:
-            return json.loads(result["stdout"])
-        except json.JSONDecodeError:
-            return {"raw_output": result["stdout"], "success": True}
-    return {"error": result["stderr"], "success": False}
+    try:
+        stats = await run_cypher("""
+            MATCH (a:Article)
+            WHERE a.created_at > $cutoff
+            RETURN a.source as source, count(a) as article_count
+            ORDER BY article_count DESC
+        """, {"cutoff": datetime.now(timezone.utc) - timedelta(days=days)})
+    except (Neo4jError, DriverError) as e:
+        return {"error": str(e), "success": False}
+    return {"sources": stats, "days": days}
 
 
 # =============================================================================
 # GOD-TIER TOOLS - Cross-Cutting Analysis
 # =============================================================================
 
+# Thesis phrase checks - substring alternations compiled once instead of any() over lists
+CAUSAL_INDICATORS = re.compile("|".join(map(re.escape, [
+    "→", "because", "leads to", "causes", "drives", "if", "then", "when"
+])))
+INVALIDATION_INDICATORS = re.compile("|".join(map(re.escape, [
+    "dies if", "wrong if", "risk:", "breaks if", "invalid"
+])))
+
+
 @app.get("/mcp/tools/strategy_health_check", dependencies=[Depends(verify_api_key)])
-async def strategy_health_check(username: str, strategy_id: str):
+async def strategy_health_check(username: IdParam, strategy_id: IdParam):
     """Diagnose why a strategy might be getting poor analysis."""
     issues = []
     strengths = []
 
+    # Strategy details and topic mapping are independent - fetch both at once
+    strategy_result, topics_result = await asyncio.gather(
+        fetch_api(f"/api/users/{username}/strategies/{strategy_id}"),
+        fetch_api(f"/api/users/{username}/strategies/{strategy_id}/topics")
+    )
+
     # 1. Get strategy details
-    strategy_url = f"http://apis:8000/api/users/{username}/strategies/{strategy_id}"
-    strategy_result = run_command(f"curl -s '{strategy_url}'", timeout=10)
     strategy_data = {}
     if strategy_result["success"]:
         try:
-            strategy_data = json.loads(strategy_result["stdout"])
-        except:
+            strategy_data = orjson.loads(strategy_result["text"])
+        except orjson.JSONDecodeError:
             issues.append({"severity": "high", "category": "data", "issue": "Cannot read strategy data"})
 
     # 2. Get topic mapping
-    topics_url = f"http://apis:8000/api/users/{username}/strategies/{strategy_id}/topics"
-    topics_result = run_command(f"curl -s '{topics_url}'", timeout=10)
     topics = []
     if topics_result["success"]:
         try:
-            topics = json.loads(topics_result["stdout"])
+            topics = orjson.loads(topics_result["text"])
             if isinstance(topics, list):
                 if len(topics) < 5:
                     issues.append({
@@ -2877,15 +3773,15 @@ async def strategy_health_check(username: str, strategy_id: str):
                     })
                 elif len(topics) >= 10:
                     strengths.append("Good topic coverage (10+ topics mapped)")
-        except:
+        except orjson.JSONDecodeError:
             pass
 
     # 3. Check thesis quality
     thesis = strategy_data.get("user_input", {}).get("strategy_text", "")
     if thesis:
+        thesis_lower = thesis.lower()
         # Check for causal mechanisms
-        causal_indicators = ["→", "because", "leads to", "causes", "drives", "if", "then", "when"]
-        has_causality = any(ind in thesis.lower() for ind in causal_indicators)
+        has_causality = CAUSAL_INDICATORS.search(thesis_lower) is not None
         if not has_causality:
             issues.append({
                 "severity": "medium",
@@ -2897,8 +3793,7 @@ async def strategy_health_check(username: str, strategy_id: str):
             strengths.append("Thesis contains causal mechanisms")
 
         # Check for invalidation signals
-        invalidation_indicators = ["dies if", "wrong if", "risk:", "breaks if", "invalid"]
-        has_invalidation = any(ind in thesis.lower() for ind in invalidation_indicators)
+        has_invalidation = INVALIDATION_INDICATORS.search(thesis_lower) is not None
         if not has_invalidation:
             issues.append({
                 "severity": "low",
@@ -2926,62 +3821,64 @@ async def strategy_health_check(username: str, strategy_id: str):
     }
 
 
-@app.get("/mcp/tools/cross_strategy_insights", dependencies=[Depends(verify_api_key)])
+async def _fetch_api_list(path: str) -> list:
+    """GET an API path that returns a JSON list; anything else counts as empty."""
+    result = await fetch_api(path)
+    if not result["success"]:
+        return []
+    try:
+        data = orjson.loads(result["text"])
+    except orjson.JSONDecodeError:
+        return []
+    return data if isinstance(data, list) else []
+
+
+@raw_json_get("/mcp/tools/cross_strategy_insights")
 async def cross_strategy_insights():
     """Find overlapping topics/risks across ALL strategies."""
-    # Get all users and their strategies
-    users_result = run_command("curl -s http://apis:8000/api/users", timeout=10)
+    # Get all users, then every user's strategies, then every strategy's topics -
+    # each level fans out concurrently over the shared API client
+    users = await _fetch_api_list("/api/users")
+    usernames = [
+        user.get("username") for user in users
+        if isinstance(user, dict) and user.get("username") and ID_PATTERN.fullmatch(user["username"])
+    ]
+    strategy_lists = await asyncio.gather(*(
+        _fetch_api_list(f"/api/users/{username}/strategies") for username in usernames
+    ))
 
-    all_topics = {}
     all_strategies = []
+    for username, strategies in zip(usernames, strategy_lists):
+        for strat in strategies:
+            if not isinstance(strat, dict):
+                continue
+            strat_id = strat.get("id")
+            strat_name = strat.get("asset", {}).get("primary", strat_id)
+            all_strategies.append({"username": username, "id": strat_id, "name": strat_name})
 
-    if users_result["success"]:
-        try:
-            users = json.loads(users_result["stdout"])
-            for user in users if isinstance(users, list) else []:
-                username = user.get("username")
-                if not username:
-                    continue
-
-                # Get strategies for this user
-                strat_result = run_command(f"curl -s 'http://apis:8000/api/users/{username}/strategies'", timeout=10)
-                if strat_result["success"]:
-                    try:
-                        strategies = json.loads(strat_result["stdout"])
-                        for strat in strategies if isinstance(strategies, list) else []:
-                            strat_id = strat.get("id")
-                            strat_name = strat.get("asset", {}).get("primary", strat_id)
-                            all_strategies.append({"username": username, "id": strat_id, "name": strat_name})
-
-                            # Get topics for this strategy
-                            topics_result = run_command(f"curl -s 'http://apis:8000/api/users/{username}/strategies/{strat_id}/topics'", timeout=10)
-                            if topics_result["success"]:
-                                try:
-                                    topics = json.loads(topics_result["stdout"])
-                                    for topic in topics if isinstance(topics, list) else []:
-                                        topic_id = topic.get("id", topic) if isinstance(topic, dict) else topic
-                                        if topic_id not in all_topics:
-                                            all_topics[topic_id] = []
-                                        all_topics[topic_id].append(strat_name)
-                                except:
-                                    pass
-                    except:
-                        pass
-        except:
-            pass
+    topic_lists = await asyncio.gather(*(
+        _fetch_api_list(f"/api/users/{strat['username']}/strategies/{strat['id']}/topics")
+        if isinstance(strat["id"], str) and ID_PATTERN.fullmatch(strat["id"]) else asyncio.sleep(0, [])
+        for strat in all_strategies
+    ))
+
+    all_topics = {}
+    for strat, topics in zip(all_strategies, topic_lists):
+        for topic in topics:
+            topic_id = topic.get("id", topic) if isinstance(topic, dict) else topic
+            all_topics.setdefault(topic_id, []).append(strat["name"])
 
-    # Find overlapping topics
-    overlapping = [
+    # Find overlapping topics - only the top 20 are returned, so select instead of sorting all
+    overlapping = heapq.nlargest(20, (
         {"topic": tid, "strategies": strats, "count": len(strats)}
         for tid, strats in all_topics.items()
         if len(strats) > 1
-    ]
-    overlapping.sort(key=lambda x: x["count"], reverse=True)
+    ), key=lambda x: x["count"])
 
     return {
         "total_strategies": len(all_strategies),
         "total_unique_topics": len(all_topics),
-        "overlapping_topics": overlapping[:20],
+        "overlapping_topics": overlapping,
         "highest_concentration": overlapping[0] if overlapping else None,
         "strategies": all_strategies
     }
@@ -2993,20 +3890,15 @@ async def system_activity_log(hours: int = 24):
     activity = []
 
     # Get recent logs from workers
-    for service in ["worker-main", "worker-sources", "apis"]:
-        result = run_command(
-            f"docker logs --since {hours}h {service} 2>&1 | grep -iE '(SUCCESS|COMPLETED|INGESTED|ANALYZED|UPDATED|CREATED)' | tail -30",
-            timeout=30
-        )
-
-        if result["success"] and result["stdout"].strip():
-            for line in result["stdout"].strip().split("\n"):
-                if line:
-                    activity.append({
-                        "service": service,
-                        "message": line[:300],
-                        "type": "activity"
-                    })
+    since = int(time.time()) - hours * 3600
+    matches = await search_services_logs(["worker-main", "worker-sources", "apis"], ACTIVITY_PATTERN, since, 30)
+    for service, lines in matches.items():
+        for line in lines or []:
+            activity.append({
+                "service": service,
+                "message": line[:300],
+                "type": "activity"
+            })
 
     # Sort by recency (assuming timestamps in log lines)
     activity = activity[-50:]  # Limit to 50 most recent
@@ -3015,7 +3907,7 @@ async def system_activity_log(hours: int = 24):
         "hours_searched": hours,
         "activity": activity,
         "count": len(activity),
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": iso_now()
     }
 
 
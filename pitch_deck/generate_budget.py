@@ -10,18 +10,39 @@ Generates Excel file with:
 - Multiple scenarios
 
 Usage:
-    python generate_budget.py [--output path/to/output.xlsx]
+    python generate_budget.py [--output path/to/output.xlsx] [--static]
 """
 
 import argparse
-from datetime import datetime
+import os
+from datetime import datetime, timezone
+from itertools import accumulate
 from pathlib import Path
+from zipfile import ZipFile, ZIP_DEFLATED
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate SagaLabs budget Excel file")
+    parser.add_argument("--output", "-o", help="Output Excel path")
+    parser.add_argument("--static", action="store_true",
+                        help="Write a values-only snapshot of the default scenario instead of the formula model")
+    return parser.parse_args(argv)
+
+
+# Parse arguments before importing openpyxl, so --help and usage errors return
+# immediately without paying for (or requiring) the openpyxl import
+if __name__ == "__main__":
+    CLI_ARGS = parse_args()
 
 # Try to import required libraries
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, Alignment, PatternFill, NamedStyle, DEFAULT_FONT
     from openpyxl.utils import get_column_letter
+    from openpyxl.workbook.defined_name import DefinedName
+    from openpyxl.worksheet.dimensions import ColumnDimension
+    from openpyxl.writer.excel import ExcelWriter
 except ImportError as e:
     print(f"Missing dependency: {e}")
     print("Install with: pip install openpyxl")
@@ -62,222 +83,341 @@ DEFAULT_NEW_CUSTOMERS = [0, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 5, 5
 # Team growth - aggressive to use the capital
 DEFAULT_TEAM_SIZE = [4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 17, 19, 21, 23, 25, 26, 27, 28, 29, 30, 30, 30]
 
+# Column letters indexed by 1-based column number (A..Z), so COL_LETTERS[col] == get_column_letter(col)
+COL_LETTERS = (None,) + tuple(get_column_letter(i) for i in range(1, 27))
 
-def create_assumptions_sheet(wb: Workbook):
-    """Create the Assumptions sheet with all editable parameters."""
-    ws = wb.active
-    ws.title = "Assumptions"
-
-    # Styles
-    title_font = Font(bold=True, size=16, color="FFFFFF")
-    title_fill = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
-    header_font = Font(bold=True, size=12)
-    section_fill = PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid")
-    input_fill = PatternFill(start_color="FFFFD0", end_color="FFFFD0", fill_type="solid")  # Yellow for editable
-
-    # Title
-    ws["A1"] = "SAGALABS FINANCIAL MODEL - ASSUMPTIONS"
-    ws["A1"].font = title_font
-    ws["A1"].fill = title_fill
-    ws.merge_cells("A1:D1")
+# =============================================================================
+# STYLES - created once and shared by every cell that uses them
+# =============================================================================
 
-    ws["A2"] = "Yellow cells are editable - change them to see impact on projections"
-    ws["A2"].font = Font(italic=True, size=10)
+DARK_FILL = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
+SECTION_FILL = PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid")
+INPUT_FILL = PatternFill(start_color="FFFFD0", end_color="FFFFD0", fill_type="solid")  # Yellow for editable
+
+ASSUMPTIONS_TITLE_FONT = Font(bold=True, size=16, color="FFFFFF")
+SHEET_TITLE_FONT = Font(bold=True, size=14)
+GROUP_FONT = Font(bold=True, size=12)
+HEADER_FONT = Font(bold=True, size=10, color="FFFFFF")
+SECTION_FONT = Font(bold=True, size=10)
+NOTE_FONT = Font(italic=True, size=10)
+HINT_FONT = Font(italic=True, color="666666")
+BOLD = Font(bold=True)
+BOLD_RED = Font(bold=True, color="FF0000")
+
+ALIGN_RIGHT = Alignment(horizontal='right')
+ALIGN_CENTER = Alignment(horizontal='center')
+
+NUM_FMT = '#,##0'
+PCT_FMT = '0%'
+
+# Named styles are registered once per workbook; cells then reference them by name
+# and share a single style record instead of each carrying its own format/alignment
+NAMED_STYLES = (
+    NamedStyle(name="money_right", font=DEFAULT_FONT, number_format=NUM_FMT, alignment=ALIGN_RIGHT),
+    NamedStyle(name="bold_money_right", font=BOLD, number_format=NUM_FMT, alignment=ALIGN_RIGHT),
+    NamedStyle(name="bold_red_money", font=BOLD_RED, number_format=NUM_FMT),
+    NamedStyle(name="count_right", font=DEFAULT_FONT, alignment=ALIGN_RIGHT),
+    NamedStyle(name="count_center", font=DEFAULT_FONT, alignment=ALIGN_CENTER),
+    NamedStyle(name="months_right", font=DEFAULT_FONT, number_format='0.0', alignment=ALIGN_RIGHT),
+    NamedStyle(name="input", font=DEFAULT_FONT, fill=INPUT_FILL),
+)
 
-    row = 4
+# =============================================================================
+# SHEET LAYOUTS - one entry per row (None = blank row), rendered by emit()
+# =============================================================================
+#
+# "key" names a row so templates can refer to its row number as {key}.
+# Templates are str.format strings: {cl}/{prev} are the current/previous month's
+# column letter, and bare names like license_fee are the Assumptions cells,
+# registered as workbook defined names.
+
+OPERATING_COSTS = [
+    ("Compute - Base (SEK/month)", DEFAULT_COMPUTE_BASE, "compute_base"),
+    ("Compute - Per Customer", DEFAULT_COMPUTE_PER_CUSTOMER, "compute_per_cust"),
+    ("Data - Base (SEK/month)", DEFAULT_DATA_BASE, "data_base"),
+    ("Data - Per Customer", DEFAULT_DATA_PER_CUSTOMER, "data_per_cust"),
+    ("Infrastructure - Base", DEFAULT_INFRASTRUCTURE_BASE, "infra_base"),
+    ("Infrastructure - Per Employee", DEFAULT_INFRASTRUCTURE_PER_EMPLOYEE, "infra_per_emp"),
+    ("Office - Per Employee", DEFAULT_OFFICE_PER_EMPLOYEE, "office_per_emp"),
+    ("Sales/Marketing - Base", DEFAULT_SALES_MARKETING_BASE, "sales_base"),
+    ("Sales/Marketing - Per Customer", DEFAULT_SALES_MARKETING_PER_CUSTOMER, "sales_per_cust"),
+    ("Admin & Legal - Base", DEFAULT_ADMIN_LEGAL_BASE, "admin_base"),
+    ("Buffer (%)", DEFAULT_BUFFER_PERCENT, "buffer_pct"),
+]
+
+ASSUMPTIONS_SPEC = [
+    {"type": "title", "text": "SAGALABS FINANCIAL MODEL - ASSUMPTIONS", "font": ASSUMPTIONS_TITLE_FONT,
+     "fill": DARK_FILL, "merge": "D"},
+    {"type": "note", "text": "Yellow cells are editable - change them to see impact on projections"},
+    None,
 
     # === RAISE SECTION ===
-    ws.cell(row=row, column=1, value="RAISE DETAILS").font = header_font
-    ws.cell(row=row, column=1).fill = section_fill
-    ws.merge_cells(f"A{row}:D{row}")
-    row += 1
-
-    ws.cell(row=row, column=1, value="Raise Amount (SEK)")
-    ws.cell(row=row, column=2, value=DEFAULT_RAISE_AMOUNT)
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=2).fill = input_fill
-    ws["B5"].font = Font(bold=True)  # Named reference: raise_amount
-    row += 1
-
-    ws.cell(row=row, column=1, value="Dilution (%)")
-    ws.cell(row=row, column=2, value=DEFAULT_DILUTION)
-    ws.cell(row=row, column=2).number_format = '0%'
-    ws.cell(row=row, column=2).fill = input_fill
-    row += 1
-
-    # Calculated
-    ws.cell(row=row, column=1, value="Pre-Money Valuation")
-    ws.cell(row=row, column=2, value="=B5/B6-B5")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    row += 1
-
-    ws.cell(row=row, column=1, value="Post-Money Valuation")
-    ws.cell(row=row, column=2, value="=B5/B6")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    row += 2
+    {"type": "section", "text": "RAISE DETAILS", "font": GROUP_FONT, "merge": "D"},
+    {"type": "input", "key": "raise_amount", "label": "Raise Amount (SEK)", "value": DEFAULT_RAISE_AMOUNT,
+     "font": BOLD},
+    {"type": "input", "key": "dilution", "label": "Dilution (%)", "value": DEFAULT_DILUTION,
+     "number_format": PCT_FMT},
+    {"type": "calc", "label": "Pre-Money Valuation", "template": "=B{raise_amount}/B{dilution}-B{raise_amount}"},
+    {"type": "calc", "label": "Post-Money Valuation", "template": "=B{raise_amount}/B{dilution}"},
+    None,
 
     # === SALARY SECTION ===
-    ws.cell(row=row, column=1, value="SALARY COSTS (SWEDEN)").font = header_font
-    ws.cell(row=row, column=1).fill = section_fill
-    ws.merge_cells(f"A{row}:D{row}")
-    row += 1
-
-    salary_row = row  # Remember for formulas
-    ws.cell(row=row, column=1, value="Avg Base Salary (SEK/month)")
-    ws.cell(row=row, column=2, value=DEFAULT_AVG_BASE_SALARY)
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=2).fill = input_fill
-    row += 1
-
-    avgift_row = row
-    ws.cell(row=row, column=1, value="Arbetsgivaravgift (%)")
-    ws.cell(row=row, column=2, value=DEFAULT_ARBETSGIVARAVGIFT)
-    ws.cell(row=row, column=2).number_format = '0%'
-    ws.cell(row=row, column=2).fill = input_fill
-    row += 1
-
-    total_cost_row = row
-    ws.cell(row=row, column=1, value="Total Cost per Employee")
-    ws.cell(row=row, column=2, value=f"=B{salary_row}*(1+B{avgift_row})")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=3, value="= Base * (1 + Avgift)")
-    ws.cell(row=row, column=3).font = Font(italic=True, color="666666")
-    row += 2
+    {"type": "section", "text": "SALARY COSTS (SWEDEN)", "font": GROUP_FONT, "merge": "D"},
+    {"type": "input", "key": "avg_base_salary", "label": "Avg Base Salary (SEK/month)",
+     "value": DEFAULT_AVG_BASE_SALARY},
+    {"type": "input", "key": "arbetsgivaravgift", "label": "Arbetsgivaravgift (%)",
+     "value": DEFAULT_ARBETSGIVARAVGIFT, "number_format": PCT_FMT},
+    {"type": "calc", "key": "total_cost_per_emp", "label": "Total Cost per Employee",
+     "template": "=B{avg_base_salary}*(1+B{arbetsgivaravgift})", "hint": "= Base * (1 + Avgift)"},
+    None,
 
     # === PRICING SECTION ===
-    ws.cell(row=row, column=1, value="PRICING").font = header_font
-    ws.cell(row=row, column=1).fill = section_fill
-    ws.merge_cells(f"A{row}:D{row}")
-    row += 1
-
-    license_row = row
-    ws.cell(row=row, column=1, value="Monthly License Fee (SEK)")
-    ws.cell(row=row, column=2, value=DEFAULT_MONTHLY_LICENSE_FEE)
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=2).fill = input_fill
-    row += 1
-
-    ws.cell(row=row, column=1, value="Annual Contract Value")
-    ws.cell(row=row, column=2, value=f"=B{license_row}*12")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    row += 2
+    {"type": "section", "text": "PRICING", "font": GROUP_FONT, "merge": "D"},
+    {"type": "input", "key": "license_fee", "label": "Monthly License Fee (SEK)",
+     "value": DEFAULT_MONTHLY_LICENSE_FEE},
+    {"type": "calc", "label": "Annual Contract Value", "template": "=B{license_fee}*12"},
+    None,
 
     # === COST SECTION ===
-    ws.cell(row=row, column=1, value="OPERATING COSTS").font = header_font
-    ws.cell(row=row, column=1).fill = section_fill
-    ws.merge_cells(f"A{row}:D{row}")
-    row += 1
-
-    # Store row numbers for formula references
-    cost_rows = {}
-
-    costs = [
-        ("Compute - Base (SEK/month)", DEFAULT_COMPUTE_BASE, "compute_base"),
-        ("Compute - Per Customer", DEFAULT_COMPUTE_PER_CUSTOMER, "compute_per_cust"),
-        ("Data - Base (SEK/month)", DEFAULT_DATA_BASE, "data_base"),
-        ("Data - Per Customer", DEFAULT_DATA_PER_CUSTOMER, "data_per_cust"),
-        ("Infrastructure - Base", DEFAULT_INFRASTRUCTURE_BASE, "infra_base"),
-        ("Infrastructure - Per Employee", DEFAULT_INFRASTRUCTURE_PER_EMPLOYEE, "infra_per_emp"),
-        ("Office - Per Employee", DEFAULT_OFFICE_PER_EMPLOYEE, "office_per_emp"),
-        ("Sales/Marketing - Base", DEFAULT_SALES_MARKETING_BASE, "sales_base"),
-        ("Sales/Marketing - Per Customer", DEFAULT_SALES_MARKETING_PER_CUSTOMER, "sales_per_cust"),
-        ("Admin & Legal - Base", DEFAULT_ADMIN_LEGAL_BASE, "admin_base"),
-        ("Buffer (%)", DEFAULT_BUFFER_PERCENT, "buffer_pct"),
-    ]
+    {"type": "section", "text": "OPERATING COSTS", "font": GROUP_FONT, "merge": "D"},
+    *(
+        {"type": "input", "key": key, "label": label, "value": value,
+         "number_format": PCT_FMT if "%" in label else NUM_FMT}
+        for label, value, key in OPERATING_COSTS
+    ),
+]
+
+INPUTS_SPEC = [
+    {"type": "title", "text": "MONTHLY INPUTS - Edit these to change projections", "merge": "Z"},
+    None,
+    {"type": "header", "label": "Month"},
+    {"type": "input_row", "key": "new_customers", "label": "New Customers", "values": DEFAULT_NEW_CUSTOMERS},
+    # Cumulative sum of new customers
+    {"type": "formula_row", "key": "total_customers", "label": "Total Customers", "label_font": BOLD,
+     "first": "={cl}{new_customers}", "template": "={prev}{total_customers}+{cl}{new_customers}",
+     "style": "count_center", "total": None},
+    None,
+    {"type": "input_row", "key": "team_size", "label": "Team Size", "values": DEFAULT_TEAM_SIZE},
+]
+
+CASHFLOW_SPEC = [
+    {"type": "title", "text": "24-MONTH CASH FLOW - All values are formulas linked to Assumptions & Inputs",
+     "merge": "Z"},
+    None,
+    {"type": "header", "label": "Category", "total": "TOTAL/END"},
+
+    # === CUSTOMERS SECTION ===
+    {"type": "section", "text": "CUSTOMERS"},
+    {"type": "formula_row", "label": "New Customers", "template": "=Inputs!{cl}4", "style": "count_right"},
+    {"type": "formula_row", "key": "customers", "label": "Total Customers", "template": "=Inputs!{cl}5",
+     "style": "count_right", "total": "END"},
+    None,
 
-    for label, value, key in costs:
-        cost_rows[key] = row
-        ws.cell(row=row, column=1, value=label)
-        ws.cell(row=row, column=2, value=value)
-        if "%" in label:
-            ws.cell(row=row, column=2).number_format = '0%'
+    # === REVENUE SECTION ===
+    {"type": "section", "text": "REVENUE"},
+    # Monthly Revenue = Total Customers * License Fee
+    {"type": "formula_row", "key": "revenue", "label": "Monthly Revenue", "template": "={cl}{customers}*license_fee"},
+    # ARR (Run Rate) = Monthly Revenue * 12
+    {"type": "formula_row", "label": "ARR (Run Rate)", "template": "={cl}{revenue}*12", "total": "END"},
+    None,
+
+    # === TEAM SECTION ===
+    {"type": "section", "text": "TEAM"},
+    {"type": "formula_row", "key": "team", "label": "Team Size", "template": "=Inputs!{cl}7",
+     "style": "count_right", "total": "END"},
+    None,
+
+    # === EXPENSES SECTION ===
+    {"type": "section", "text": "EXPENSES"},
+    # Team Size * Total Cost Per Employee
+    {"type": "formula_row", "key": "salaries", "label": "Salaries (incl. avgift)",
+     "template": "={cl}{team}*total_cost_per_emp"},
+    # Base + (Customers * Per Customer)
+    {"type": "formula_row", "label": "Compute", "template": "=compute_base+({cl}{customers}*compute_per_cust)"},
+    # Base + (Customers * Per Customer)
+    {"type": "formula_row", "label": "Data", "template": "=data_base+({cl}{customers}*data_per_cust)"},
+    # Base + (Team * Per Employee)
+    {"type": "formula_row", "label": "Infrastructure", "template": "=infra_base+({cl}{team}*infra_per_emp)"},
+    # Team * Per Employee
+    {"type": "formula_row", "label": "Office", "template": "={cl}{team}*office_per_emp"},
+    # Base + (Customers * Per Customer)
+    {"type": "formula_row", "label": "Sales & Marketing",
+     "template": "=sales_base+({cl}{customers}*sales_per_cust)"},
+    # Base
+    {"type": "formula_row", "key": "admin", "label": "Admin & Legal", "template": "=admin_base"},
+    {"type": "formula_row", "key": "subtotal", "label": "Subtotal Expenses",
+     "template": "=SUM({cl}{salaries}:{cl}{admin})"},
+    # Subtotal * Buffer %
+    {"type": "formula_row", "key": "buffer", "label": "Buffer", "template": "={cl}{subtotal}*buffer_pct"},
+    {"type": "formula_row", "key": "total_exp", "label": "TOTAL EXPENSES", "template": "={cl}{subtotal}+{cl}{buffer}",
+     "style": "bold_money_right", "label_font": BOLD},
+    None,
+
+    # === CASH FLOW SECTION ===
+    {"type": "section", "text": "CASH FLOW"},
+    # Revenue - Total Expenses
+    {"type": "formula_row", "key": "net_cf", "label": "Net Cashflow", "template": "={cl}{revenue}-{cl}{total_exp}"},
+    # Previous Balance + Net Cashflow, starting from the Raise Amount in the first month
+    {"type": "formula_row", "key": "cash", "label": "Cash Balance", "label_font": BOLD,
+     "first": "=raise_amount+{cl}{net_cf}", "template": "={prev}{cash}+{cl}{net_cf}",
+     "style": "bold_money_right", "total": "END"},
+    None,
+
+    # === KEY METRICS ===
+    {"type": "section", "text": "KEY METRICS"},
+    {"type": "formula_row", "label": "Runway (months)",
+     "template": "=IF({cl}{total_exp}>0,{cl}{cash}/{cl}{total_exp},999)", "style": "months_right", "total": None},
+    # Monthly Burn (when losing money)
+    {"type": "formula_row", "label": "Monthly Burn", "template": "=IF({cl}{net_cf}<0,-{cl}{net_cf},0)"},
+    None,
+    {"type": "metric", "label": "LOWEST CASH POINT:", "template": "=MIN(B{cash}:Y{cash})"},
+    # Capital Used (Raise - Lowest)
+    {"type": "metric", "label": "MAX CAPITAL USED:", "template": "=raise_amount-MIN(B{cash}:Y{cash})"},
+]
+
+
+def styled(ws, value, style=None, font=None, fill=None, number_format=None, alignment=None):
+    """Build a WriteOnlyCell carrying its styles (write-only sheets have no random access).
+
+    `style` names one of NAMED_STYLES; any other argument overrides it for this cell.
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    if style is not None:
+        cell.style = style
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if number_format is not None:
+        cell.number_format = number_format
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+def append_rows(ws, rows: dict):
+    """Stream rows (keyed by 1-based row number) to the sheet in order, leaving gaps blank."""
+    for r in range(1, max(rows) + 1):
+        ws.append(rows.get(r, []))
+
+
+def emit_formula_row(ws, rows: dict, row: int, label, template: str, style="money_right", total="SUM",
+                     label_font=None, fields: dict = None, first: str = None):
+    """Fill `rows[row]` with a label, 24 monthly formulas and a total column.
+
+    `template` is formatted once per month with `cl`/`prev` set to that month's
+    and the previous month's column letter, plus any extra `fields`; `first`,
+    if given, replaces it for the first month. Every value cell gets the named
+    `style`. `total` is "SUM" (sum of the months), "END" (last month) or None.
+    """
+    fields = fields or {}
+    values = [styled(ws, label, font=label_font)]
+    for col in range(2, 26):
+        month_template = first if first is not None and col == 2 else template
+        formula = month_template.format(cl=COL_LETTERS[col], prev=COL_LETTERS[col - 1], **fields)
+        values.append(styled(ws, formula, style=style))
+    if total == "SUM":
+        values.append(styled(ws, f"=SUM(B{row}:Y{row})", style=style))
+    elif total == "END":
+        values.append(styled(ws, f"=Y{row}", style=style))
+    rows[row] = values
+
+
+def emit(ws, spec: list) -> dict:
+    """Render a sheet layout (see SHEET LAYOUTS) to `ws` and return its keyed row numbers.
+
+    Row numbers are assigned up front, so every template can refer to any keyed
+    row; the rows are then streamed in order.
+    """
+    row_refs = {entry["key"]: row for row, entry in enumerate(spec, start=1) if entry and "key" in entry}
+    rows = {}
+
+    for row, entry in enumerate(spec, start=1):
+        if entry is None:
+            continue
+        kind = entry["type"]
+
+        if kind == "title":
+            rows[row] = [styled(ws, entry["text"], font=entry.get("font", SHEET_TITLE_FONT), fill=entry.get("fill"))]
+        elif kind == "note":
+            rows[row] = [styled(ws, entry["text"], font=NOTE_FONT)]
+        elif kind == "section":
+            rows[row] = [styled(ws, entry["text"], font=entry.get("font", SECTION_FONT), fill=SECTION_FILL)]
+        elif kind == "header":
+            rows[row] = [styled(ws, entry["label"], font=HEADER_FONT, fill=DARK_FILL)] + [
+                styled(ws, f"M{m}", font=HEADER_FONT, fill=DARK_FILL, alignment=ALIGN_CENTER) for m in range(1, 25)
+            ]
+            if "total" in entry:
+                rows[row].append(styled(ws, entry["total"], font=HEADER_FONT, fill=DARK_FILL, alignment=ALIGN_CENTER))
+        elif kind == "input":
+            rows[row] = [
+                entry["label"],
+                styled(ws, entry["value"], style="input", font=entry.get("font"),
+                       number_format=entry.get("number_format", NUM_FMT)),
+            ]
+        elif kind == "calc":
+            rows[row] = [entry["label"], styled(ws, entry["template"].format(**row_refs), number_format=NUM_FMT)]
+            if "hint" in entry:
+                rows[row].append(styled(ws, entry["hint"], font=HINT_FONT))
+        elif kind == "input_row":
+            rows[row] = [styled(ws, entry["label"], font=BOLD)] + [
+                styled(ws, value, style="input", alignment=ALIGN_CENTER) for value in entry["values"]
+            ]
+        elif kind == "formula_row":
+            emit_formula_row(ws, rows, row, entry["label"], entry["template"], style=entry.get("style", "money_right"),
+                             total=entry.get("total", "SUM"), label_font=entry.get("label_font"),
+                             fields=row_refs, first=entry.get("first"))
+        elif kind == "metric":
+            rows[row] = [
+                styled(ws, entry["label"], font=BOLD),
+                styled(ws, entry["template"].format(**row_refs), style="bold_red_money"),
+            ]
         else:
-            ws.cell(row=row, column=2).number_format = '#,##0'
-        ws.cell(row=row, column=2).fill = input_fill
-        row += 1
+            raise ValueError(f"Unknown row type: {kind}")
+
+        if "merge" in entry:
+            ws.merged_cells.add(f"A{row}:{entry['merge']}{row}")
 
-    row += 1
+    append_rows(ws, rows)
+    return row_refs
 
-    # Column widths
+
+def create_assumptions_sheet(wb: Workbook):
+    """Create the Assumptions sheet with all editable parameters."""
+    ws = wb.create_sheet(title="Assumptions")
+
+    # Column widths (must be set before any row is streamed)
     ws.column_dimensions["A"].width = 30
     ws.column_dimensions["B"].width = 18
     ws.column_dimensions["C"].width = 25
     ws.column_dimensions["D"].width = 15
 
+    refs = emit(ws, ASSUMPTIONS_SPEC)
+
+    # Register each assumption as a workbook-level name, so other sheets can
+    # write =compute_base instead of repeating Assumptions!$B$20 in every cell
+    for name, ref_row in refs.items():
+        wb.defined_names[name] = DefinedName(name, attr_text=f"Assumptions!$B${ref_row}")
+
     # Return important row numbers for other sheets to reference
-    return {
-        "raise_amount": 5,
-        "dilution": 6,
-        "avg_base_salary": salary_row,
-        "arbetsgivaravgift": avgift_row,
-        "total_cost_per_emp": total_cost_row,
-        "license_fee": license_row,
-        **cost_rows
-    }
+    return refs
 
 
 def create_inputs_sheet(wb: Workbook, refs: dict):
     """Create the Inputs sheet with monthly team size and customer growth."""
     ws = wb.create_sheet(title="Inputs")
 
-    # Styles
-    title_font = Font(bold=True, size=14)
-    header_fill = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
-    header_font = Font(bold=True, size=10, color="FFFFFF")
-    input_fill = PatternFill(start_color="FFFFD0", end_color="FFFFD0", fill_type="solid")
-
-    ws["A1"] = "MONTHLY INPUTS - Edit these to change projections"
-    ws["A1"].font = title_font
-    ws.merge_cells("A1:Z1")
-
-    # Headers
-    ws.cell(row=3, column=1, value="Month").font = header_font
-    ws.cell(row=3, column=1).fill = header_fill
-
-    for m in range(1, 25):
-        cell = ws.cell(row=3, column=m+1, value=f"M{m}")
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center')
-
-    # New Customers row (editable)
-    ws.cell(row=4, column=1, value="New Customers")
-    ws.cell(row=4, column=1).font = Font(bold=True)
-    for m in range(24):
-        cell = ws.cell(row=4, column=m+2, value=DEFAULT_NEW_CUSTOMERS[m])
-        cell.fill = input_fill
-        cell.alignment = Alignment(horizontal='center')
-
-    # Total Customers (formula: cumulative sum)
-    ws.cell(row=5, column=1, value="Total Customers")
-    ws.cell(row=5, column=1).font = Font(bold=True)
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        if m == 0:
-            ws.cell(row=5, column=col, value=f"={col_letter}4")
-        else:
-            prev_col = get_column_letter(col - 1)
-            ws.cell(row=5, column=col, value=f"={prev_col}5+{col_letter}4")
-        ws.cell(row=5, column=col).alignment = Alignment(horizontal='center')
-
-    # Team Size row (editable)
-    ws.cell(row=7, column=1, value="Team Size")
-    ws.cell(row=7, column=1).font = Font(bold=True)
-    for m in range(24):
-        cell = ws.cell(row=7, column=m+2, value=DEFAULT_TEAM_SIZE[m])
-        cell.fill = input_fill
-        cell.alignment = Alignment(horizontal='center')
-
-    # Column widths
+    # Column widths (must be set before any row is streamed)
     ws.column_dimensions["A"].width = 18
-    for col in range(2, 26):
-        ws.column_dimensions[get_column_letter(col)].width = 8
+    # One <col min="2" max="25"> entry covers every month column (B..Y)
+    ws.column_dimensions["B"] = ColumnDimension(ws, index="B", min=2, max=25, width=8)
+
+    row_refs = emit(ws, INPUTS_SPEC)
 
     return {
-        "new_customers_row": 4,
-        "total_customers_row": 5,
-        "team_size_row": 7,
+        "new_customers_row": row_refs["new_customers"],
+        "total_customers_row": row_refs["total_customers"],
+        "team_size_row": row_refs["team_size"],
     }
 
 
@@ -285,364 +425,150 @@ def create_cashflow_sheet(wb: Workbook, assumption_refs: dict, input_refs: dict)
     """Create the Cashflow sheet with ALL FORMULAS linking to Assumptions and Inputs."""
     ws = wb.create_sheet(title="Cashflow")
 
-    # Styles
-    title_font = Font(bold=True, size=14)
-    header_fill = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
-    header_font = Font(bold=True, size=10, color="FFFFFF")
-    section_fill = PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid")
-    section_font = Font(bold=True, size=10)
-
-    ws["A1"] = "24-MONTH CASH FLOW - All values are formulas linked to Assumptions & Inputs"
-    ws["A1"].font = title_font
-    ws.merge_cells("A1:Z1")
-
-    # Column headers
-    ws.cell(row=3, column=1, value="Category").font = header_font
-    ws.cell(row=3, column=1).fill = header_fill
-
-    for m in range(1, 25):
-        cell = ws.cell(row=3, column=m+1, value=f"M{m}")
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center')
-
-    # Total column
-    cell = ws.cell(row=3, column=26, value="TOTAL/END")
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.alignment = Alignment(horizontal='center')
-
-    row = 4
-
-    # === CUSTOMERS SECTION ===
-    ws.cell(row=row, column=1, value="CUSTOMERS").font = section_font
-    ws.cell(row=row, column=1).fill = section_fill
-    row += 1
-
-    # New Customers - link to Inputs
-    ws.cell(row=row, column=1, value="New Customers")
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"=Inputs!{col_letter}4")
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    # Total
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    new_cust_row = row
-    row += 1
-
-    # Total Customers - link to Inputs
-    ws.cell(row=row, column=1, value="Total Customers")
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"=Inputs!{col_letter}5")
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    # End value
-    ws.cell(row=row, column=26, value=f"=Y{row}")
-    total_cust_row = row
-    row += 2
-
-    # === REVENUE SECTION ===
-    ws.cell(row=row, column=1, value="REVENUE").font = section_font
-    ws.cell(row=row, column=1).fill = section_fill
-    row += 1
-
-    # Monthly Revenue = Total Customers * License Fee
-    ws.cell(row=row, column=1, value="Monthly Revenue")
-    license_ref = f"Assumptions!$B${assumption_refs['license_fee']}"
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={col_letter}{total_cust_row}*{license_ref}")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    revenue_row = row
-    row += 1
-
-    # ARR (Run Rate) = Monthly Revenue * 12
-    ws.cell(row=row, column=1, value="ARR (Run Rate)")
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={col_letter}{revenue_row}*12")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=Y{row}")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    row += 2
-
-    # === TEAM SECTION ===
-    ws.cell(row=row, column=1, value="TEAM").font = section_font
-    ws.cell(row=row, column=1).fill = section_fill
-    row += 1
-
-    # Team Size - link to Inputs
-    ws.cell(row=row, column=1, value="Team Size")
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"=Inputs!{col_letter}7")
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=Y{row}")
-    team_row = row
-    row += 2
-
-    # === EXPENSES SECTION ===
-    ws.cell(row=row, column=1, value="EXPENSES").font = section_font
-    ws.cell(row=row, column=1).fill = section_fill
-    row += 1
-
-    # Salaries = Team Size * Total Cost Per Employee
-    ws.cell(row=row, column=1, value="Salaries (incl. avgift)")
-    total_cost_ref = f"Assumptions!$B${assumption_refs['total_cost_per_emp']}"
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={col_letter}{team_row}*{total_cost_ref}")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    salaries_row = row
-    row += 1
-
-    # Compute = Base + (Customers * Per Customer)
-    ws.cell(row=row, column=1, value="Compute")
-    compute_base_ref = f"Assumptions!$B${assumption_refs['compute_base']}"
-    compute_per_ref = f"Assumptions!$B${assumption_refs['compute_per_cust']}"
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={compute_base_ref}+({col_letter}{total_cust_row}*{compute_per_ref})")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    compute_row = row
-    row += 1
-
-    # Data = Base + (Customers * Per Customer)
-    ws.cell(row=row, column=1, value="Data")
-    data_base_ref = f"Assumptions!$B${assumption_refs['data_base']}"
-    data_per_ref = f"Assumptions!$B${assumption_refs['data_per_cust']}"
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={data_base_ref}+({col_letter}{total_cust_row}*{data_per_ref})")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    data_row = row
-    row += 1
-
-    # Infrastructure = Base + (Team * Per Employee)
-    ws.cell(row=row, column=1, value="Infrastructure")
-    infra_base_ref = f"Assumptions!$B${assumption_refs['infra_base']}"
-    infra_per_ref = f"Assumptions!$B${assumption_refs['infra_per_emp']}"
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={infra_base_ref}+({col_letter}{team_row}*{infra_per_ref})")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    infra_row = row
-    row += 1
-
-    # Office = Team * Per Employee
-    ws.cell(row=row, column=1, value="Office")
-    office_ref = f"Assumptions!$B${assumption_refs['office_per_emp']}"
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={col_letter}{team_row}*{office_ref}")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    office_row = row
-    row += 1
-
-    # Sales & Marketing = Base + (Customers * Per Customer)
-    ws.cell(row=row, column=1, value="Sales & Marketing")
-    sales_base_ref = f"Assumptions!$B${assumption_refs['sales_base']}"
-    sales_per_ref = f"Assumptions!$B${assumption_refs['sales_per_cust']}"
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={sales_base_ref}+({col_letter}{total_cust_row}*{sales_per_ref})")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    sales_row = row
-    row += 1
-
-    # Admin & Legal = Base
-    ws.cell(row=row, column=1, value="Admin & Legal")
-    admin_ref = f"Assumptions!$B${assumption_refs['admin_base']}"
-    for m in range(24):
-        col = m + 2
-        ws.cell(row=row, column=col, value=f"={admin_ref}")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    admin_row = row
-    row += 1
-
-    # Subtotal
-    ws.cell(row=row, column=1, value="Subtotal Expenses")
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"=SUM({col_letter}{salaries_row}:{col_letter}{admin_row})")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    subtotal_row = row
-    row += 1
-
-    # Buffer = Subtotal * Buffer %
-    ws.cell(row=row, column=1, value="Buffer")
-    buffer_ref = f"Assumptions!$B${assumption_refs['buffer_pct']}"
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={col_letter}{subtotal_row}*{buffer_ref}")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    buffer_row = row
-    row += 1
-
-    # Total Expenses
-    ws.cell(row=row, column=1, value="TOTAL EXPENSES")
-    ws.cell(row=row, column=1).font = Font(bold=True)
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={col_letter}{subtotal_row}+{col_letter}{buffer_row}")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).font = Font(bold=True)
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    ws.cell(row=row, column=26).font = Font(bold=True)
-    total_exp_row = row
-    row += 2
+    # Column widths (must be set before any row is streamed)
+    ws.column_dimensions["A"].width = 22
+    # One <col min="2" max="26"> entry covers the month columns and TOTAL/END (B..Z)
+    ws.column_dimensions["B"] = ColumnDimension(ws, index="B", min=2, max=26, width=10)
+
+    emit(ws, CASHFLOW_SPEC)
+
+
+def save_workbook(wb: Workbook, output_path: Path):
+    """Save `wb` to `output_path` atomically with light (level 1) compression."""
+    # Save to a sibling temp file and swap it in, so the target is never left half-written
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        # Same as wb.save(), but deflate at level 1: the formula XML compresses
+        # nearly as well as at the default level 6 for a fraction of the CPU
+        archive = ZipFile(tmp_path, "w", ZIP_DEFLATED, allowZip64=True, compresslevel=1)
+        wb.properties.modified = datetime.now(timezone.utc).replace(tzinfo=None)
+        ExcelWriter(wb, archive).save()
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def simulate_cashflow():
+    """Compute the default scenario's Cashflow rows in Python, mirroring CASHFLOW_SPEC.
+
+    Returns a list of (section, [(label, monthly_values, total, style), ...]);
+    `total` is "SUM", "END" or None, as in the formula sheet.
+    """
+    customers = list(accumulate(DEFAULT_NEW_CUSTOMERS))
+    team = DEFAULT_TEAM_SIZE
+    cost_per_emp = DEFAULT_AVG_BASE_SALARY * (1 + DEFAULT_ARBETSGIVARAVGIFT)
+
+    revenue = [c * DEFAULT_MONTHLY_LICENSE_FEE for c in customers]
+    expenses = [
+        ("Salaries (incl. avgift)", [t * cost_per_emp for t in team]),
+        ("Compute", [DEFAULT_COMPUTE_BASE + c * DEFAULT_COMPUTE_PER_CUSTOMER for c in customers]),
+        ("Data", [DEFAULT_DATA_BASE + c * DEFAULT_DATA_PER_CUSTOMER for c in customers]),
+        ("Infrastructure", [DEFAULT_INFRASTRUCTURE_BASE + t * DEFAULT_INFRASTRUCTURE_PER_EMPLOYEE for t in team]),
+        ("Office", [t * DEFAULT_OFFICE_PER_EMPLOYEE for t in team]),
+        ("Sales & Marketing", [DEFAULT_SALES_MARKETING_BASE + c * DEFAULT_SALES_MARKETING_PER_CUSTOMER
+                               for c in customers]),
+        ("Admin & Legal", [DEFAULT_ADMIN_LEGAL_BASE] * 24),
+    ]
+    subtotal = [sum(month) for month in zip(*(values for _, values in expenses))]
+    buffer = [s * DEFAULT_BUFFER_PERCENT for s in subtotal]
+    total_exp = [s + b for s, b in zip(subtotal, buffer)]
+    net_cf = [r - e for r, e in zip(revenue, total_exp)]
+    cash = list(accumulate(net_cf, initial=DEFAULT_RAISE_AMOUNT))[1:]
+
+    return [
+        ("CUSTOMERS", [
+            ("New Customers", DEFAULT_NEW_CUSTOMERS, "SUM", "count_right"),
+            ("Total Customers", customers, "END", "count_right"),
+        ]),
+        ("REVENUE", [
+            ("Monthly Revenue", revenue, "SUM", "money_right"),
+            ("ARR (Run Rate)", [r * 12 for r in revenue], "END", "money_right"),
+        ]),
+        ("TEAM", [
+            ("Team Size", team, "END", "count_right"),
+        ]),
+        ("EXPENSES", [
+            *((label, values, "SUM", "money_right") for label, values in expenses),
+            ("Subtotal Expenses", subtotal, "SUM", "money_right"),
+            ("Buffer", buffer, "SUM", "money_right"),
+            ("TOTAL EXPENSES", total_exp, "SUM", "bold_money_right"),
+        ]),
+        ("CASH FLOW", [
+            ("Net Cashflow", net_cf, "SUM", "money_right"),
+            ("Cash Balance", cash, "END", "bold_money_right"),
+        ]),
+        ("KEY METRICS", [
+            ("Runway (months)", [c / e if e > 0 else 999 for c, e in zip(cash, total_exp)], None, "months_right"),
+            ("Monthly Burn", [-n if n < 0 else 0 for n in net_cf], "SUM", "money_right"),
+        ]),
+    ]
 
-    # === CASH FLOW SECTION ===
-    ws.cell(row=row, column=1, value="CASH FLOW").font = section_font
-    ws.cell(row=row, column=1).fill = section_fill
-    row += 1
-
-    # Net Cashflow = Revenue - Total Expenses
-    ws.cell(row=row, column=1, value="Net Cashflow")
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"={col_letter}{revenue_row}-{col_letter}{total_exp_row}")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    net_cf_row = row
-    row += 1
-
-    # Cash Balance = Previous Balance + Net Cashflow (starting with Raise Amount)
-    ws.cell(row=row, column=1, value="Cash Balance")
-    ws.cell(row=row, column=1).font = Font(bold=True)
-    raise_ref = f"Assumptions!$B$5"
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        if m == 0:
-            # First month: Raise Amount + Net Cashflow
-            ws.cell(row=row, column=col, value=f"={raise_ref}+{col_letter}{net_cf_row}")
-        else:
-            # Subsequent months: Previous Balance + Net Cashflow
-            prev_col = get_column_letter(col - 1)
-            ws.cell(row=row, column=col, value=f"={prev_col}{row}+{col_letter}{net_cf_row}")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).font = Font(bold=True)
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=Y{row}")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    ws.cell(row=row, column=26).font = Font(bold=True)
-    cash_row = row
-    row += 2
 
-    # === KEY METRICS ===
-    ws.cell(row=row, column=1, value="KEY METRICS").font = section_font
-    ws.cell(row=row, column=1).fill = section_fill
-    row += 1
-
-    # Runway (months)
-    ws.cell(row=row, column=1, value="Runway (months)")
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"=IF({col_letter}{total_exp_row}>0,{col_letter}{cash_row}/{col_letter}{total_exp_row},999)")
-        ws.cell(row=row, column=col).number_format = '0.0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    row += 1
+def generate_static_budget(output_path: Path):
+    """Generate a values-only snapshot of the default scenario (no formulas)."""
+    print(f"Generating static budget snapshot: {output_path}")
 
-    # Monthly Burn (when losing money)
-    ws.cell(row=row, column=1, value="Monthly Burn")
-    for m in range(24):
-        col = m + 2
-        col_letter = get_column_letter(col)
-        ws.cell(row=row, column=col, value=f"=IF({col_letter}{net_cf_row}<0,-{col_letter}{net_cf_row},0)")
-        ws.cell(row=row, column=col).number_format = '#,##0'
-        ws.cell(row=row, column=col).alignment = Alignment(horizontal='right')
-    ws.cell(row=row, column=26, value=f"=SUM(B{row}:Y{row})")
-    ws.cell(row=row, column=26).number_format = '#,##0'
-    row += 1
-
-    # Lowest Cash Point
-    row += 1
-    ws.cell(row=row, column=1, value="LOWEST CASH POINT:")
-    ws.cell(row=row, column=1).font = Font(bold=True)
-    ws.cell(row=row, column=2, value=f"=MIN(B{cash_row}:Y{cash_row})")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=2).font = Font(bold=True, color="FF0000")
-    row += 1
+    wb = Workbook(write_only=True)
+    for style in NAMED_STYLES:
+        wb.add_named_style(style)
 
-    # Capital Used (Raise - Lowest)
-    ws.cell(row=row, column=1, value="MAX CAPITAL USED:")
-    ws.cell(row=row, column=1).font = Font(bold=True)
-    ws.cell(row=row, column=2, value=f"={raise_ref}-MIN(B{cash_row}:Y{cash_row})")
-    ws.cell(row=row, column=2).number_format = '#,##0'
-    ws.cell(row=row, column=2).font = Font(bold=True, color="FF0000")
-
-    # Column widths
+    ws = wb.create_sheet(title="Cashflow")
     ws.column_dimensions["A"].width = 22
-    for col in range(2, 27):
-        ws.column_dimensions[get_column_letter(col)].width = 10
+    ws.column_dimensions["B"] = ColumnDimension(ws, index="B", min=2, max=26, width=10)
+    ws.merged_cells.add("A1:Z1")
+
+    ws.append([styled(ws, "24-MONTH CASH FLOW - Static snapshot of the default scenario", font=SHEET_TITLE_FONT)])
+    ws.append([])
+    ws.append(
+        [styled(ws, "Category", font=HEADER_FONT, fill=DARK_FILL)]
+        + [styled(ws, f"M{m}", font=HEADER_FONT, fill=DARK_FILL, alignment=ALIGN_CENTER) for m in range(1, 25)]
+        + [styled(ws, "TOTAL/END", font=HEADER_FONT, fill=DARK_FILL, alignment=ALIGN_CENTER)]
+    )
+
+    sections = simulate_cashflow()
+    cash = []
+    for i, (section, lines) in enumerate(sections):
+        ws.append([styled(ws, section, font=SECTION_FONT, fill=SECTION_FILL)])
+        for label, values, total, style in lines:
+            label_font = BOLD if style == "bold_money_right" else None
+            row = [styled(ws, label, font=label_font)] + [styled(ws, v, style=style) for v in values]
+            if total == "SUM":
+                row.append(styled(ws, sum(values), style=style))
+            elif total == "END":
+                row.append(styled(ws, values[-1], style=style))
+            ws.append(row)
+            if label == "Cash Balance":
+                cash = values
+        if i < len(sections) - 1:
+            ws.append([])
+
+    ws.append([])
+    ws.append([styled(ws, "LOWEST CASH POINT:", font=BOLD),
+               styled(ws, min(cash), style="bold_red_money")])
+    ws.append([styled(ws, "MAX CAPITAL USED:", font=BOLD),
+               styled(ws, DEFAULT_RAISE_AMOUNT - min(cash), style="bold_red_money")])
+
+    save_workbook(wb, output_path)
+    print(f"Done! Excel file: {output_path}")
+
+    return output_path
 
 
 def generate_budget(output_path: Path):
     """Generate the complete budget Excel file with formulas."""
     print(f"Generating budget with formulas: {output_path}")
 
-    # Create workbook
-    wb = Workbook()
+    # Create workbook (write-only: rows are streamed straight to the archive)
+    wb = Workbook(write_only=True)
+    for style in NAMED_STYLES:
+        wb.add_named_style(style)
 
     # Create sheets in order
     assumption_refs = create_assumptions_sheet(wb)
     input_refs = create_inputs_sheet(wb, assumption_refs)
     create_cashflow_sheet(wb, assumption_refs, input_refs)
 
-    # Save
-    wb.save(output_path)
+    save_workbook(wb, output_path)
     print(f"Done! Excel file: {output_path}")
     print()
     print("HOW TO USE:")
@@ -662,10 +588,9 @@ def generate_budget(output_path: Path):
     return output_path
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Generate SagaLabs budget Excel file")
-    parser.add_argument("--output", "-o", help="Output Excel path")
-    args = parser.parse_args()
+def main(args=None):
+    if args is None:
+        args = parse_args()
 
     # Default output path
     if args.output:
@@ -675,10 +600,14 @@ def main():
         output_dir = script_dir / "output"
         output_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d")
-        output_path = output_dir / f"saga_budget_{timestamp}.xlsx"
+        suffix = "_static" if args.static else ""
+        output_path = output_dir / f"saga_budget{suffix}_{timestamp}.xlsx"
 
-    generate_budget(output_path)
+    if args.static:
+        generate_static_budget(output_path)
+    else:
+        generate_budget(output_path)
 
 
 if __name__ == "__main__":
-    main()
+    main(CLI_ARGS)
@@ -5,32 +5,66 @@ Saga Pitch Deck Generator - WORLD-CLASS VC VERSION
 12 slides, proper formatting, optimal space usage, professional design.
 
 Usage:
-    python generate_pitch_deck.py [--output path/to/output.pdf]
+    python generate_pitch_deck.py [--output path/to/output.pdf [more.pdf ...]] [--no-compress]
 
 Requirements:
     pip install reportlab pillow
+    pip install rl_accel    # optional: C speedups for text measurement and PDF escaping
 
 IMPORTANT: Default output is saga-fe/pitch-files/saga_pitch_deck.pdf
            This directory is PASSWORD PROTECTED via the /pitch route.
            DO NOT output to static/ or any public directory!
 """
 
+import argparse
+import copy
 import os
-import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from datetime import datetime
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Saga pitch deck PDF")
+    parser.add_argument("--output", "-o", nargs="+",
+                        help="Output PDF path; several paths are built in parallel")
+    parser.add_argument("--no-compress", action="store_true",
+                        help="Skip zlib compression of page and image streams (faster drafts, ~30%% larger file)")
+    return parser.parse_args(argv)
+
+
+# Parse arguments before importing reportlab, so --help and usage errors return
+# immediately without paying for the platypus/pdfgen import
+if __name__ == "__main__":
+    CLI_ARGS = parse_args()
+
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, PageBreak,
-    Table, TableStyle, Image, KeepTogether
+    Flowable, Frame, Paragraph, Spacer,
+    Table, TableStyle, KeepTogether
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
+try:
+    # reportlab picks up its C accelerator on its own when installed; only probed for the startup report
+    import _rl_accel  # noqa: F401
+    RL_ACCEL = True
+except ImportError:
+    RL_ACCEL = False
+
 # Page dimensions - 16:9 widescreen
 PAGE_WIDTH = 13.333 * inch
 PAGE_HEIGHT = 7.5 * inch
+PAGE_SIZE = (PAGE_WIDTH, PAGE_HEIGHT)
+
+# Slide content area: 0.75" side margins, 0.5" top and bottom, as (x, y, width, height)
+MARGIN_X = 0.75 * inch
+MARGIN_Y = 0.5 * inch
+CONTENT_FRAME = (MARGIN_X, MARGIN_Y, PAGE_WIDTH - 2 * MARGIN_X, PAGE_HEIGHT - 2 * MARGIN_Y)
 
 # Colors
 BLACK = colors.black
@@ -39,6 +73,21 @@ DARK_BLUE = colors.Color(0.12, 0.31, 0.47)  # Professional blue
 GRAY = colors.Color(0.35, 0.35, 0.35)
 LIGHT_GRAY = colors.Color(0.6, 0.6, 0.6)
 ACCENT_BLUE = colors.Color(0.2, 0.5, 0.8)
+NAVY = colors.Color(0.08, 0.24, 0.38)
+PALE_BLUE = colors.Color(0.92, 0.95, 0.98)
+SAGA_GREEN = colors.Color(0.1, 0.4, 0.2)
+POSITIVE_GREEN = colors.Color(0.1, 0.5, 0.1)
+LIGHT_GREEN = colors.Color(0.95, 1.0, 0.95)
+PANEL_GRAY = colors.Color(0.97, 0.97, 0.97)  # Light panel background
+BORDER_GRAY = colors.Color(0.9, 0.9, 0.9)
+GRID_GRAY = colors.Color(0.85, 0.85, 0.85)
+
+# Dark blue header row with white bold text, shared by the deck's data tables
+HEADER_ROW_STYLE = [
+    ('BACKGROUND', (0, 0), (-1, 0), DARK_BLUE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+]
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -50,10 +99,15 @@ ICON_PATH = ASSETS_DIR / "saga-icon.png"
 # The pitch-files/ directory is served via /pitch route with password protection
 SAGA_ROOT = SCRIPT_DIR.parent.parent  # Goes from pitch_deck -> victor_deployment -> Saga
 DEFAULT_OUTPUT_DIR = SAGA_ROOT / "saga-fe" / "pitch-files"
+DEFAULT_OUTPUT_PATH = DEFAULT_OUTPUT_DIR / "saga_pitch_deck.pdf"
 
 
+@lru_cache(maxsize=1)
 def get_styles():
-    """Create professional paragraph styles optimized for 16:9."""
+    """Create professional paragraph styles optimized for 16:9.
+
+    Built once and shared by every generator; the styles are never mutated after creation.
+    """
     styles = getSampleStyleSheet()
 
     # Big title for title slide
@@ -160,65 +214,150 @@ def get_styles():
         spaceAfter=8,
     ))
 
+    # Table cell and column text - one style per table, shared by all its cells
+    styles.add(ParagraphStyle(
+        'ExampleCell',
+        fontSize=14,
+        leading=20,
+        alignment=TA_CENTER,
+    ))
+    styles.add(ParagraphStyle(
+        'SolutionColumn',
+        fontSize=15,
+        leading=22,
+        textColor=BLACK,
+    ))
+    styles.add(ParagraphStyle(
+        'PillarCell',
+        fontSize=16,
+        leading=22,
+        alignment=TA_CENTER,
+    ))
+    styles.add(ParagraphStyle(
+        'TractionColumn',
+        fontSize=14,
+        leading=22,
+        leftIndent=15,
+    ))
+    styles.add(ParagraphStyle(
+        'ExpertiseCell',
+        fontSize=15,
+        leading=22,
+        alignment=TA_CENTER,
+    ))
+    styles.add(ParagraphStyle(
+        'MetricCell',
+        fontSize=14,
+        leading=20,
+        alignment=TA_CENTER,
+    ))
+
     return styles
 
 
+@lru_cache(maxsize=1)
+def ensure_default_output_dir():
+    """Create the protected output directory once per process."""
+    DEFAULT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+
+@lru_cache(maxsize=None)
+def asset_exists(path: Path) -> bool:
+    """Stat an image asset once per process; the assets do not change during a run."""
+    return path.exists()
+
+
+@lru_cache(maxsize=None)
+def asset_reader(path: Path) -> ImageReader:
+    """Open an image asset once per process; later lookups reuse the same reader."""
+    return ImageReader(str(path))
+
+
+class AssetImage(Flowable):
+    """Centered image drawn from a shared asset reader.
+
+    drawImage names the XObject by a digest of the decoded pixels, so every placement shares
+    one embedded stream; drawing from the shared reader means the PNG is decoded once rather
+    than once per placement.
+    """
+
+    def __init__(self, path: Path, width: float, height: float):
+        super().__init__()
+        self.reader = asset_reader(path)
+        self.width = width
+        self.height = height
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.width, self.height, mask='auto')
+
+
+@lru_cache(maxsize=512)
+def _parsed_paragraph(text: str, style_name: str) -> Paragraph:
+    return Paragraph(text, get_styles()[style_name])
+
+
+def cached_paragraph(text: str, style_name: str) -> Paragraph:
+    """Paragraph in a stylesheet style, reusing the parsed markup of identical earlier calls.
+
+    Paragraphs keep layout state while being wrapped, so each caller gets its own shallow copy.
+    """
+    return copy.copy(_parsed_paragraph(text, style_name))
+
+
 class PitchDeckGenerator:
     """Generates world-class VC pitch deck - 12 slides, professional formatting."""
 
-    def __init__(self, output_path: str = None):
+    def __init__(self, output_path: str = None, compress: bool = True):
         if output_path is None:
             # Default to password-protected pitch-files directory
-            DEFAULT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-            output_path = DEFAULT_OUTPUT_DIR / "saga_pitch_deck.pdf"
+            ensure_default_output_dir()
+            output_path = DEFAULT_OUTPUT_PATH
             print(f"  Output: {output_path} (password-protected)")
             print(f"  WARNING: Do NOT output to static/ or any public directory!")
 
         self.output_path = Path(output_path)
+        self.compress = compress
         self.styles = get_styles()
         self.elements = []
 
-    def add_page_break(self):
-        self.elements.append(PageBreak())
-
     def add_spacer(self, height: float = 0.3):
         self.elements.append(Spacer(1, height * inch))
 
     def add_title(self, text: str):
-        self.elements.append(Paragraph(text, self.styles['SlideTitle']))
+        self.elements.append(cached_paragraph(text, 'SlideTitle'))
 
     def add_key_message(self, text: str):
-        self.elements.append(Paragraph(text, self.styles['KeyMessage']))
+        self.elements.append(cached_paragraph(text, 'KeyMessage'))
 
     def add_subheading(self, text: str):
-        self.elements.append(Paragraph(text, self.styles['Subheading']))
+        self.elements.append(cached_paragraph(text, 'Subheading'))
 
     def add_body(self, text: str, centered: bool = False):
         style = 'BodyCenter' if centered else 'BodyLeft'
-        self.elements.append(Paragraph(text, self.styles[style]))
+        self.elements.append(cached_paragraph(text, style))
 
     def add_bullet(self, text: str):
         # Use proper bullet character
-        self.elements.append(Paragraph(f"<bullet>&bull;</bullet> {text}", self.styles['SlideBullet']))
+        self.elements.append(cached_paragraph(f"<bullet>&bull;</bullet> {text}", 'SlideBullet'))
 
     def add_quote(self, text: str):
-        self.elements.append(Paragraph(text, self.styles['Quote']))
+        self.elements.append(cached_paragraph(text, 'Quote'))
 
     def add_logo(self, width: float = 5.0):
         """Add horizontal logo centered."""
-        if LOGO_HORIZONTAL_PATH.exists():
-            from PIL import Image as PILImage
-            with PILImage.open(LOGO_HORIZONTAL_PATH) as img:
-                aspect = img.width / img.height
-            height = width / aspect
-            logo = Image(str(LOGO_HORIZONTAL_PATH), width=width*inch, height=height*inch)
-            self.elements.append(logo)
+        if asset_exists(LOGO_HORIZONTAL_PATH):
+            image_width, image_height = asset_reader(LOGO_HORIZONTAL_PATH).getSize()
+            height = width * image_height / image_width
+            self.elements.append(AssetImage(LOGO_HORIZONTAL_PATH, width*inch, height*inch))
 
     def add_icon(self, size: float = 1.0):
         """Add globe icon centered."""
-        if ICON_PATH.exists():
-            icon = Image(str(ICON_PATH), width=size*inch, height=size*inch)
-            self.elements.append(icon)
+        if asset_exists(ICON_PATH):
+            self.elements.append(AssetImage(ICON_PATH, size*inch, size*inch))
 
     # =========================================================================
     # 12 SLIDES - WORLD-CLASS VC QUALITY
@@ -235,7 +374,6 @@ class PitchDeckGenerator:
 
     def slide_02_problem(self):
         """Slide 2: The Problem - Emotional hook, clear pain point."""
-        self.add_page_break()
         self.add_spacer(0.5)
         self.add_title("The Risks You Can't See")
         self.add_spacer(0.3)
@@ -252,8 +390,8 @@ class PitchDeckGenerator:
         ]
 
         # Use a table for visual impact
-        data = [[Paragraph(f"<b>{e[0]}</b><br/><font color='gray'>{e[1]}</font>",
-                          ParagraphStyle('ex', fontSize=14, leading=20, alignment=TA_CENTER))
+        data = [[cached_paragraph(f"<b>{e[0]}</b><br/><font color='gray'>{e[1]}</font>",
+                                 'ExampleCell')
                 for e in examples]]
 
         table = Table(data, colWidths=[3.5*inch, 3.5*inch, 3.5*inch])
@@ -271,7 +409,6 @@ class PitchDeckGenerator:
 
     def slide_03_solution(self):
         """Slide 3: The Solution - What Saga does."""
-        self.add_page_break()
         self.add_spacer(0.4)
         self.add_title("Saga: The Living Intelligence Layer")
         self.add_spacer(0.2)
@@ -291,8 +428,7 @@ Events traced to YOUR positions<br/><br/>
 <b>Living Analysis</b><br/>
 Your thesis tested daily against new info"""
 
-        style = ParagraphStyle('solcol', fontSize=15, leading=22, textColor=BLACK)
-        data = [[Paragraph(col1_text, style), Paragraph(col2_text, style)]]
+        data = [[cached_paragraph(col1_text, 'SolutionColumn'), cached_paragraph(col2_text, 'SolutionColumn')]]
         table = Table(data, colWidths=[5.0*inch, 5.5*inch])
         table.setStyle(TableStyle([
             ('VALIGN', (0, 0), (-1, -1), 'TOP'),
@@ -306,7 +442,6 @@ Your thesis tested daily against new info"""
 
     def slide_04_differentiation(self):
         """Slide 4: Why We're Different - Category definition."""
-        self.add_page_break()
         self.add_spacer(0.4)
         self.add_title("The Category We're Defining")
         self.add_spacer(0.3)
@@ -329,24 +464,20 @@ Your thesis tested daily against new info"""
         ]
 
         table = Table(data, colWidths=[3.2*inch, 3.2*inch, 3.6*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), DARK_BLUE),
-            ('BACKGROUND', (2, 0), (2, 0), colors.Color(0.1, 0.4, 0.2)),  # Green for Saga
-            ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        table.setStyle(TableStyle(HEADER_ROW_STYLE + [
+            ('BACKGROUND', (2, 0), (2, 0), SAGA_GREEN),  # Green for Saga
             ('FONTSIZE', (0, 0), (-1, -1), 13),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0.85, 0.85, 0.85)),
+            ('GRID', (0, 0), (-1, -1), 1, GRID_GRAY),
             ('TOPPADDING', (0, 0), (-1, -1), 10),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('BACKGROUND', (2, 1), (2, -1), colors.Color(0.95, 1.0, 0.95)),  # Light green highlight
+            ('BACKGROUND', (2, 1), (2, -1), LIGHT_GREEN),  # Light green highlight
         ]))
         self.elements.append(table)
 
     def slide_05_how_it_works(self):
         """Slide 5: How It Works - Technical credibility without complexity."""
-        self.add_page_break()
         self.add_spacer(0.4)
         self.add_title("Infrastructure, Not a Wrapper")
         self.add_spacer(0.2)
@@ -366,8 +497,8 @@ Your thesis tested daily against new info"""
             ["Time to Work", "Iterative analysis, not\none-shot responses"],
         ]
 
-        data = [[Paragraph(f"<b>{p[0]}</b><br/><br/><font size='12' color='gray'>{p[1]}</font>",
-                          ParagraphStyle('pill', fontSize=16, leading=22, alignment=TA_CENTER))
+        data = [[cached_paragraph(f"<b>{p[0]}</b><br/><br/><font size='12' color='gray'>{p[1]}</font>",
+                                 'PillarCell')
                 for p in pillars]]
 
         table = Table(data, colWidths=[3.3*inch, 3.4*inch, 3.3*inch])
@@ -389,7 +520,6 @@ Your thesis tested daily against new info"""
 
     def slide_06_traction(self):
         """Slide 6: Traction - Proof points."""
-        self.add_page_break()
         self.add_spacer(0.3)
         self.add_title("Traction & Proof Points")
         self.add_spacer(0.2)
@@ -421,8 +551,7 @@ Your thesis tested daily against new info"""
 &#8226; Building while others are pitching<br/>
 &#8226; Infrastructure moat deepens daily"""
 
-        style = ParagraphStyle('col', fontSize=14, leading=22, leftIndent=15)
-        data = [[Paragraph(left_col, style), Paragraph(right_col, style)]]
+        data = [[cached_paragraph(left_col, 'TractionColumn'), cached_paragraph(right_col, 'TractionColumn')]]
         table = Table(data, colWidths=[5.0*inch, 5.5*inch])
         table.setStyle(TableStyle([
             ('VALIGN', (0, 0), (-1, -1), 'TOP'),
@@ -432,7 +561,6 @@ Your thesis tested daily against new info"""
 
     def slide_07_team(self):
         """Slide 7: Team - Credibility."""
-        self.add_page_break()
         self.add_spacer(0.5)
         self.add_title("The Team")
         self.add_spacer(0.4)
@@ -448,16 +576,16 @@ Your thesis tested daily against new info"""
             ["Academic Foundation", "Research on LLMs + graphs\nfor market causality mapping"],
         ]
 
-        data = [[Paragraph(f"<b>{e[0]}</b><br/><br/><font size='13'>{e[1]}</font>",
-                          ParagraphStyle('exp', fontSize=15, leading=22, alignment=TA_CENTER))
+        data = [[cached_paragraph(f"<b>{e[0]}</b><br/><br/><font size='13'>{e[1]}</font>",
+                                 'ExpertiseCell')
                 for e in expertise]]
 
         table = Table(data, colWidths=[3.3*inch, 3.4*inch, 3.3*inch])
         table.setStyle(TableStyle([
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('BACKGROUND', (0, 0), (-1, -1), colors.Color(0.97, 0.97, 0.97)),
-            ('BOX', (0, 0), (-1, -1), 0.5, colors.Color(0.9, 0.9, 0.9)),
+            ('BACKGROUND', (0, 0), (-1, -1), PANEL_GRAY),
+            ('BOX', (0, 0), (-1, -1), 0.5, BORDER_GRAY),
             ('TOPPADDING', (0, 0), (-1, -1), 20),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
             ('LEFTPADDING', (0, 0), (-1, -1), 15),
@@ -470,7 +598,6 @@ Your thesis tested daily against new info"""
 
     def slide_08_business_model(self):
         """Slide 8: Business Model - Clear unit economics."""
-        self.add_page_break()
         self.add_spacer(0.2)
         self.add_title("Business Model")
         self.add_spacer(0.15)
@@ -491,15 +618,12 @@ Your thesis tested daily against new info"""
         ]
 
         table = Table(data, colWidths=[2.0*inch, 1.5*inch, 4.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), DARK_BLUE),
-            ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        table.setStyle(TableStyle(HEADER_ROW_STYLE + [
             ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, -1), 11),
             ('ALIGN', (1, 0), (1, -1), 'CENTER'),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.Color(0.85, 0.85, 0.85)),
+            ('GRID', (0, 0), (-1, -1), 0.5, GRID_GRAY),
             ('TOPPADDING', (0, 0), (-1, -1), 6),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
         ]))
@@ -510,7 +634,6 @@ Your thesis tested daily against new info"""
 
     def slide_09_the_ask(self):
         """Slide 9: The Ask - Clear, specific, justified."""
-        self.add_page_break()
         self.add_spacer(0.2)
         self.add_title("The Ask")
         self.add_spacer(0.1)
@@ -529,7 +652,7 @@ Your thesis tested daily against new info"""
 
         table = Table(data, colWidths=[2.5*inch, 3.0*inch])
         table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.Color(0.97, 0.97, 0.97)),
+            ('BACKGROUND', (0, 0), (-1, -1), PANEL_GRAY),
             ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, -1), 14),
             ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
@@ -571,7 +694,6 @@ Your thesis tested daily against new info"""
 
     def slide_10_financials(self):
         """Slide 10: Financial Projections - Clean, credible."""
-        self.add_page_break()
         self.add_spacer(0.2)
         self.add_title("24-Month Projection")
         self.add_spacer(0.2)
@@ -588,21 +710,18 @@ Your thesis tested daily against new info"""
         ]
 
         table = Table(data, colWidths=[1.4*inch] + [0.9*inch]*8)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), DARK_BLUE),
-            ('BACKGROUND', (5, 0), (-1, 0), colors.Color(0.08, 0.24, 0.38)),  # Year 2 darker
-            ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        table.setStyle(TableStyle(HEADER_ROW_STYLE + [
+            ('BACKGROUND', (5, 0), (-1, 0), NAVY),  # Year 2 darker
             ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, -1), 11),
             ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.Color(0.85, 0.85, 0.85)),
-            ('BACKGROUND', (0, 1), (0, -1), colors.Color(0.92, 0.95, 0.98)),
+            ('GRID', (0, 0), (-1, -1), 0.5, GRID_GRAY),
+            ('BACKGROUND', (0, 1), (0, -1), PALE_BLUE),
             ('TOPPADDING', (0, 0), (-1, -1), 6),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
             # Highlight positive net
-            ('TEXTCOLOR', (-1, 5), (-1, 5), colors.Color(0.1, 0.5, 0.1)),
+            ('TEXTCOLOR', (-1, 5), (-1, 5), POSITIVE_GREEN),
         ]))
         self.elements.append(table)
 
@@ -616,16 +735,16 @@ Your thesis tested daily against new info"""
             ["Buffer", "12.5M SEK minimum"],
         ]
 
-        data = [[Paragraph(f"<b>{m[0]}</b><br/><font size='11' color='gray'>{m[1]}</font>",
-                          ParagraphStyle('met', fontSize=14, leading=20, alignment=TA_CENTER))
+        data = [[cached_paragraph(f"<b>{m[0]}</b><br/><font size='11' color='gray'>{m[1]}</font>",
+                                 'MetricCell')
                 for m in metrics]]
 
         table = Table(data, colWidths=[2.5*inch]*4)
         table.setStyle(TableStyle([
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BOX', (0, 0), (-1, -1), 1, colors.Color(0.9, 0.9, 0.9)),
-            ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.Color(0.9, 0.9, 0.9)),
+            ('BOX', (0, 0), (-1, -1), 1, BORDER_GRAY),
+            ('INNERGRID', (0, 0), (-1, -1), 0.5, BORDER_GRAY),
             ('TOPPADDING', (0, 0), (-1, -1), 12),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
         ]))
@@ -636,7 +755,6 @@ Your thesis tested daily against new info"""
 
     def slide_11_vision(self):
         """Slide 11: The Vision - Endgame."""
-        self.add_page_break()
         self.add_spacer(0.2)
         self.add_title("The Endgame")
         self.add_spacer(0.15)
@@ -658,7 +776,6 @@ Your thesis tested daily against new info"""
 
     def slide_12_contact(self):
         """Slide 12: Contact - Clean close."""
-        self.add_page_break()
         self.add_spacer(1.2)
         self.add_logo(width=5.5)
         self.add_spacer(0.5)
@@ -666,52 +783,67 @@ Your thesis tested daily against new info"""
         self.add_spacer(0.4)
         self.add_quote("Let's talk.")
         self.add_spacer(0.3)
-        self.elements.append(Paragraph("info@saga-labs.com", self.styles['Contact']))
+        self.elements.append(cached_paragraph("info@saga-labs.com", 'Contact'))
 
     def generate(self):
         """Generate the full pitch deck PDF."""
         print(f"Generating pitch deck: {self.output_path}")
-        print(f"  Logo: {LOGO_HORIZONTAL_PATH} ({'found' if LOGO_HORIZONTAL_PATH.exists() else 'NOT FOUND'})")
-        print(f"  Icon: {ICON_PATH} ({'found' if ICON_PATH.exists() else 'NOT FOUND'})")
-
-        # Build all 12 slides
-        self.slide_01_title()
-        self.slide_02_problem()
-        self.slide_03_solution()
-        self.slide_04_differentiation()
-        self.slide_05_how_it_works()
-        self.slide_06_traction()
-        self.slide_07_team()
-        self.slide_08_business_model()
-        self.slide_09_the_ask()
-        self.slide_10_financials()
-        self.slide_11_vision()
-        self.slide_12_contact()
-
-        # Create PDF
-        doc = SimpleDocTemplate(
-            str(self.output_path),
-            pagesize=(PAGE_WIDTH, PAGE_HEIGHT),
-            leftMargin=0.75*inch,
-            rightMargin=0.75*inch,
-            topMargin=0.5*inch,
-            bottomMargin=0.5*inch,
-        )
-
-        doc.build(self.elements)
+        print(f"  Logo: {LOGO_HORIZONTAL_PATH} ({'found' if asset_exists(LOGO_HORIZONTAL_PATH) else 'NOT FOUND'})")
+        print(f"  Icon: {ICON_PATH} ({'found' if asset_exists(ICON_PATH) else 'NOT FOUND'})")
+        if not RL_ACCEL:
+            print("  Note: rl_accel not installed, using reportlab's pure-Python text routines")
+
+        # Each slide is exactly one page: lay its flowables into a fresh frame and
+        # emit the page straight away, rather than collecting every slide into one
+        # story and paginating it through a document template
+        c = canvas.Canvas(str(self.output_path), pagesize=PAGE_SIZE, pageCompression=int(self.compress))
+        slides = [
+            self.slide_01_title,
+            self.slide_02_problem,
+            self.slide_03_solution,
+            self.slide_04_differentiation,
+            self.slide_05_how_it_works,
+            self.slide_06_traction,
+            self.slide_07_team,
+            self.slide_08_business_model,
+            self.slide_09_the_ask,
+            self.slide_10_financials,
+            self.slide_11_vision,
+            self.slide_12_contact,
+        ]
+        for slide in slides:
+            self.elements = []
+            slide()
+            frame = Frame(*CONTENT_FRAME, id='normal')
+            frame.addFromList(self.elements, c)
+            if self.elements:
+                print(f"  WARNING: {slide.__name__} does not fit on one page; "
+                      f"{len(self.elements)} element(s) dropped")
+            c.showPage()
+        c.save()
+
         print(f"Done! 12-slide pitch deck: {self.output_path}")
         return self.output_path
 
 
-def main():
-    import argparse
-    parser = argparse.ArgumentParser(description="Generate Saga pitch deck PDF")
-    parser.add_argument("--output", "-o", help="Output PDF path")
-    args = parser.parse_args()
+def generate_deck(output_path: str = None, compress: bool = True) -> Path:
+    """Build one deck; module-level so worker processes can run it."""
+    return PitchDeckGenerator(output_path=output_path, compress=compress).generate()
+
+
+def main(args=None):
+    if args is None:
+        args = parse_args()
 
-    generator = PitchDeckGenerator(output_path=args.output)
-    generator.generate()
+    build = partial(generate_deck, compress=not args.no_compress)
+    outputs = args.output or [None]
+    if len(outputs) == 1:
+        build(outputs[0])
+    else:
+        # Each deck is an independent, CPU-bound build: one process per deck
+        with ProcessPoolExecutor(max_workers=min(len(outputs), os.cpu_count() or 1)) as pool:
+            list(pool.map(build, outputs))
 
 
 if __name__ == "__main__":
-    main()
+    main(CLI_ARGS)